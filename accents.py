@@ -0,0 +1,387 @@
+"""
+accents.py — Aksanlı harf sentezi (glyf composite)
+===================================================
+Türkçe (Ç Ğ İ Ö Ş Ü ç ğ ı ö ş ü) ve Latin-1 / Latin Extended-A harfleri
+taban harf + küçük bir işaret (mark) glyph setinden composite olarak üretir.
+
+  • Her işaret bir kez çizilir (…comb glyph'leri), harfler sadece referans
+    verir → dosya boyutu ve build süresi neredeyse değişmez
+  • Konumlama anchor tabanlı: taban harfin dekorasyonsuz gövdesinden
+    top / bottom / ogonek anchor'ları hesaplanır, işaretler kendi (0,0)
+    anchor'larıyla bunlara oturur; italikte eğime uyar. Gövde =
+    DecoComponents composite'inde '<gn>.base' bileşeni; dekorasyonu
+    outline'a gömülü çizen motorlar (floral, v3 VF master'ları) gövde
+    sınırlarını bodies= ile verir (bkz. outline_bounds)
+  • Fontta zaten çizilmiş olan karakterlere dokunulmaz
+  • ı / ȷ yoksa 'i' / 'j'den nokta konturu atılarak türetilir; o nokta
+    aynı zamanda dotaccent/dieresis için kullanılır (stil tutarlı kalır)
+
+Kullanım (fb.font.save'den hemen önce):
+  from accents import synthesize_accents, outline_bounds, BASES
+  synthesize_accents(fb.font, stroke=sw)
+  synthesize_accents(fb.font, stroke=sw, bodies={c: outline_bounds(bare_path) ...})
+"""
+
+import math
+
+# ── İŞARETLER ────────────────────────────────────────────────────
+# mark adı → (unicode, konum)   konum: 'top' | 'bottom' | 'ogonek'
+MARKS = {
+    'gravecomb':      (0x0300, 'top'),
+    'acutecomb':      (0x0301, 'top'),
+    'circumflexcomb': (0x0302, 'top'),
+    'tildecomb':      (0x0303, 'top'),
+    'macroncomb':     (0x0304, 'top'),
+    'brevecomb':      (0x0306, 'top'),
+    'dotaccentcomb':  (0x0307, 'top'),
+    'dieresiscomb':   (0x0308, 'top'),
+    'ringcomb':       (0x030A, 'top'),
+    'hungarumlautcomb': (0x030B, 'top'),
+    'caroncomb':      (0x030C, 'top'),
+    'cedillacomb':    (0x0327, 'bottom'),
+    'ogonekcomb':     (0x0328, 'ogonek'),
+}
+
+# ── KOMPOZİSYONLAR ───────────────────────────────────────────────
+# karakter → (taban karakter, mark)
+_ACC = {
+    'grave': 'gravecomb', 'acute': 'acutecomb', 'circ': 'circumflexcomb',
+    'tilde': 'tildecomb', 'macron': 'macroncomb', 'breve': 'brevecomb',
+    'dot': 'dotaccentcomb', 'diaer': 'dieresiscomb', 'ring': 'ringcomb',
+    'dacute': 'hungarumlautcomb', 'caron': 'caroncomb',
+    'cedil': 'cedillacomb', 'ogonek': 'ogonekcomb',
+}
+
+def _table():
+    rows = [
+        # Türkçe
+        ('Ç','C','cedil'), ('ç','c','cedil'), ('Ğ','G','breve'), ('ğ','g','breve'),
+        ('İ','I','dot'),   ('Ö','O','diaer'), ('ö','o','diaer'), ('Ş','S','cedil'),
+        ('ş','s','cedil'), ('Ü','U','diaer'), ('ü','u','diaer'),
+        # Latin-1
+        ('À','A','grave'), ('Á','A','acute'), ('Â','A','circ'), ('Ã','A','tilde'),
+        ('Ä','A','diaer'), ('Å','A','ring'),  ('È','E','grave'), ('É','E','acute'),
+        ('Ê','E','circ'),  ('Ë','E','diaer'), ('Ì','I','grave'), ('Í','I','acute'),
+        ('Î','I','circ'),  ('Ï','I','diaer'), ('Ñ','N','tilde'), ('Ò','O','grave'),
+        ('Ó','O','acute'), ('Ô','O','circ'),  ('Õ','O','tilde'), ('Ù','U','grave'),
+        ('Ú','U','acute'), ('Û','U','circ'),  ('Ý','Y','acute'),
+        ('à','a','grave'), ('á','a','acute'), ('â','a','circ'),  ('ã','a','tilde'),
+        ('ä','a','diaer'), ('å','a','ring'),  ('è','e','grave'), ('é','e','acute'),
+        ('ê','e','circ'),  ('ë','e','diaer'), ('ì','ı','grave'), ('í','ı','acute'),
+        ('î','ı','circ'),  ('ï','ı','diaer'), ('ñ','n','tilde'), ('ò','o','grave'),
+        ('ó','o','acute'), ('ô','o','circ'),  ('õ','o','tilde'), ('ù','u','grave'),
+        ('ú','u','acute'), ('û','u','circ'),  ('ý','y','acute'), ('ÿ','y','diaer'),
+        # Latin Extended-A
+        ('Ā','A','macron'), ('ā','a','macron'), ('Ă','A','breve'), ('ă','a','breve'),
+        ('Ą','A','ogonek'), ('ą','a','ogonek'), ('Ć','C','acute'), ('ć','c','acute'),
+        ('Ĉ','C','circ'),   ('ĉ','c','circ'),   ('Ċ','C','dot'),   ('ċ','c','dot'),
+        ('Č','C','caron'),  ('č','c','caron'),  ('Ď','D','caron'), ('Ē','E','macron'),
+        ('ē','e','macron'), ('Ĕ','E','breve'),  ('ĕ','e','breve'), ('Ė','E','dot'),
+        ('ė','e','dot'),    ('Ę','E','ogonek'), ('ę','e','ogonek'), ('Ě','E','caron'),
+        ('ě','e','caron'),  ('Ĝ','G','circ'),   ('ĝ','g','circ'),  ('Ġ','G','dot'),
+        ('ġ','g','dot'),    ('Ĥ','H','circ'),   ('Ĩ','I','tilde'), ('ĩ','ı','tilde'),
+        ('Ī','I','macron'), ('ī','ı','macron'), ('Ĭ','I','breve'), ('ĭ','ı','breve'),
+        ('Į','I','ogonek'), ('Ĵ','J','circ'),   ('ĵ','ȷ','circ'),  ('Ń','N','acute'),
+        ('ń','n','acute'),  ('Ň','N','caron'),  ('ň','n','caron'), ('Ō','O','macron'),
+        ('ō','o','macron'), ('Ŏ','O','breve'),  ('ŏ','o','breve'), ('Ő','O','dacute'),
+        ('ő','o','dacute'), ('Ŕ','R','acute'),  ('ŕ','r','acute'), ('Ř','R','caron'),
+        ('ř','r','caron'),  ('Ś','S','acute'),  ('ś','s','acute'), ('Ŝ','S','circ'),
+        ('ŝ','s','circ'),   ('Š','S','caron'),  ('š','s','caron'), ('Ţ','T','cedil'),
+        ('ţ','t','cedil'),  ('Ť','T','caron'),  ('Ũ','U','tilde'), ('ũ','u','tilde'),
+        ('Ū','U','macron'), ('ū','u','macron'), ('Ŭ','U','breve'), ('ŭ','u','breve'),
+        ('Ů','U','ring'),   ('ů','u','ring'),   ('Ű','U','dacute'), ('ű','u','dacute'),
+        ('Ų','U','ogonek'), ('ų','u','ogonek'), ('Ŵ','W','circ'),  ('ŵ','w','circ'),
+        ('Ŷ','Y','circ'),   ('ŷ','y','circ'),   ('Ÿ','Y','diaer'), ('Ź','Z','acute'),
+        ('ź','z','acute'),  ('Ż','Z','dot'),    ('ż','z','dot'),   ('Ž','Z','caron'),
+        ('ž','z','caron'),
+    ]
+    return {ch: (base, _ACC[a]) for ch, base, a in rows}
+
+COMPOSITES = _table()
+BASES = sorted({base for base, _ in COMPOSITES.values()})
+
+
+# ── ÇİZİM YARDIMCILARI ───────────────────────────────────────────
+
+def _area(pts):
+    return sum(x0*y1 - x1*y0 for (x0, y0), (x1, y1) in zip(pts, pts[1:] + pts[:1])) / 2
+
+def _contour(pen, pts, outer=True):
+    """TrueType yönü: dış kontur saat yönü, iç kontur ters."""
+    pts = [(int(round(x)), int(round(y))) for x, y in pts]
+    if (_area(pts) < 0) != outer:
+        pts = pts[::-1]
+    pen.moveTo(pts[0])
+    for p in pts[1:]:
+        pen.lineTo(p)
+    pen.closePath()
+
+def _band(pts, t):
+    """Polyline'ı t kalınlığında kapalı şerit konturuna çevir."""
+    h = t / 2; left, right = [], []
+    for i, (px, py) in enumerate(pts):
+        a = pts[max(0, i-1)]; b = pts[min(len(pts)-1, i+1)]
+        dx, dy = b[0]-a[0], b[1]-a[1]
+        ln = math.hypot(dx, dy) or 1
+        nx, ny = -dy/ln*h, dx/ln*h
+        left.append((px+nx, py+ny)); right.append((px-nx, py-ny))
+    return left + right[::-1]
+
+def _circle(cx, cy, r, n=24):
+    return [(cx + r*math.cos(2*math.pi*i/n), cy + r*math.sin(2*math.pi*i/n)) for i in range(n)]
+
+def _arc(cx, cy, rx, ry, a1, a2, n=12):
+    return [(cx + rx*math.cos(math.radians(a1 + (a2-a1)*i/n)),
+             cy + ry*math.sin(math.radians(a1 + (a2-a1)*i/n))) for i in range(n+1)]
+
+
+def draw_mark(pen, name, sw, dot=None):
+    """
+    İşareti x=0 ortalı çiz. Üst işaretler y=0'dan yukarı, alt işaretler
+    y=0'dan aşağı uzanır. dot: 'i' noktasından alınmış kontur (varsa).
+    """
+    t = max(24, sw * 0.75)           # işaret çizgi kalınlığı
+    w = max(120, sw * 3.2)           # işaret genişliği
+    h = max(90, sw * 2.0)            # işaret yüksekliği
+    r = max(16, sw * 0.62)           # nokta yarıçapı
+
+    def put_dot(cx):
+        if dot:
+            from fontTools.pens.pointPen import PointToSegmentPen
+            pp = PointToSegmentPen(pen)
+            for pts, flags in dot:
+                pp.beginPath()
+                for (x, y), f in zip(pts, flags):
+                    pp.addPoint((x + cx, y), 'qcurve' if f & 1 else None)
+                pp.endPath()
+        else:
+            _contour(pen, _circle(cx, r, r))
+
+    if name == 'dotaccentcomb':
+        put_dot(0)
+    elif name == 'dieresiscomb':
+        gap = (max(x for pts, _ in dot for x, _ in pts) if dot else r) + t * 0.6
+        put_dot(-gap); put_dot(gap)
+    elif name == 'acutecomb':
+        _contour(pen, _band([(-w*0.18, t*0.4), (w*0.22, h)], t))
+    elif name == 'gravecomb':
+        _contour(pen, _band([(w*0.18, t*0.4), (-w*0.22, h)], t))
+    elif name == 'hungarumlautcomb':
+        for dx in (-w*0.22, w*0.22):
+            _contour(pen, _band([(dx - w*0.12, t*0.4), (dx + w*0.16, h)], t))
+    elif name == 'circumflexcomb':
+        _contour(pen, _band([(-w/2, t/2), (0, h - t/2), (w/2, t/2)], t))
+    elif name == 'caroncomb':
+        _contour(pen, _band([(-w/2, h - t/2), (0, t/2), (w/2, h - t/2)], t))
+    elif name == 'macroncomb':
+        _contour(pen, _band([(-w/2, t), (w/2, t)], t))
+    elif name == 'brevecomb':
+        _contour(pen, _band(_arc(0, h*0.85, w/2 - t/2, h*0.85 - t/2, 180, 360), t))
+    elif name == 'tildecomb':
+        pts = [(-w/2 + w*i/16, h*0.45 + h*0.25*math.sin(math.pi*2*i/16)) for i in range(17)]
+        _contour(pen, _band(pts, t))
+    elif name == 'ringcomb':
+        ro = w * 0.32; cy = ro
+        _contour(pen, _circle(0, cy, ro), outer=True)
+        _contour(pen, _circle(0, cy, max(8, ro - t)), outer=False)
+    elif name == 'cedillacomb':
+        pts = [(0, 0), (0, -h*0.35)] + _arc(-w*0.05, -h*0.62, w*0.28, h*0.27, 90, -160)[1:]
+        _contour(pen, _band(pts, t * 0.85))
+    elif name == 'ogonekcomb':
+        pts = [(0, t*0.3)] + _arc(w*0.22, -h*0.25, w*0.26, h*0.45, 180, 300)[1:]
+        _contour(pen, _band(pts, t * 0.85))
+
+
+# ── FONT İŞLEMLERİ ───────────────────────────────────────────────
+
+def _bounds(glyf, gn):
+    g = glyf[gn]
+    g.recalcBounds(glyf)
+    if not hasattr(g, 'xMin') or g.numberOfContours == 0:
+        return None
+    return g.xMin, g.yMin, g.xMax, g.yMax
+
+def _body_bounds(glyf, gn):
+    """Dekorasyonsuz gövde sınırları: DecoComponents composite'inde ilk '<gn>.base' bileşeni, yoksa glyph."""
+    g = glyf[gn]
+    if g.isComposite() and g.components[0].glyphName.endswith('.base'):
+        c = g.components[0]
+        b = _bounds(glyf, c.glyphName)
+        if b:
+            return b[0] + c.x, b[1] + c.y, b[2] + c.x, b[3] + c.y
+    return _bounds(glyf, gn)
+
+def outline_bounds(path):
+    """Motor outline'ı (PenPath | SVG d) → (xMin, yMin, xMax, yMax) | None."""
+    from fontTools.pens.boundsPen import BoundsPen
+    from pen_path import draw_path
+    bp = BoundsPen(None)
+    draw_path(path, bp)
+    return bp.bounds
+
+def anchors(body, sw, slant=0.0):
+    """
+    Gövde sınırları → {'top', 'bottom', 'ogonek'} anchor noktaları.
+    top: gövdenin üstünde ortada, bottom: tabanda ortada (cedilla biraz gömülür),
+    ogonek: sağ alt köşe. İtalikte x, eğim boyunca gövde ortasına göre kayar.
+    """
+    x0, y0, x1, y1 = body
+    gap = max(30, int(sw * 0.6))
+    cy = (y0 + y1) / 2
+    at = lambda x, y: (x + (y - cy) * slant, y)
+    return {'top':    at((x0 + x1) / 2, y1 + gap),
+            'bottom': at((x0 + x1) / 2, y0 + gap * 0.5),
+            'ogonek': at(x1 - sw * 0.6, y0 + gap * 0.5)}
+
+def _contours(glyf, gn):
+    g = glyf[gn]
+    if g.isComposite() or g.numberOfContours <= 0:
+        return []
+    coords, ends, flags = g.getCoordinates(glyf)
+    out, s = [], 0
+    for e in ends:
+        out.append((list(coords[s:e+1]), list(flags[s:e+1])))
+        s = e + 1
+    return out
+
+def split_dot(glyf, gn):
+    """
+    'i' / 'j' glyph'ini gövde + nokta olarak ayır.
+    Gövde = en alttan başlayan kontur; gövdenin tamamen üstündekiler atılır,
+    bunlardan en alttaki nokta sayılır. Dönen: (gövde_konturları, nokta) | None
+    """
+    g = glyf[gn]
+    if g.isComposite():                 # dekorasyonlu harf: ilk bileşen gövde
+        gn = g.components[0].glyphName
+    cs = _contours(glyf, gn)
+    if len(cs) < 2:
+        return None
+    bb = lambda c: (min(y for _, y in c[0]), max(y for _, y in c[0]))
+    stem = min(cs, key=lambda c: bb(c)[0])
+    top = bb(stem)[1]
+    above = [c for c in cs if bb(c)[0] > top]
+    body = [c for c in cs if bb(c)[0] <= top]
+    if not above or not body:
+        return None
+    dot = min(above, key=lambda c: bb(c)[0])
+    return body, dot
+
+def _simple(contours):
+    """(noktalar, flag'ler) konturlarından basit glyph — on/off-curve korunur."""
+    from fontTools.pens.ttGlyphPen import TTGlyphPointPen
+    pp = TTGlyphPointPen(None)
+    for pts, flags in contours:
+        pp.beginPath()
+        for (x, y), f in zip(pts, flags):
+            pp.addPoint((x, y), 'qcurve' if f & 1 else None)
+        pp.endPath()
+    return pp.glyph()
+
+
+def estimate_stroke(font):
+    """Stroke kalınlığı tahmini: 'l' / 'I' / '1' genişliği."""
+    glyf = font['glyf']; cmap = font.getBestCmap() or {}
+    for ch in 'lI1':
+        gn = cmap.get(ord(ch))
+        if gn:
+            b = _bounds(glyf, gn)
+            if b and 0 < b[2] - b[0] < 200:
+                return max(30, min(140, b[2] - b[0]))
+    return 70
+
+
+def synthesize_accents(font, stroke=None, chars=None, bodies=None):
+    """
+    TTFont'a (kaydetmeden önce) eksik aksanlı harfleri composite olarak ekle.
+    stroke: işaret kalınlığı (None → fonttan tahmin).
+    bodies: {taban karakter: dekorasyonsuz gövde sınırları} — verilmeyenler glyf'ten.
+    Eklenen karakter sayısını döndürür.
+    """
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    glyf = font['glyf']; hmtx = font['hmtx']
+    cmap = dict(font.getBestCmap() or {})
+    order = list(font.getGlyphOrder())
+    slant = math.tan(math.radians(-font['post'].italicAngle)) if 'post' in font else 0.0
+    new = []
+
+    def add_glyph(gn, g, adv, cp=None):
+        g.recalcBounds(glyf)
+        glyf[gn] = g
+        hmtx[gn] = (int(adv), getattr(g, 'xMin', 0))
+        if gn not in order:
+            order.append(gn)
+        if cp is not None:
+            cmap[cp] = gn
+            new.append(cp)
+
+    # ── ı / ȷ: 'i' / 'j' noktası atılarak ──────────────────────
+    dot = None
+    for src, dst in (('i', 'ı'), ('j', 'ȷ')):
+        gn = cmap.get(ord(src))
+        if not gn:
+            continue
+        parts = split_dot(glyf, gn)
+        if not parts:
+            continue
+        body, dcont = parts
+        if dot is None:
+            dxs = [x for x, _ in dcont[0]]; dys = [y for _, y in dcont[0]]
+            cx, y0 = (min(dxs) + max(dxs)) / 2, min(dys)
+            dot = [([(x - cx, y - y0) for x, y in dcont[0]], dcont[1])]
+        if ord(dst) not in cmap:
+            add_glyph(f'uni{ord(dst):04X}', _simple(body), hmtx[gn][0], ord(dst))
+
+    # nokta çapı ≈ 1.25 × stroke (engine'lerdeki dot_circle oranı)
+    if stroke:
+        sw = stroke
+    elif dot:
+        xs = [x for x, _ in dot[0][0]]
+        sw = max(20, min(140, (max(xs) - min(xs)) / 1.25))
+    else:
+        sw = estimate_stroke(font)
+
+    # ── işaretler: sadece ihtiyaç duyulanlar ──────────────────
+    wanted = [ch for ch in (chars or COMPOSITES) if ch in COMPOSITES
+              and ord(ch) not in cmap and ord(COMPOSITES[ch][0]) in cmap]
+    marks = {}
+    for ch in wanted:
+        mk = COMPOSITES[ch][1]
+        if mk in marks:
+            continue
+        cp = MARKS[mk][0]
+        if cp in cmap:                       # font kendi işaretini içeriyor
+            marks[mk] = cmap[cp]; continue
+        pen = TTGlyphPen(None)
+        if slant:
+            from fontTools.pens.transformPen import TransformPen
+            draw_mark(TransformPen(pen, (1, 0, slant, 1, 0, 0)), mk, sw, dot)
+        else:
+            draw_mark(pen, mk, sw, dot)
+        add_glyph(mk, pen.glyph(), 0, cp)
+        marks[mk] = mk
+
+    # ── composite'ler: işaretin (0,0)'ı taban harfin anchor'ına ──
+    found = {}
+    for ch in wanted:
+        base_ch, mk = COMPOSITES[ch]
+        bgn = cmap[ord(base_ch)]
+        if base_ch not in found:
+            body = (bodies or {}).get(base_ch) or _body_bounds(glyf, bgn)
+            found[base_ch] = anchors(body, sw, slant) if body else None
+        if found[base_ch] is None or _bounds(glyf, marks[mk]) is None:
+            continue
+        ax, ay = found[base_ch][MARKS[mk][1]]
+        pen = TTGlyphPen(glyf)
+        pen.addComponent(bgn, (1, 0, 0, 1, 0, 0))
+        pen.addComponent(marks[mk], (1, 0, 0, 1, int(round(ax)), int(round(ay))))
+        add_glyph(f'uni{ord(ch):04X}', pen.glyph(), hmtx[bgn][0], ord(ch))
+
+    if not new:
+        return 0
+    font.setGlyphOrder(order)
+    glyf.glyphOrder = order
+    for t in font['cmap'].tables:
+        if t.isUnicode():
+            t.cmap.update({cp: cmap[cp] for cp in new if cp <= 0xFFFF or t.format == 12})
+    return len(new)
+
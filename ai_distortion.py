@@ -456,7 +456,7 @@ def place_decorations(strokes: list, recipe: dict, char: str, adv: int) -> list:
         return strokes
 
     from glyph_anchors import get_anchors
-    from shape_library import get_shape, place
+    from shape_library import place_many
 
     anchors = get_anchors(char)
     sw = recipe.get('stroke_weight', 52)
@@ -491,16 +491,15 @@ def place_decorations(strokes: list, recipe: dict, char: str, adv: int) -> list:
             if not matching and anchors:
                 matching = [(anchors[0][1], anchors[0][2])]
 
-        for ax, ay in matching:
-            try:
-                shape_path = get_shape(shape_name)
-                # Scale: glyph-height based so decorations are always visible
-                # glyph_h = BASE - CAP = 480 font units
-                # dec_scale=1.0 -> ~22% of glyph height (good default)
-                from font_skeletons import BASE, CAP
-                glyph_h = BASE - CAP  # 480
-                size = glyph_h * dec_scale * 0.22
-                placed = place(shape_path, ax, ay, size, angle)
+        try:
+            # Scale: glyph-height based so decorations are always visible
+            # glyph_h = BASE - CAP = 480 font units
+            # dec_scale=1.0 -> ~22% of glyph height (good default)
+            from font_skeletons import BASE, CAP
+            glyph_h = BASE - CAP  # 480
+            size = glyph_h * dec_scale * 0.22
+            # all anchors of this decoration in one vectorized placement
+            for placed in place_many(shape_name, [(ax, ay, size, angle) for ax, ay in matching], as_str=True):
                 result.append({
                     'type': '_decoration',
                     'params': {'path': placed},
@@ -508,8 +507,8 @@ def place_decorations(strokes: list, recipe: dict, char: str, adv: int) -> list:
                     'is_counter': False,
                     'shape_name': shape_name,
                 })
-            except Exception as e:
-                print(f"[Decoration] {shape_name}@{anchor_type} failed: {e}")
+        except Exception as e:
+            print(f"[Decoration] {shape_name}@{anchor_type} failed: {e}")
 
     return result
 
@@ -2,12 +2,14 @@ __VERSION__ = "v7.1-bezier-arcs"
 """
 ai_font_geo.py — SVG PATH RENDERER + FONT PIPELINE  v5
 ========================================================
-Converts distorted stroke primitives → clean SVG path strings.
+Converts distorted stroke primitives → pen-native PenPath outlines
+(pen_path.py); SVG path strings are only serialized for the SVG grid.
 All paths use fill-rule="evenodd" for correct counter holes.
 
 Public API (backwards compatible):
   analyze_prompt(prompt) → style dict
   GlyphDrawer(style).draw(char) → (svg_path, advance_width)
+  GlyphDrawer(style).draw_path(char) → (PenPath, advance_width)
 
 New API:
   build_font(prompt, font_name, output_dir, gemini_key=None)
@@ -15,6 +17,7 @@ New API:
 """
 
 import math
+from pen_path import PenPath, join
 from font_skeletons import get_skeleton, CAP, XH, BASE, DESC, EM
 from ai_distortion import get_effect_recipe, apply_recipe
 
@@ -23,10 +26,10 @@ _FAMS = {'sans','serif','script','display','mono'}
 
 
 # ════════════════════════════════════════════════════════
-# STROKE → SVG PATH CONVERTER
+# STROKE → PEN PATH CONVERTER
 # ════════════════════════════════════════════════════════
 
-def _oval_path(cx, cy, rx, ry) -> str:
+def _oval_path(cx, cy, rx, ry) -> PenPath:
     """
     Smooth ellipse — CLOCKWISE (CW) in SVG y-down coords.
     Used for OUTER contours. CW = negative signed area.
@@ -34,13 +37,13 @@ def _oval_path(cx, cy, rx, ry) -> str:
     Goes: top → LEFT → bottom → RIGHT (CW in screen/y-down)
     """
     k = 0.5523; kx = rx*k; ky = ry*k
-    return (f"M{cx:.2f},{cy-ry:.2f} "
-            f"C{cx-kx:.2f},{cy-ry:.2f} {cx-rx:.2f},{cy-ky:.2f} {cx-rx:.2f},{cy:.2f} "
-            f"C{cx-rx:.2f},{cy+ky:.2f} {cx-kx:.2f},{cy+ry:.2f} {cx:.2f},{cy+ry:.2f} "
-            f"C{cx+kx:.2f},{cy+ry:.2f} {cx+rx:.2f},{cy+ky:.2f} {cx+rx:.2f},{cy:.2f} "
-            f"C{cx+rx:.2f},{cy-ky:.2f} {cx+kx:.2f},{cy-ry:.2f} {cx:.2f},{cy-ry:.2f} Z")
+    return (PenPath(2).M(cx, cy-ry)
+            .C(cx-kx, cy-ry, cx-rx, cy-ky, cx-rx, cy)
+            .C(cx-rx, cy+ky, cx-kx, cy+ry, cx, cy+ry)
+            .C(cx+kx, cy+ry, cx+rx, cy+ky, cx+rx, cy)
+            .C(cx+rx, cy-ky, cx+kx, cy-ry, cx, cy-ry).Z())
 
-def _oval_path_ccw(cx, cy, rx, ry) -> str:
+def _oval_path_ccw(cx, cy, rx, ry) -> PenPath:
     """
     Smooth ellipse — COUNTER-CLOCKWISE (CCW) in SVG y-down coords.
     Used for COUNTER/HOLE contours. CCW = positive signed area.
@@ -48,13 +51,13 @@ def _oval_path_ccw(cx, cy, rx, ry) -> str:
     Goes: top → RIGHT → bottom → LEFT (CCW in screen/y-down)
     """
     k = 0.5523; kx = rx*k; ky = ry*k
-    return (f"M{cx:.2f},{cy-ry:.2f} "
-            f"C{cx+kx:.2f},{cy-ry:.2f} {cx+rx:.2f},{cy-ky:.2f} {cx+rx:.2f},{cy:.2f} "
-            f"C{cx+rx:.2f},{cy+ky:.2f} {cx+kx:.2f},{cy+ry:.2f} {cx:.2f},{cy+ry:.2f} "
-            f"C{cx-kx:.2f},{cy+ry:.2f} {cx-rx:.2f},{cy+ky:.2f} {cx-rx:.2f},{cy:.2f} "
-            f"C{cx-rx:.2f},{cy-ky:.2f} {cx-kx:.2f},{cy-ry:.2f} {cx:.2f},{cy-ry:.2f} Z")
+    return (PenPath(2).M(cx, cy-ry)
+            .C(cx+kx, cy-ry, cx+rx, cy-ky, cx+rx, cy)
+            .C(cx+rx, cy+ky, cx+kx, cy+ry, cx, cy+ry)
+            .C(cx-kx, cy+ry, cx-rx, cy+ky, cx-rx, cy)
+            .C(cx-rx, cy-ky, cx-kx, cy-ry, cx, cy-ry).Z())
 
-def _rect_path(x, y, w, h, r=0) -> str:
+def _rect_path(x, y, w, h, r=0) -> PenPath:
     """
     Rectangle path — CLOCKWISE (CW) in SVG y-down coords.
     CW = negative signed area = after engine reverse_direction=True → CCW = outer fill.
@@ -63,26 +66,25 @@ def _rect_path(x, y, w, h, r=0) -> str:
     if r > 0:
         r = min(r, w//2, h//2)
         # CW rounded rect: go down first, then right, then up, then left
-        return (f"M{x+r:.1f},{y:.1f} L{x:.1f},{y:.1f} Q{x:.1f},{y:.1f} {x:.1f},{y+r:.1f} "
-                f"L{x:.1f},{y+h-r:.1f} Q{x:.1f},{y+h:.1f} {x+r:.1f},{y+h:.1f} "
-                f"L{x+w-r:.1f},{y+h:.1f} Q{x+w:.1f},{y+h:.1f} {x+w:.1f},{y+h-r:.1f} "
-                f"L{x+w:.1f},{y+r:.1f} Q{x+w:.1f},{y:.1f} {x+w-r:.1f},{y:.1f} Z")
+        return (PenPath().M(x+r, y).L(x, y).Q(x, y, x, y+r)
+                .L(x, y+h-r).Q(x, y+h, x+r, y+h)
+                .L(x+w-r, y+h).Q(x+w, y+h, x+w, y+h-r)
+                .L(x+w, y+r).Q(x+w, y, x+w-r, y).Z())
     # CW: top-left → bottom-left → bottom-right → top-right
-    return f"M{x:.1f},{y:.1f} L{x:.1f},{y+h:.1f} L{x+w:.1f},{y+h:.1f} L{x+w:.1f},{y:.1f} Z"
+    return PenPath().poly([(x, y), (x, y+h), (x+w, y+h), (x+w, y)])
 
-def _vbar_path(cx, y1, y2, sw, radius=0) -> str:
+def _vbar_path(cx, y1, y2, sw, radius=0) -> PenPath:
     return _rect_path(cx - sw/2, y1, sw, y2-y1, radius)
 
-def _hbar_path(x1, x2, cy, sw, radius=0) -> str:
+def _hbar_path(x1, x2, cy, sw, radius=0) -> PenPath:
     return _rect_path(x1, cy - sw/2, x2-x1, sw, radius)
 
-def _diag_path(x1, y1, x2, y2, sw) -> str:
+def _diag_path(x1, y1, x2, y2, sw) -> PenPath:
     dx, dy = x2-x1, y2-y1
     ln = math.hypot(dx, dy)
-    if ln < 1: return ""
+    if ln < 1: return PenPath()
     nx, ny = -dy/ln*sw/2, dx/ln*sw/2
-    return (f"M{x1+nx:.2f},{y1+ny:.2f} L{x2+nx:.2f},{y2+ny:.2f} "
-            f"L{x2-nx:.2f},{y2-ny:.2f} L{x1-nx:.2f},{y1-ny:.2f} Z")
+    return PenPath(2).poly([(x1+nx, y1+ny), (x2+nx, y2+ny), (x2-nx, y2-ny), (x1-nx, y1-ny)])
 
 def _arc_bezier_segment(cx, cy, rx, ry, a1, a2):
     """
@@ -110,7 +112,7 @@ def _arc_bezier_segment(cx, cy, rx, ry, a1, a2):
     return x0, y0, cp1x, cp1y, cp2x, cp2y, x3, y3
 
 
-def _arc_path(cx, cy, rx, ry, a1_deg, a2_deg, sw, sharp=False, counter=False) -> str:
+def _arc_path(cx, cy, rx, ry, a1_deg, a2_deg, sw, sharp=False, counter=False) -> PenPath:
     """
     Arc stroke — pure cubic Bezier, zero L commands.
     counter=True: reverses winding (CCW) for counter/hole arcs.
@@ -152,28 +154,24 @@ def _arc_path(cx, cy, rx, ry, a1_deg, a2_deg, sw, sharp=False, counter=False) ->
         # Swap outer/inner to flip total winding to CCW
         outer_segs, inner_segs = inner_segs, outer_segs
 
-    x0, y0 = outer_segs[0][0], outer_segs[0][1]
-    d = f"M{x0:.3f},{y0:.3f}"
+    d = PenPath(3).M(outer_segs[0][0], outer_segs[0][1])
     for s in outer_segs:
-        _, _, cp1x, cp1y, cp2x, cp2y, x3, y3 = s
-        d += f" C{cp1x:.3f},{cp1y:.3f} {cp2x:.3f},{cp2y:.3f} {x3:.3f},{y3:.3f}"
+        d.C(*s[2:])
 
-    ix_end, iy_end = inner_segs[0][0], inner_segs[0][1]
-    d += f" L{ix_end:.3f},{iy_end:.3f}"
+    d.L(inner_segs[0][0], inner_segs[0][1])
     for s in inner_segs:
-        _, _, cp1x, cp1y, cp2x, cp2y, x3, y3 = s
-        d += f" C{cp1x:.3f},{cp1y:.3f} {cp2x:.3f},{cp2y:.3f} {x3:.3f},{y3:.3f}"
+        d.C(*s[2:])
 
-    return d + " Z"
+    return d.Z()
 
-def _drip_path(cx, y, w, h) -> str:
+def _drip_path(cx, y, w, h) -> PenPath:
     """Teardrop drip shape."""
-    return (f"M{cx-w:.1f},{y:.1f} L{cx+w:.1f},{y:.1f} "
-            f"C{cx+w:.1f},{y+h*0.4:.1f} {cx+w*0.3:.1f},{y+h*0.8:.1f} {cx:.1f},{y+h:.1f} "
-            f"C{cx-w*0.3:.1f},{y+h*0.8:.1f} {cx-w:.1f},{y+h*0.4:.1f} {cx-w:.1f},{y:.1f} Z")
+    return (PenPath().M(cx-w, y).L(cx+w, y)
+            .C(cx+w, y+h*0.4, cx+w*0.3, y+h*0.8, cx, y+h)
+            .C(cx-w*0.3, y+h*0.8, cx-w, y+h*0.4, cx-w, y).Z())
 
-def stroke_to_path(s: dict) -> str:
-    """Convert a single stroke dict to SVG path string."""
+def stroke_to_path(s: dict) -> PenPath:
+    """Convert a single stroke dict to a PenPath ('_decoration' may stay an SVG string)."""
     t = s['type']; p = s['params']
     r = p.get('radius', 0)
     
@@ -183,9 +181,9 @@ def stroke_to_path(s: dict) -> str:
             # Flared ends: widen at y1 and y2
             sw = p['sw']; sw_end = sw * flare
             cx = p['cx']; y1 = p['y1']; y2 = p['y2']
-            return (f"M{cx-sw_end/2:.1f},{y1:.1f} L{cx+sw_end/2:.1f},{y1:.1f} "
-                    f"L{cx+sw/2:.1f},{(y1+y2)/2:.1f} L{cx+sw_end/2:.1f},{y2:.1f} "
-                    f"L{cx-sw_end/2:.1f},{y2:.1f} L{cx-sw/2:.1f},{(y1+y2)/2:.1f} Z")
+            return PenPath().poly([(cx-sw_end/2, y1), (cx+sw_end/2, y1),
+                                   (cx+sw/2, (y1+y2)/2), (cx+sw_end/2, y2),
+                                   (cx-sw_end/2, y2), (cx-sw/2, (y1+y2)/2)])
         return _vbar_path(p['cx'], p['y1'], p['y2'], p['sw'], r)
     
     elif t == 'hbar':
@@ -214,12 +212,12 @@ def stroke_to_path(s: dict) -> str:
     elif t == '_decoration':
         return p.get('path', '')   # pre-placed shape path
     
-    return ""
+    return PenPath()
 
 
-def strokes_to_svg_path(strokes: list) -> str:
+def strokes_to_pen_path(strokes: list) -> PenPath:
     """
-    Convert full list of strokes to single compound SVG path string.
+    Convert full list of strokes to a single compound PenPath.
     Counters (is_counter=True) appear as separate M…Z subpaths.
     fill-rule="evenodd" will punch holes through them.
     """
@@ -235,7 +233,12 @@ def strokes_to_svg_path(strokes: list) -> str:
         if path:
             parts.append(path)
     
-    return " ".join(parts)
+    return join(*parts)
+
+
+def strokes_to_svg_path(strokes: list) -> str:
+    """Compound SVG path string (SVG grid / preview serializer)."""
+    return strokes_to_pen_path(strokes).svg()
 
 
 # ════════════════════════════════════════════════════════
@@ -280,14 +283,18 @@ class GlyphDrawer:
         if self.fam == 'mono':     adv = 520
         self.adv = adv
 
-    def draw(self, char: str) -> tuple:
-        """Returns (svg_path_string, advance_width)."""
+    def draw_path(self, char: str) -> tuple:
+        """Returns (PenPath, advance_width) — draw straight onto a fontTools pen."""
         strokes = get_skeleton(char, self.fam, self.adv)
         strokes = _scale_stroke_widths(strokes, self.sw)
         if self.recipe:
             strokes = apply_recipe(strokes, self.recipe, self.adv, char=char)
-        path = strokes_to_svg_path(strokes)
-        return path, self.adv
+        return strokes_to_pen_path(strokes), self.adv
+
+    def draw(self, char: str) -> tuple:
+        """Returns (svg_path_string, advance_width)."""
+        path, adv = self.draw_path(char)
+        return path.svg(), adv
 
 
 def _scale_stroke_widths(strokes: list, target_sw: int) -> list:
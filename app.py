@@ -10,6 +10,8 @@ from urllib.parse import urlparse
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from engine import build_font, DEFAULT_CHAR_ORDER
+from http_compress import negotiate, compress, metrics as compress_metrics
+from artifact_cache import busy
 
 # ── Storage ───────────────────────────────────────────────────────────────────
 BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sessions')
@@ -148,6 +150,10 @@ def session_path(sid):
     p = os.path.join(BASE_DIR, sid)
     return p if os.path.isdir(p) else None
 
+def media_url(sid, filepath):
+    """Session çıktısı → inline servis edilen kısa ömürlü URL (yoksa None)"""
+    return f'/media/{sid}/{os.path.basename(filepath)}' if filepath else None
+
 def cleanup_old_sessions():
     """Eski session'ları temizle — her 10 dakikada çalışır"""
     while True:
@@ -168,9 +174,31 @@ def cleanup_old_sessions():
         except:
             pass
 
-# Cleanup thread'i başlat
-t = threading.Thread(target=cleanup_old_sessions, daemon=True)
-t.start()
+# ── Toplu dönüşüm işleri (arka planda; istek thread'i beklemez) ─────────────
+BULK_JOBS = {}                   # sid → durum (status, done, jobs, ok, failed)
+BULK_LOCK = threading.Lock()     # işler sırayla: aynı anda tek toplu dönüşüm
+
+def run_bulk_job(sid, path, items, styles, workers, prefix, char_order, skipped):
+    """Arka plan thread'i: SVG'ler → session/output/fonts.zip; ilerleme BULK_JOBS[sid]'de."""
+    from bulk_convert import write_bulk_zip
+    job = BULK_JOBS[sid]
+    def progress(done, total, ok, failed):
+        job.update(done=done, ok=ok, failed=failed)
+    with BULK_LOCK, busy():
+        job['status'] = 'running'
+        zip_path = os.path.join(path, 'output', 'fonts.zip')
+        try:
+            os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+            with open(zip_path + '.part', 'wb') as f:
+                m = write_bulk_zip(items, f, styles, workers, prefix, char_order=char_order,
+                                   skipped=skipped, progress=progress, isolate=True)
+            os.replace(zip_path + '.part', zip_path)
+            job.update(status='done', ok=m['ok'], failed=m['failed'], total_sec=m['total_sec'],
+                       download_url=f'/download/{sid}/fonts.zip')
+            print(f"[BULK] ✓ {m['ok']} font, {m['failed']} hata, {m['total_sec']}s")
+        except Exception as e:
+            job.update(status='error', error=str(e))
+            print(f"[BULK ERROR] {e}\n{traceback.format_exc()}")
 
 # ── Multipart parser ──────────────────────────────────────────────────────────
 def parse_multipart(data, content_type):
@@ -206,6 +234,10 @@ def parse_multipart(data, content_type):
 # ── Request Handler ───────────────────────────────────────────────────────────
 class Handler(BaseHTTPRequestHandler):
 
+    def handle_one_request(self):
+        with busy():                     # istek sürerken (ve biraz sonra) kafes ısıtması bekler
+            super().handle_one_request()
+
     def log_message(self, format, *args):
         print(f"[{self.address_string()}] {format % args}")
 
@@ -221,9 +253,13 @@ class Handler(BaseHTTPRequestHandler):
 
     def json_resp(self, data, status=200):
         body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        body, enc = compress(body, negotiate(self.headers.get('Accept-Encoding')))
         self.send_response(status)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Content-Length', len(body))
+        self.send_header('Vary', 'Accept-Encoding')
+        if enc:
+            self.send_header('Content-Encoding', enc)
         self.send_cors()
         self.end_headers()
         self.wfile.write(body)
@@ -275,10 +311,18 @@ class Handler(BaseHTTPRequestHandler):
             with open(svg_path, 'w', encoding='utf-8') as svgf:
                 svgf.write(svg_content)
 
+            preview_url = None
+            if result.get('preview'):
+                psid, psp = new_session()
+                os.makedirs(os.path.join(psp, 'output'), exist_ok=True)
+                with open(os.path.join(psp, 'output', 'preview.png'), 'wb') as pf:
+                    pf.write(result['preview'])
+                preview_url = f'/media/{psid}/preview.png'
+
             print(f"[HW-PROCESS] OK sid={sid[:8]} chars={result.get('char_count')} svg={len(svg_content)}")
             self.json_resp({
                 'success':        True,
-                'preview':        result.get('preview'),
+                'preview_url':    preview_url,
                 'char_count':     result.get('char_count', 0),
                 'detected_chars': result.get('detected_chars', []),
                 'session_id':     sid,
@@ -326,8 +370,10 @@ class Handler(BaseHTTPRequestHandler):
                 self.json_resp({'success': False, 'error': 'Font generation failed'})
                 return
 
+            from webfonts import web_paths_for, WEB_FORMATS
+            web = web_paths_for(ttf_path)
             result_files = []
-            for fp in [ttf_path, otf_path]:
+            for fp in [ttf_path, otf_path] + [web[f] for f in WEB_FORMATS if f in web]:
                 if fp and os.path.exists(fp):
                     sid2, sp2 = new_session()
                     out2 = os.path.join(sp2, 'output')
@@ -362,6 +408,10 @@ class Handler(BaseHTTPRequestHandler):
             self.wfile.write(b'OK')
             return
 
+        if path == '/api/metrics':
+            self.json_resp({'compression': compress_metrics()})
+            return
+
         if path == '/api/vote-count':
             _, vstats, _ = db_get_stats()
             good = vstats.get('good',0)
@@ -507,22 +557,114 @@ class Handler(BaseHTTPRequestHandler):
         elif path == '/api/fonts':
             self.handle_fonts_api()
 
-        elif path.startswith('/download/'):
-            # /download/{session_id}/{filename}
-            parts = path[10:].split('/', 1)
+        elif path.startswith('/api/font/') and path.endswith('/subset'):
+            # /api/font/{session_id}/subset?text=...&file=...&format=ttf|woff|woff2
+            self.handle_font_subset(path[10:-7])
+
+        elif path.startswith('/api/font/') and path.endswith('/kit'):
+            # /api/font/{session_id}/kit?file=...&display=swap → zip
+            self.handle_font_kit(path[10:-4])
+
+        elif path.startswith('/api/bulk-convert/'):
+            # /api/bulk-convert/{job} → {status: queued|running|done|error, done, jobs, download_url}
+            self.handle_bulk_status(path[18:])
+
+        elif path.startswith('/download/') or path.startswith('/media/'):
+            # /download/{session_id}/{filename}  → attachment
+            # /media/{session_id}/{filename}     → inline (önizleme: font, sprite, görsel)
+            inline = path.startswith('/media/')
+            parts = path[7 if inline else 10:].split('/', 1)
             if len(parts) == 2:
                 sid, filename = parts
                 filename = os.path.basename(filename)
-                sp = session_path(sid)
+                sp = session_path(os.path.basename(sid))
                 if sp:
                     filepath = os.path.join(sp, 'output', filename)
                     if os.path.exists(filepath):
-                        self.serve_file(filepath)
+                        self.serve_file(filepath, inline=inline)
                         return
             self.send_error(404)
         else:
             self.send_error(404)
 
+    def session_font(self, sid, filename=None):
+        """Session çıktısındaki önizleme fontu: istenen dosya, yoksa Regular, yoksa ilk statik TTF"""
+        sp = session_path(os.path.basename(sid))
+        if not sp:
+            return None
+        out = os.path.join(sp, 'output')
+        if filename:
+            fp = os.path.join(out, os.path.basename(filename))
+            return fp if os.path.isfile(fp) and fp.lower().endswith(('.ttf', '.otf')) else None
+        try:
+            ttfs = sorted(f for f in os.listdir(out) if f.lower().endswith('.ttf'))
+        except OSError:
+            return None
+        static = [f for f in ttfs if not f.endswith('-VF.ttf')]
+        pick = next((f for f in static if f.endswith('_Regular.ttf')), None) or (static or ttfs or [None])[0]
+        return os.path.join(out, pick) if pick else None
+
+    def handle_font_subset(self, sid):
+        """Sadece önizleme metninin glyph'lerini içeren küçük font — ilk boyama için"""
+        from urllib.parse import parse_qs
+        from font_subset import subset_font, MIME
+        q = parse_qs(urlparse(self.path).query)
+        fp = self.session_font(sid, (q.get('file') or [None])[0])
+        if not fp:
+            self.send_error(404)
+            return
+        try:
+            data, etag, fmt = subset_font(fp, (q.get('text') or [''])[0],
+                                          (q.get('format') or ['ttf'])[0])
+        except Exception as e:
+            print(f'[SUBSET ERROR] {e}')
+            self.send_error(500)
+            return
+        etag = f'"{etag}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_cors()
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', MIME[fmt])
+        self.send_header('Content-Length', len(data))
+        self.send_header('Cache-Control', f'public, max-age={SESSION_TTL}')
+        self.send_header('ETag', etag)
+        self.send_cors()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_font_kit(self, sid):
+        """unicode-range WOFF2 parçaları + CSS + preload → zip (session başına önbellekli)"""
+        from urllib.parse import parse_qs
+        from font_kit import build_kit, write_kit_zip
+        import io as _io
+        q = parse_qs(urlparse(self.path).query)
+        fp = self.session_font(sid, (q.get('file') or [None])[0])
+        if not fp:
+            self.send_error(404)
+            return
+        base = os.path.splitext(os.path.basename(fp))[0]
+        kit_dir = os.path.join(os.path.dirname(fp), 'kit', base)
+        try:
+            man = build_kit(fp, kit_dir, (q.get('display') or ['swap'])[0])
+            buf = _io.BytesIO()
+            write_kit_zip(kit_dir, man, buf)
+        except Exception as e:
+            print(f'[KIT ERROR] {e}\n{traceback.format_exc()}')
+            self.send_error(500)
+            return
+        data = buf.getvalue()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Length', len(data))
+        self.send_header('Content-Disposition', f'attachment; filename="{base}-webkit.zip"')
+        self.send_cors()
+        self.end_headers()
+        self.wfile.write(data)
+
     def handle_fonts_api(self):
         """Font listesini döndür — önce embedded DB, sonra Google API bonus"""
         import urllib.request, json as _json
@@ -579,16 +721,30 @@ class Handler(BaseHTTPRequestHandler):
             self.send_header('Location', '/')
             self.end_headers()
 
-    def serve_file(self, filepath):
+    def serve_file(self, filepath, inline=False):
+        # Session dosyaları üretildikten sonra değişmez → session ömrü kadar önbelleklenebilir
+        st = os.stat(filepath)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_cors()
+            self.end_headers()
+            return
         with open(filepath, 'rb') as f:
             data = f.read()
         ext = filepath.rsplit('.', 1)[-1].lower()
-        mime = {'ttf': 'font/ttf', 'otf': 'font/otf', 'svg': 'image/svg+xml', 'json': 'application/json'}.get(ext, 'application/octet-stream')
+        from webfonts import MIME
+        mime = {**MIME, 'svg': 'image/svg+xml', 'json': 'application/json', 'png': 'image/png',
+                'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'webp': 'image/webp'}.get(ext, 'application/octet-stream')
         filename = os.path.basename(filepath)
         self.send_response(200)
         self.send_header('Content-Type', mime)
         self.send_header('Content-Length', len(data))
-        self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
+        self.send_header('Cache-Control', f'private, max-age={SESSION_TTL}')
+        self.send_header('ETag', etag)
+        if not inline:
+            self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
         self.send_cors()
         self.end_headers()
         self.wfile.write(data)
@@ -599,6 +755,13 @@ class Handler(BaseHTTPRequestHandler):
             self.handle_convert()
         elif path == '/convert-auto':
             self.handle_convert_auto()
+        elif path == '/api/bulk-convert':
+            self.handle_bulk_convert()
+        elif path == '/api/upload':
+            self.handle_upload()
+        elif path.startswith('/api/upload/') and path.endswith('/build'):
+            # /api/upload/{upload_id}/build
+            self.handle_upload_build(path[12:-6])
         elif path == '/optimize':
             self.handle_optimize()
         elif path == '/png-to-svg':
@@ -773,15 +936,20 @@ class Handler(BaseHTTPRequestHandler):
                 output_format=fmt,
                 max_output_px=4096,
             )
-            print(f"[Upscale] done, encoding base64...")
 
             print(f"[Upscale] {stats['original_w']}x{stats['original_h']} → {stats['output_w']}x{stats['output_h']} | {stats['output_kb']}KB | {stats['elapsed_sec']}s")
 
-            import base64
-            b64 = base64.b64encode(out_bytes).decode()
+            # Sonuç session'a yazılır, JSON sadece URL taşır
+            sid, sp = new_session()
+            out_dir = os.path.join(sp, 'output')
+            os.makedirs(out_dir, exist_ok=True)
+            fname = f"vectrod_{scale:g}x_enhanced.{stats['ext']}"
+            with open(os.path.join(out_dir, fname), 'wb') as f:
+                f.write(out_bytes)
             self.json_resp({
                 'success': True,
-                'image_b64': b64,
+                'image_url': f'/media/{sid}/{fname}',
+                'download_url': f'/download/{sid}/{fname}',
                 'mime': stats['mime'],
                 'ext': stats['ext'],
                 'stats': stats,
@@ -973,74 +1141,73 @@ Be accurate. Respond with ONLY the JSON."""
             # ── VECTROD v3 DNA PIPELINE ───────────────────────────────
             from vectrod_v3 import build_from_prompt as v3_build
 
-            ttf_path, dna, glyph_svgs = v3_build(
+            art, dna = v3_build(
                 prompt     = prompt,
                 font_name  = font_name,
                 output_dir = out_dir,
                 gemini_key = gemini_key,
+                variable   = bool(data.get('variable', False)),   # VF: 3 master + varLib, isteğe bağlı
+                fast       = bool(data.get('fast', False)),
             )
 
+            # ── LIVE PREVIEW: glyph sprite (dosyalar arka planda yazılırken) ──
+            from webfonts import web_paths_for, preview_font, write_sprite, WEB_FORMATS
+            paths = art.wait() if art else {}
+            ttf_path = paths.get('ttf')
             if not ttf_path or not os.path.exists(ttf_path):
                 self.json_resp({'success': False, 'error': 'Font generation failed'}, 500)
                 return
+            sprite_path = write_sprite(art.previews, ttf_path)
 
             # ── COLLECT OUTPUT FILES ──────────────────────────────────
             result_files = []
             fname = os.path.basename(ttf_path)
+            for fmt in ('ttf',) + WEB_FORMATS + ('otf',):
+                if fmt in paths:
+                    result_files.append({
+                        'filename': os.path.basename(paths[fmt]),
+                        'size':     os.path.getsize(paths[fmt]),
+                        'url':      f'/download/{sid}/{os.path.basename(paths[fmt])}',
+                    })
             result_files.append({
-                'filename': fname,
-                'size':     os.path.getsize(ttf_path),
-                'url':      f'/download/{sid}/{fname}',
+                'filename': f'{os.path.splitext(fname)[0]}-webkit.zip',
+                'size':     None,
+                'url':      f'/api/font/{sid}/kit?file={fname}',
             })
-            otf_path = dna.get('_otf_path')
-            if otf_path and os.path.exists(otf_path):
-                ofname = os.path.basename(otf_path)
+            vf_path = dna.get('_vf_path')
+            variable = None
+            if vf_path and os.path.exists(vf_path):
+                vfname = os.path.basename(vf_path)
                 result_files.append({
-                    'filename': ofname,
-                    'size':     os.path.getsize(otf_path),
-                    'url':      f'/download/{sid}/{ofname}',
+                    'filename': vfname,
+                    'size':     os.path.getsize(vf_path),
+                    'url':      f'/download/{sid}/{vfname}',
                 })
+                from vectrod_v3 import SW_MIN, SW_MAX
+                vf_prev, _ = preview_font(web_paths_for(vf_path))   # tarayıcıya woff2
+                variable = {'url': media_url(sid, vf_prev), 'axis': 'wght',
+                            'min': SW_MIN * 7, 'max': SW_MAX * 7,
+                            'default': max(SW_MIN, min(SW_MAX, int(dna.get('stroke_weight', 44)))) * 7}
 
-            # ── BASE64 FONT FOR LIVE PREVIEW ──────────────────────────
-            import base64 as _b64
-            with open(ttf_path, 'rb') as ff:
-                font_b64 = _b64.b64encode(ff.read()).decode('ascii')
+            prev_path, prev_fmt = preview_font(paths)
+            glyph_count = art.stats['glyphs']
+            generated_chars = [ch for ch in art.chars if 32 < ord(ch) < 127][:80]
 
-            glyph_count = 0
-            generated_chars = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
-            try:
-                from fontTools.ttLib import TTFont as _TT
-                tt = _TT(ttf_path)
-                glyph_count = max(0, len(tt.getGlyphOrder()) - 2)
-                cmap = tt.getBestCmap() or {}
-                generated_chars = [chr(cp) for cp in sorted(cmap.keys())
-                                   if 32 < cp < 127][:80]
-                tt.close()
-            except Exception:
-                glyph_count = len(glyph_svgs)
-
-            sz_kb = os.path.getsize(ttf_path) // 1024
-            print(f"  [v3] ✅ {sz_kb}KB | {glyph_count} glyphs | "
+            print(f"  [v3] ✅ {len(art.data)//1024}KB | {glyph_count} glyphs | "
                   f"sw={dna.get('stroke_weight')} deco={dna.get('decoration')} "
                   f"shapes={dna.get('shapes')}")
 
-            # Glyph SVG format normalize
-            svgs_out = {}
-            for ch, v in glyph_svgs.items():
-                if isinstance(v, dict):
-                    d = v.get('d',''); adv = v.get('adv', 600)
-                    svgs_out[ch] = f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {adv} 1000"><path d="{d}" fill="#333"/></svg>'
-                else:
-                    svgs_out[ch] = v
-
             self.json_resp({
                 'success':         True,
                 'files':           result_files,
                 'session':         sid,
-                'font_b64':        font_b64,
+                'font_url':        media_url(sid, prev_path),
+                'font_format':     prev_fmt,
+                'subset_url':      f'/api/font/{sid}/subset?file={os.path.basename(ttf_path)}&format={prev_fmt}',
                 'glyph_count':     glyph_count,
                 'generated_chars': generated_chars,
-                'glyph_svgs':      svgs_out,
+                'glyphs_url':      media_url(sid, sprite_path),
+                'variable':        variable,
                 'dna': {
                     'engine':        'vectrod-v3',
                     'decoration':    dna.get('decoration'),
@@ -1048,6 +1215,8 @@ Be accurate. Respond with ONLY the JSON."""
                     'density':       dna.get('density'),
                     'shapes':        dna.get('shapes', []),
                     'deco_size_mul': dna.get('deco_size_mul'),
+                    'fast':          bool(data.get('fast', False)),
+                    'cached':        bool(art.stats.get('cached')),
                 },
             })
 
@@ -1056,6 +1225,120 @@ Be accurate. Respond with ONLY the JSON."""
             print(f"[v3 ERROR] {e}\n{traceback.format_exc()}")
             self.json_resp({'success': False, 'error': str(e)}, 500)
 
+    def convert_svg(self, svg_src, fields, font_name, out_dir, char_order, bold, italic):
+        """SVG (bayt/ağaç) → (ttf_path, tüm çıktı yolları, Regular önizleme path'leri)"""
+        if fields.get('family', '0') == '1':
+            # Tek parse → Regular/Bold/Italic/Bold Italic
+            from engine import build_family
+            variants, previews = build_family(svg_src, font_name, out_dir,
+                                              char_order=char_order, previews=True)
+            ttf_path, _ = variants.get('regular', (None, None))
+            out_paths = [fp for pair in variants.values() for fp in pair]
+        else:
+            ttf_path, otf_path, previews = build_font(svg_src, font_name, out_dir,
+                                                      char_order=char_order, bold=bold,
+                                                      italic=italic, previews=True)
+            out_paths = [ttf_path, otf_path]
+        from webfonts import web_paths_for, WEB_FORMATS
+        for fp in list(out_paths):
+            if fp and fp.endswith('.ttf'):
+                web = web_paths_for(fp)
+                out_paths += [web[f] for f in WEB_FORMATS if f in web]
+        return ttf_path, out_paths, previews
+
+    def preview_payload(self, sid, ttf_path, previews):
+        """Önizleme URL'leri: en küçük font formatı + glyph sprite"""
+        from webfonts import web_paths_for, preview_font, write_sprite
+        prev_path, prev_fmt = preview_font(web_paths_for(ttf_path))
+        return {
+            'font_url':        media_url(sid, prev_path),
+            'font_format':     prev_fmt,
+            'glyph_count':     len(previews),
+            'generated_chars': [ch for ch in previews if ch != ' '][:62],
+            'glyphs_url':      media_url(sid, write_sprite(previews, ttf_path)),
+        }
+
+    def handle_upload(self):
+        """SVG'yi bir kez yükle → upload_id (parse edilmiş outline'lar önbellekte)"""
+        try:
+            fields, files = self.read_body()
+            if 'svg' not in files:
+                self.json_resp({'success': False, 'error': 'SVG file missing'}, 400)
+                return
+            import upload_store
+            try:
+                entry = upload_store.put(files['svg']['data'], files['svg'].get('filename', ''))
+            except ValueError as e:
+                self.json_resp({'success': False, 'error': str(e)}, 400)
+                return
+            print(f"[UPLOAD] id={entry.id[:8]} shapes={len(entry.shapes['shapes'])}")
+            self.json_resp({'success': True, 'upload_id': entry.id,
+                            'shapes': len(entry.shapes['shapes']),
+                            'failed': len(entry.shapes['errors']),
+                            'expires_in': upload_store.UPLOAD_TTL})
+        except Exception as e:
+            print(f"[UPLOAD ERROR] {e}\n{traceback.format_exc()}")
+            self.json_resp({'success': False, 'error': str(e)}, 500)
+
+    def handle_upload_build(self, upload_id):
+        """Yüklenmiş SVG'den font — /convert ile aynı alanlar (JSON veya form), SVG'siz"""
+        threading.Thread(target=db_inc, args=('converts',), daemon=True).start()
+        try:
+            import upload_store
+            entry = upload_store.get(os.path.basename(upload_id))
+            if entry is None:
+                self.json_resp({'success': False, 'error': 'Upload expired — please upload again'}, 404)
+                return
+            if self.headers.get('Content-Type', '').startswith('application/json'):
+                length = int(self.headers.get('Content-Length', 0))
+                fields = {k: (json.dumps(v) if isinstance(v, list) else str(v))
+                          for k, v in json.loads(self.rfile.read(length) or b'{}').items()}
+            else:
+                fields, _ = self.read_body()
+
+            font_name = fields.get('font_name', 'CustomFont').strip() or 'CustomFont'
+            bold = fields.get('bold', '0') in ('1', 'True', 'true')
+            italic = fields.get('italic', '0') in ('1', 'True', 'true')
+            family = fields.get('family', '0') in ('1', 'True', 'true')
+            try:
+                char_order = json.loads(fields.get('char_order', '[]')) or list(DEFAULT_CHAR_ORDER)
+            except:
+                char_order = list(DEFAULT_CHAR_ORDER)
+
+            sid, sp = new_session()
+            out_dir = os.path.join(sp, 'output')
+            os.makedirs(out_dir, exist_ok=True)
+            print(f"\n[UPLOAD-BUILD] id={entry.id[:8]} session={sid[:8]} font={font_name} "
+                  f"bold={bold} italic={italic} family={family}")
+
+            ttf_path, out_paths, previews, stats = upload_store.build(
+                entry, font_name, out_dir, char_order, bold, italic, family)
+            if not ttf_path:
+                self.json_resp({'success': False, 'error': 'Font generation failed'}, 500)
+                return
+            from webfonts import web_paths_for, WEB_FORMATS
+            for fp in list(out_paths):
+                if fp and fp.endswith('.ttf'):
+                    web = web_paths_for(fp)
+                    out_paths += [web[f] for f in WEB_FORMATS if f in web]
+
+            result_files = []
+            for fp in out_paths:
+                if fp and os.path.exists(fp):
+                    fname = os.path.basename(fp)
+                    result_files.append({
+                        'filename': fname,
+                        'size': os.path.getsize(fp),
+                        'url': f'/download/{sid}/{fname}'
+                    })
+            print(f"  ✓ {stats['rebuild']} rebuild, {stats['outlines_rebuilt']} outline, {stats['build_sec']}s")
+            self.json_resp({'success': True, 'files': result_files, 'session': sid,
+                            'upload_id': entry.id, 'build': stats,
+                            **self.preview_payload(sid, ttf_path, previews)})
+        except Exception as e:
+            print(f"[UPLOAD-BUILD ERROR] {e}\n{traceback.format_exc()}")
+            self.json_resp({'success': False, 'error': str(e)}, 500)
+
     def handle_convert_auto(self):
         """Otomatik optimize et + fonta çevir — tek adımda"""
         try:
@@ -1079,10 +1362,11 @@ Be accurate. Respond with ONLY the JSON."""
 
             print(f"\n[AUTO-CONVERT] session={sid[:8]} font={font_name}")
 
-            # 1. Otomatik optimize
-            from lxml import etree
+            # 1. Otomatik optimize — parse edilen ağaç doğrudan engine'e gider
+            from engine import parse_svg
+            svg_src = svg_data
             try:
-                tree = etree.fromstring(svg_data)
+                tree = parse_svg(svg_data)
                 ns = 'http://www.w3.org/2000/svg'
                 # Metadata temizle
                 to_remove = []
@@ -1097,25 +1381,20 @@ Be accurate. Respond with ONLY the JSON."""
                 for elem in to_remove:
                     p = elem.getparent()
                     if p is not None: p.remove(elem)
-                svg_data = etree.tostring(tree, pretty_print=True, xml_declaration=True, encoding='UTF-8')
+                svg_src = tree
                 print(f"  ✓ SVG optimize edildi")
             except Exception as e:
                 print(f"  ⚠ Optimize atlandı: {e}")
 
-            # 2. SVG kaydet
-            svg_path = os.path.join(sp, 'input.svg')
-            with open(svg_path, 'wb') as f:
-                f.write(svg_data)
-
-            # 3. Fonta çevir
-            ttf_path, otf_path = build_font(svg_path, font_name, out_dir,
-                                             char_order=char_order, bold=bold, italic=italic)
+            # 2. Fonta çevir
+            ttf_path, out_paths, previews = self.convert_svg(
+                svg_src, fields, font_name, out_dir, char_order, bold, italic)
             if not ttf_path:
                 self.json_resp({'success': False, 'error': 'Font generation failed'}, 500)
                 return
 
             result_files = []
-            for fp in [ttf_path, otf_path]:
+            for fp in out_paths:
                 if fp and os.path.exists(fp):
                     fname = os.path.basename(fp)
                     result_files.append({
@@ -1124,7 +1403,8 @@ Be accurate. Respond with ONLY the JSON."""
                         'url': f'/download/{sid}/{fname}'
                     })
 
-            self.json_resp({'success': True, 'files': result_files, 'session': sid, 'auto_optimized': True})
+            self.json_resp({'success': True, 'files': result_files, 'session': sid, 'auto_optimized': True,
+                            **self.preview_payload(sid, ttf_path, previews)})
 
         except Exception as e:
             print(f"[AUTO-CONVERT ERROR] {e}\n{traceback.format_exc()}")
@@ -1258,10 +1538,6 @@ Be accurate. Respond with ONLY the JSON."""
             out_dir = os.path.join(sp, 'output')
             os.makedirs(out_dir, exist_ok=True)
 
-            svg_path = os.path.join(sp, 'input.svg')
-            with open(svg_path, 'wb') as f:
-                f.write(files['svg']['data'])
-
             font_name = fields.get('font_name', 'CustomFont').strip() or 'CustomFont'
             bold = fields.get('bold', '0') == '1'
             italic = fields.get('italic', '0') == '1'
@@ -1272,15 +1548,16 @@ Be accurate. Respond with ONLY the JSON."""
                 char_order = list(DEFAULT_CHAR_ORDER)
 
             print(f"\n[CONVERT] session={sid[:8]} font={font_name} bold={bold} italic={italic} chars={len(char_order)}")
+            svg_src = files['svg']['data']          # diske yazılmaz, engine tek kez parse eder
 
-            ttf_path, otf_path = build_font(svg_path, font_name, out_dir,
-                                             char_order=char_order, bold=bold, italic=italic)
+            ttf_path, out_paths, previews = self.convert_svg(
+                svg_src, fields, font_name, out_dir, char_order, bold, italic)
             if not ttf_path:
                 self.json_resp({'success': False, 'error': 'Font generation failed'}, 500)
                 return
 
             result_files = []
-            for fp in [ttf_path, otf_path]:
+            for fp in out_paths:
                 if fp and os.path.exists(fp):
                     fname = os.path.basename(fp)
                     result_files.append({
@@ -1289,39 +1566,68 @@ Be accurate. Respond with ONLY the JSON."""
                         'url': f'/download/{sid}/{fname}'
                     })
 
-            import base64
-            font_b64 = None
-            glyph_count = 0
-            generated_chars = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-
-            if ttf_path and os.path.exists(ttf_path):
-                with open(ttf_path, 'rb') as ff:
-                    font_b64 = base64.b64encode(ff.read()).decode('ascii')
-                try:
-                    from fontTools.ttLib import TTFont
-                    tt = TTFont(ttf_path)
-                    glyph_count = len(tt.getGlyphOrder()) - 1
-                    generated_chars = [g for g in tt.getGlyphOrder()
-                                       if g != '.notdef' and len(g) == 1][:62]
-                    tt.close()
-                except Exception:
-                    glyph_count = 83
+            self.json_resp({'success': True, 'files': result_files, 'session': sid,
+                            **self.preview_payload(sid, ttf_path, previews)})
 
-            # glyph_svgs already built above in new pipeline
+        except Exception as e:
+            print(f"[CONVERT ERROR] {e}\n{traceback.format_exc()}")
+            self.json_resp({'success': False, 'error': str(e)}, 500)
 
-            self.json_resp({
-                'success': True,
-                'files': result_files,
-                'session': sid,
-                'font_b64': font_b64,
-                'glyph_count': glyph_count,
-                'generated_chars': generated_chars,
-                'glyph_svgs': glyph_svgs,
-            })
+    def handle_bulk_convert(self):
+        """
+        zip (SVG'ler) → arka plan işi, 202 + durum URL'i. İş bitince
+        GET /api/bulk-convert/{job} download_url verir (fontlar + manifest.json).
+        """
+        import zipfile
+        from bulk_convert import svgs_from_zip, parse_styles
+        try:
+            fields, files = self.read_body()
+            if 'zip' not in files:
+                self.json_resp({'success': False, 'error': 'ZIP file missing'}, 400)
+                return
+            try:
+                items, skipped = svgs_from_zip(files['zip']['data'])
+            except zipfile.BadZipFile:
+                self.json_resp({'success': False, 'error': 'Invalid ZIP file'}, 400)
+                return
+            if not items:
+                self.json_resp({'success': False, 'error': 'No SVG files in ZIP'}, 400)
+                return
 
+            styles = parse_styles(fields.get('styles', 'regular'))
+            try:
+                char_order = json.loads(fields.get('char_order', '[]')) or None
+            except:
+                char_order = None
+            try:
+                workers = int(fields.get('workers', 0)) or None
+            except ValueError:
+                workers = None
+            prefix = re.sub(r'[^0-9A-Za-z]', '', fields.get('prefix', ''))[:16]
         except Exception as e:
-            print(f"[CONVERT ERROR] {e}\n{traceback.format_exc()}")
+            print(f"[BULK ERROR] {e}\n{traceback.format_exc()}")
             self.json_resp({'success': False, 'error': str(e)}, 500)
+            return
+
+        threading.Thread(target=db_inc, args=('converts',), daemon=True).start()
+        print(f"\n[BULK] {len(items)} SVG × {len(styles)} stil ({','.join(styles)})")
+
+        sid, path = new_session()
+        for old in [k for k in BULK_JOBS if not session_path(k)]:   # süresi dolan session'lar
+            BULK_JOBS.pop(old, None)
+        BULK_JOBS[sid] = {'status': 'queued', 'done': 0, 'jobs': len(items) * len(styles),
+                          'ok': 0, 'failed': 0}
+        threading.Thread(target=run_bulk_job, name='bulk-convert', daemon=True,
+                         args=(sid, path, items, styles, workers, prefix, char_order, skipped)).start()
+        self.json_resp({'success': True, 'job': sid, 'status_url': f'/api/bulk-convert/{sid}',
+                        **BULK_JOBS[sid]}, 202)
+
+    def handle_bulk_status(self, sid):
+        job = BULK_JOBS.get(sid)
+        if job is None:
+            self.json_resp({'success': False, 'error': 'Job not found'}, 404)
+            return
+        self.json_resp({'success': job['status'] != 'error', 'job': sid, **job})
 
     def handle_optimize(self):
         try:
@@ -1387,6 +1693,8 @@ Be accurate. Respond with ONLY the JSON."""
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
     port = int(os.environ.get("PORT", 8080))
+    # Cleanup thread'i başlat (modül seviyesinde değil: spawn worker'ları app'i yeniden import eder)
+    threading.Thread(target=cleanup_old_sessions, daemon=True).start()
 
     print(f"\n{'='*52}")
     print(f"  Vectrod v7.2 — AI Font Generator")
@@ -1408,6 +1716,14 @@ def main():
         print(f"  ✓ Self-test: H path y=[{min(_ys):.0f},{max(_ys):.0f}] (should be [36,589])")
     except Exception as _e:
         print(f"  ⚠ Self-test failed: {_e}")
+    # DNA kafesini boştayken ısıt (VECTROD_LATTICE_WARM=1; hızlı mod + popüler stiller önbellekten)
+    try:
+        from artifact_cache import warm_up, lattice_points, LATTICE_WARM
+        if LATTICE_WARM:
+            warm_up()
+            print(f"  ✓ DNA lattice warm-up: {len(lattice_points())} DNA (arka planda, boştayken)")
+    except Exception as _e:
+        print(f"  ⚠ Lattice warm-up failed: {_e}")
     print(f"  ✓ Ctrl+C to stop\n")
 
     server = HTTPServer(('0.0.0.0', port), Handler)
@@ -0,0 +1,221 @@
+"""
+artifact_cache.py — Derlenmiş v3 fontları için önbellek + DNA kafesi
+====================================================================
+Heuristic DNA uzayında az sayıda farklı çıktı var, Gemini DNA'ları da
+birkaç noktada yoğunlaşıyor. Derlenmiş FontArtifact'ler kanonik DNA
+anahtarıyla saklanır; aile adı farklıysa yalnız name tablosu yeniden
+yazılır (art.renamed):
+
+  from artifact_cache import compiled, compiled_variable, snap, warm_up
+  art = compiled(dna, 'Foo')           # önbellekten ya da compile_artifact
+  art = compiled(snap(dna), 'Foo')     # hızlı mod: en yakın kafes noktası
+  vf  = compiled_variable(dna, 'Foo')  # wght variable TTF (compile_variable), aynı anahtar
+  warm_up()                            # kafesi arka planda derle (boşta kalınca)
+  with busy(): ...                     # canlı iş (HTTP isteği, toplu dönüşüm) → ısıtma bekler
+
+Kafes = her decoration × LATTICE_SW × LATTICE_DENSITY; deco_size_mul ve
+shapes decoration'ın heuristic varsayılanı. Her noktada statik font ve
+(VECTROD_LATTICE_WARM_VF açıksa) variable font ısıtılır. Isıtma glyph
+memo'yu da doldurur (VECTROD_GLYPH_CACHE verilmişse sıcak yeniden
+başlatma diskten gelir).
+
+Isıtma isteğe bağlı (nokta başına ~1.4 sn CPU, web süreciyle aynı GIL) ve
+yalnız boştayken çalışır: busy() içinde iş yokken ve son işten beri
+IDLE_GRACE sn geçmişse bir sonraki noktaya geçer.
+
+Ortam değişkenleri:
+  VECTROD_ARTIFACT_MAX     — bellekteki artifact sayısı (varsayılan 512; kafes = statik + VF)
+  VECTROD_LATTICE_SW       — '44,52,58,68,80'
+  VECTROD_LATTICE_DENSITY  — '0,0.4,0.6,0.8'  (her yoğunluk bandından bir değer)
+  VECTROD_LATTICE_WARM     — 1 → app açılışında kafesi boşta ısıt (varsayılan kapalı)
+  VECTROD_LATTICE_WARM_VF  — 1 → kafeste VF'ler de ısıtılır (varsayılan kapalı)
+  VECTROD_LATTICE_IDLE     — ısıtmadan önce beklenen sessizlik, sn (varsayılan 5)
+"""
+
+import os, json, time, threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from shape_library import shape_key
+
+ARTIFACT_MAX = int(os.environ.get('VECTROD_ARTIFACT_MAX', 512))
+LATTICE_SW = tuple(int(x) for x in os.environ.get('VECTROD_LATTICE_SW', '44,52,58,68,80').split(',') if x.strip())
+LATTICE_DENSITY = tuple(float(x) for x in
+                        os.environ.get('VECTROD_LATTICE_DENSITY', '0,0.4,0.6,0.8').split(',') if x.strip())
+LATTICE_WARM = os.environ.get('VECTROD_LATTICE_WARM', '0') == '1'
+LATTICE_WARM_VF = os.environ.get('VECTROD_LATTICE_WARM_VF', '0') == '1'
+IDLE_GRACE = float(os.environ.get('VECTROD_LATTICE_IDLE', 5))
+WARM_NAME = 'VectrodLattice'
+IDLE_WAIT = 0.5                         # canlı iş sürerken ısıtma bekler (sn)
+DENSITY_BANDS = (0.20, 0.50, 0.75)      # Deco.do_top / do_base / do_side eşikleri
+
+# decoration → (deco_size_mul, shapes) — vectrod_v3.dna_heuristic varsayılanları
+DECO_DEFAULTS = {
+    'floral':  (2.8, ('flower', 'leaf', 'petal')),
+    'cyber':   (2.2, ('lightning', 'diamond', 'hexagon')),
+    'gothic':  (2.4, ('crown_spike', 'diamond')),
+    'kawaii':  (2.4, ('heart', 'flower4', 'petal')),
+    'retro':   (1.8, ('diamond', 'arrow_right')),
+    'minimal': (1.0, ()),
+}
+
+_cache = OrderedDict()          # dna_key | 'vf|'+dna_key → FontArtifact
+_lock = threading.Lock()
+_active = 0                     # süren canlı iş sayısı (busy)
+_last_busy = 0.0                # son canlı işin bittiği an (monotonic)
+_warm_thread = None
+stats = {'hits': 0, 'misses': 0, 'warmed': 0}
+
+
+# ── ARTIFACT CACHE ───────────────────────────────────────────────
+
+def dna_key(dna):
+    """compile_artifact'in okuduğu DNA alanları → kanonik JSON anahtar (paket şekilleri içerik özetiyle)."""
+    shapes = dna.get('shapes')
+    return json.dumps([int(dna.get('stroke_weight', 44)), dna.get('decoration', 'minimal'),
+                       float(dna.get('density', 0.5)), float(dna.get('deco_size_mul', 2.2)),
+                       [shape_key(s) for s in shapes] if shapes is not None else None], separators=(',', ':'))
+
+
+def _store(key, art):
+    with _lock:
+        _cache[key] = art
+        _cache.move_to_end(key)
+        while len(_cache) > ARTIFACT_MAX:
+            _cache.popitem(last=False)
+
+
+def _vf_key(dna):
+    return 'vf|' + dna_key(dna)
+
+
+@contextmanager
+def busy():
+    """Canlı iş süresince ısıtmayı beklet (HTTP isteği, toplu dönüşüm, önbellek kaçırma)."""
+    global _active, _last_busy
+    with _lock:
+        _active += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _active -= 1
+            _last_busy = time.monotonic()
+
+
+def _idle():
+    with _lock:
+        return not _active and time.monotonic() - _last_busy >= IDLE_GRACE
+
+
+def _cached(key, dna, font_name, build, label):
+    with _lock:
+        art = _cache.get(key)
+        if art is not None:
+            _cache.move_to_end(key)
+            stats['hits'] += 1
+        else:
+            stats['misses'] += 1
+    if art is not None:
+        out = art.renamed(font_name)
+        out.stats['cached'] = True
+        print(f"  ⚡ {label} önbellek: {len(out.data)//1024}KB | sw={dna.get('stroke_weight')} "
+              f"deco={dna.get('decoration')} density={dna.get('density')}")
+        return out
+    with busy():
+        art = build()
+    _store(key, art)
+    return art
+
+
+def compiled(dna, font_name):
+    """DNA → FontArtifact. Önbellekte varsa derlenmez, yalnız yeniden adlandırılır."""
+    from vectrod_v3 import compile_artifact
+    return _cached(dna_key(dna), dna, font_name, lambda: compile_artifact(dna, font_name), 'v3')
+
+
+def compiled_variable(dna, font_name):
+    """DNA → variable FontArtifact (vectrod_v3.compile_variable), compiled() ile aynı önbellek kuralı."""
+    from vectrod_v3 import compile_variable
+    return _cached(_vf_key(dna), dna, font_name, lambda: compile_variable(dna, font_name), 'v3 VF')
+
+
+def cache_stats():
+    with _lock:
+        return {**stats, 'size': len(_cache), 'max': ARTIFACT_MAX}
+
+
+# ── DNA LATTICE ──────────────────────────────────────────────────
+
+def _band(v):
+    return sum(v >= t for t in DENSITY_BANDS)
+
+
+def _nearest(v, grid):
+    return min(grid, key=lambda g: (abs(g - v), g))
+
+
+def snap(dna):
+    """
+    DNA → en yakın kafes noktası (hızlı mod). Yoğunluk önce aynı eşik
+    bandında aranır — görünen dekorasyon katmanları değişmez. Gemini'nin
+    seçtiği shapes / deco_size_mul yerine decoration varsayılanı gelir.
+    """
+    deco = dna.get('decoration', 'minimal')
+    deco = deco if deco in DECO_DEFAULTS else 'minimal'
+    mul, shapes = DECO_DEFAULTS[deco]
+    dens = float(dna.get('density', 0.5))
+    grid = [g for g in LATTICE_DENSITY if _band(g) == _band(dens)] or LATTICE_DENSITY
+    return {'stroke_weight': _nearest(max(44, min(80, int(dna.get('stroke_weight', 44)))), LATTICE_SW),
+            'decoration': deco, 'density': _nearest(dens, grid),
+            'deco_size_mul': mul, 'shapes': list(shapes)}
+
+
+def lattice_points():
+    """Her decoration × LATTICE_SW × LATTICE_DENSITY → tekilleştirilmiş DNA listesi."""
+    seen, out = set(), []
+    for deco in DECO_DEFAULTS:
+        for sw in LATTICE_SW:
+            for dens in LATTICE_DENSITY:
+                dna = snap({'decoration': deco, 'stroke_weight': sw, 'density': dens})
+                key = dna_key(dna)
+                if key not in seen:
+                    seen.add(key)
+                    out.append(dna)
+    return out
+
+
+def _warm(points, variable=LATTICE_WARM_VF):
+    from vectrod_v3 import compile_artifact, compile_variable
+    t0, n = time.time(), 0
+    jobs = [(dna_key(d), d, compile_artifact) for d in points]
+    if variable:
+        jobs += [(_vf_key(d), d, compile_variable) for d in points]
+    for key, dna, build in jobs:
+        with _lock:
+            if key in _cache:
+                continue
+        while not _idle():              # canlı işler önce, sonra IDLE_GRACE sessizlik
+            time.sleep(IDLE_WAIT)
+        try:
+            _store(key, build(dna, WARM_NAME, verbose=False))
+            n += 1
+            with _lock:
+                stats['warmed'] += 1
+        except Exception as e:
+            print(f"  [lattice] {key}: {e}")
+    print(f"  [lattice] {n}/{len(jobs)} artifact ısıtıldı ({len(points)} DNA"
+          f"{' + VF' if variable else ''}, {time.time() - t0:.1f} sn)")
+
+
+def warm_up(points=None, background=True, variable=LATTICE_WARM_VF):
+    """Kafesi artifact önbelleğine derle (variable → VF'ler de). background=True → daemon thread (tek sefer)."""
+    global _warm_thread
+    points = lattice_points() if points is None else points
+    if not background:
+        _warm(points, variable)
+        return None
+    if _warm_thread is None or not _warm_thread.is_alive():
+        _warm_thread = threading.Thread(target=_warm, args=(points, variable), daemon=True, name='lattice-warm')
+        _warm_thread.start()
+    return _warm_thread
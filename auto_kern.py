@@ -0,0 +1,293 @@
+"""
+auto_kern.py — Yan profillerden otomatik kerning (GPOS 'kern')
+==============================================================
+Motorlar sabit yan boşluklarla glyph üretir; 'AV', 'To', 'L’' gibi çiftler
+açık kalır. Bu aşama derlenmiş fontun glyf tablosu üzerinde çalışır:
+
+  • her glyph'in sol/sağ mürekkep profili BANDS yüksekliğinde bir y ızgarasında
+    numpy dizisi olarak çıkarılır (quadratic konturlar t=0.5'te örneklenir)
+  • tüm çiftlerin en dar boşluğu tek bir (n, n, BANDS) işlemle hesaplanır
+  • referans glyph'lerin kendi yan boşluklarıdır (rsb + lsb); şeklin açtığı
+    fazla boşluk ('AV', 'To', 'T.') kısmen kapatılır — kern hep ≤ 0
+  • aynı kern satırı/sütunu taşıyan glyph'ler sınıflara toplanır
+    (sol: ilk glyph'in sağ yanı, sağ: ikinci glyph'in sol yanı)
+  • sınıf tabanlı PairPos (format 2) tek lookup ile GPOS 'kern' özelliğine yazılır
+
+  stats = kern_font(fb.font)      # setupGlyf + hmtx + aksanlardan sonra
+  → {'pairs', 'classes', 'class_pairs', 'ms'}
+
+v3 fontu (90 harf + aksanlı composite'ler) ~30–90 ms. MAX_GLYPHS üstü
+setler (CJK, ikon) atlanır. VECTROD_AUTOKERN=0 → kapalı.
+"""
+
+import os, time
+import numpy as np
+
+ENABLED    = os.environ.get('VECTROD_AUTOKERN', '1') != '0'
+BANDS      = 48       # y ızgarası
+REACH      = 0.03     # × UPM: komşu bantlar da değerlendirilir (dikey yakınlık)
+STRENGTH   = 0.5      # şeklin açtığı fazla boşluğun ne kadarı kapatılır
+MAX_KERN   = 0.12     # × UPM: en fazla sıkıştırma
+MIN_KERN   = 15       # font birimi: altındaki değerler yazılmaz
+CLASS_TOL  = 20       # font birimi: satırları bu kadar yakın glyph'ler aynı sınıf
+MAX_GLYPHS = 600      # daha büyük setler (CJK, ikon fontları) kernlenmez
+CHUNK      = 1 << 22  # pair_gaps: tek seferde işlenen (sol × sağ × bant) eleman
+
+
+# ── PROFİLLER ────────────────────────────────────────────────────────
+
+def _points(glyf, gn, cache):
+    """Glyph noktaları → (P (m, 2), on-curve (m,), kontur sonları); composite'ler numpy ile çözülür."""
+    if gn in cache:
+        return cache[gn]
+    g = glyf[gn]
+    if g.isComposite():
+        P, on, ends, base = [], [], [], 0
+        for c in g.components:
+            if hasattr(c, 'firstPt'):                           # nokta eşlemeli yerleşim: fontTools'a bırak
+                coords, e, flags = g.getCoordinates(glyf)
+                out = (np.asarray(coords, float).reshape(-1, 2),
+                       (np.frombuffer(bytes(flags), np.uint8) & 1).astype(bool), np.asarray(e, int))
+                cache[gn] = out
+                return out
+            p, o, e = _points(glyf, c.glyphName, cache)
+            if hasattr(c, 'transform'):
+                p = p @ np.asarray(c.transform, float)
+            P.append(p + (c.x, c.y))
+            on.append(o)
+            ends.append(e + base)
+            base += len(p)
+        out = ((np.concatenate(P), np.concatenate(on), np.concatenate(ends)) if P
+               else (np.zeros((0, 2)), np.zeros(0, bool), np.zeros(0, int)))
+    elif g.numberOfContours > 0:
+        out = (np.asarray(g.coordinates.array, float).reshape(-1, 2),
+               (np.frombuffer(bytes(g.flags), np.uint8) & 1).astype(bool),
+               np.asarray(g.endPtsOfContours, int))
+    else:
+        out = (np.zeros((0, 2)), np.zeros(0, bool), np.zeros(0, int))
+    cache[gn] = out
+    return out
+
+
+def _outline_edges(font, names):
+    """
+    Glyph'lerin konturları → kenarlar (E, 4): x0, y0, x1, y1 ve glyph indeksi (E,).
+    Tüm font tek seferde: quadratic off-curve noktalar eğrinin t=0.5 noktasına
+    taşınır, ardışık off'lar arasına örtük on-curve eklenir. Composite'ler çözülür.
+    """
+    glyf, cache = font['glyf'], {}
+    P, on, ends, gid, base = [], [], [], [], 0
+    for i, gn in enumerate(names):
+        p, o, e = _points(glyf, gn, cache)
+        if not len(e):
+            continue
+        P.append(p)
+        on.append(o)
+        ends.append(e + base)
+        gid.append(np.full(len(p), i))
+        base += len(p)
+    if not P:
+        return np.zeros((0, 4)), np.zeros(0, int)
+    P = np.concatenate(P)
+    on = np.concatenate(on)
+    ends, gid = np.concatenate(ends), np.concatenate(gid)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    size = ends - starts + 1
+    cs, ce = np.repeat(starts, size), np.repeat(ends, size)
+    idx = np.arange(len(P))
+    nxt = np.where(idx == ce, cs, idx + 1)
+    prv = np.where(idx == cs, ce, idx - 1)
+    keep = np.repeat(size >= 2, size)
+
+    p, pn, pp = P, P[nxt], P[prv]
+    a = np.where(on[prv][:, None], pp, (pp + p) / 2)           # önceki on-curve (örtük dahil)
+    b = np.where(on[nxt][:, None], pn, (pn + p) / 2)
+    v = np.where(on[:, None], p, 0.25 * a + 0.5 * p + 0.25 * b)
+    vn = v[nxt]
+    mid = ~on & ~on[nxt] & keep                                 # ardışık off'lar: örtük nokta
+    m = (p + pn) / 2
+    direct = keep & ~mid
+    E = np.vstack([np.hstack([v[direct], vn[direct]]),
+                   np.hstack([v[mid], m[mid]]),
+                   np.hstack([m[mid], vn[mid]])])
+    G = np.concatenate([gid[direct], gid[mid], gid[mid]])
+    return E, G
+
+
+def side_profiles(font, names, bands=BANDS):
+    """
+    → (L, R, ys): L/R (n, bands) sol/sağ mürekkep x'i (mürekkep yoksa +inf / -inf),
+    ys bant merkezleri.
+    """
+    n = len(names)
+    L, R = np.full((n, bands), np.inf), np.full((n, bands), -np.inf)
+    E, gid = _outline_edges(font, names)
+    if not len(E):
+        return L, R, np.zeros(bands)
+    lo, hi = min(E[:, 1].min(), E[:, 3].min()), max(E[:, 1].max(), E[:, 3].max())
+    step = (hi - lo) / bands or 1.0
+    ys = lo + (np.arange(bands) + 0.5) * step
+
+    # tarama çizgisi kesişimleri: (E, bands)
+    x0, y0, x1, y1 = E.T
+    ymin, ymax = np.minimum(y0, y1)[:, None], np.maximum(y0, y1)[:, None]
+    hit = (ymin <= ys) & (ymax > ys)
+    dy = np.where(y1 != y0, y1 - y0, 1.0)[:, None]
+    xs = x0[:, None] + (ys - y0[:, None]) * ((x1 - x0)[:, None] / dy)
+    rows = np.broadcast_to(gid[:, None], hit.shape)[hit]
+    cols = np.broadcast_to(np.arange(bands), hit.shape)[hit]
+    np.minimum.at(L, (rows, cols), xs[hit])
+    np.maximum.at(R, (rows, cols), xs[hit])
+
+    # köşe noktaları kendi bantlarına: tarama çizgileri arasındaki ince yatay parçalar
+    band = np.clip(((y0 - lo) / step).astype(int), 0, bands - 1)
+    np.minimum.at(L, (gid, band), x0)
+    np.maximum.at(R, (gid, band), x0)
+    return L, R, ys
+
+
+# ── ÇİFTLER ──────────────────────────────────────────────────────────
+
+def pair_gaps(L, R, adv, reach=1):
+    """
+    Tüm (sol, sağ) çiftleri için en dar yatay boşluk (n, n); dikeyde hiç
+    örtüşmeyen çiftler +inf. Sağ glyph'in profili ±reach bant genişletilir.
+    """
+    right = adv[:, None] - R                      # sol glyph'in sağ yan boşluğu (bant başına)
+    left = L.copy()
+    for k in range(1, reach + 1):                 # dikey yakınlık: komşu bantların en solu
+        left[:, k:] = np.minimum(left[:, k:], L[:, :-k])
+        left[:, :-k] = np.minimum(left[:, :-k], L[:, k:])
+    n = len(adv)
+    out = np.empty((n, n))
+    rows = max(1, CHUNK // max(1, n * L.shape[1]))      # bellek: satır blokları halinde
+    for i in range(0, n, rows):
+        out[i:i + rows] = (right[i:i + rows, None, :] + left[None, :, :]).min(-1)
+    return out
+
+
+def kern_matrix(gaps, rsb, lsb, upm=1000):
+    """
+    Boşluk matrisi → kern değerleri (n, n), tam sayı, ≤ 0.
+    Referans, glyph'lerin kendi yan boşluklarıdır (rsb[a] + lsb[b]): düz/yuvarlak
+    kenarlı çiftlerde en dar boşluk zaten budur → kern yok. Şeklin açtığı fazla
+    boşluk ('AV', 'To', 'T.') STRENGTH oranında kapatılır.
+    """
+    extra = gaps - (rsb[:, None] + lsb[None, :])
+    extra[~np.isfinite(extra)] = 0
+    k = np.rint(-STRENGTH * np.clip(extra, 0, MAX_KERN * upm / STRENGTH)).astype(int)
+    k[k > -MIN_KERN] = 0
+    return k
+
+
+def _classes(M, tol=CLASS_TOL):
+    """Satırları lider kümelemeyle sınıflara ayır → [[satır indeksleri]]; sıfır satırlar dışarıda."""
+    leaders, members = [], []
+    for i in np.flatnonzero(np.abs(M).max(1) > 0):
+        row = M[i]
+        if leaders:
+            d = np.abs(np.asarray(leaders) - row).max(1)
+            j = int(d.argmin())
+            if d[j] <= tol:
+                members[j].append(i)
+                continue
+        leaders.append(row)
+        members.append([i])
+    return members
+
+
+# ── GPOS ─────────────────────────────────────────────────────────────
+
+def _gpos(font, pairs):
+    from fontTools.ttLib import newTable
+    from fontTools.ttLib.tables import otTables as ot
+    from fontTools.otlLib.builder import buildPairPosClassesSubtable, buildLookup
+    sub = buildPairPosClassesSubtable(pairs, font.getReverseGlyphMap())
+    lookup = buildLookup([sub])
+
+    langsys = ot.LangSys()
+    langsys.LookupOrder, langsys.ReqFeatureIndex = None, 0xFFFF
+    langsys.FeatureIndex, langsys.FeatureCount = [0], 1
+    scripts = []
+    for tag in ('DFLT', 'latn'):
+        rec = ot.ScriptRecord()
+        rec.ScriptTag = tag
+        rec.Script = ot.Script()
+        rec.Script.DefaultLangSys, rec.Script.LangSysRecord, rec.Script.LangSysCount = langsys, [], 0
+        scripts.append(rec)
+    feat = ot.FeatureRecord()
+    feat.FeatureTag = 'kern'
+    feat.Feature = ot.Feature()
+    feat.Feature.FeatureParams, feat.Feature.LookupListIndex, feat.Feature.LookupCount = None, [0], 1
+
+    table = ot.GPOS()
+    table.Version = 0x00010000
+    table.ScriptList = ot.ScriptList()
+    table.ScriptList.ScriptRecord, table.ScriptList.ScriptCount = scripts, len(scripts)
+    table.FeatureList = ot.FeatureList()
+    table.FeatureList.FeatureRecord, table.FeatureList.FeatureCount = [feat], 1
+    table.LookupList = ot.LookupList()
+    table.LookupList.Lookup, table.LookupList.LookupCount = [lookup], 1
+    font['GPOS'] = newTable('GPOS')
+    font['GPOS'].table = table
+
+
+def _kern_set(font, glyphs=None):
+    """
+    Kernlenecek glyph'ler → (taban adlar, {taban: [türetilmiş adlar]}).
+    Aksanlı composite'ler ('Ö' = 'O' + işaret) kendi profilleriyle ölçülmez,
+    tabanlarının sınıfına girer; sıfır genişlikli işaretler dışarıda kalır.
+    """
+    glyf, hmtx = font['glyf'], font['hmtx']
+    names = [gn for gn in sorted(set(glyphs or (font.getBestCmap() or {}).values()), key=font.getGlyphID)
+             if hmtx[gn][0] > 0]
+    pool, derived = set(names), {}
+    for gn in names:
+        g = glyf[gn]
+        comp = g.components[0].glyphName if g.isComposite() else None
+        if comp in pool and comp != gn:
+            derived.setdefault(comp, []).append(gn)
+    nested = {gn for v in derived.values() for gn in v}
+    for comp in [c for c in derived if c in nested]:            # composite'in composite'i
+        derived.setdefault(next(b for b, v in derived.items() if comp in v), []).extend(derived.pop(comp))
+    return [gn for gn in names if gn not in nested], derived
+
+
+def kern_font(font, upm=None, glyphs=None):
+    """
+    Fonta sınıf tabanlı GPOS kern ekle. glyphs: kernlenecek glyph adları
+    (varsayılan: cmap'teki tüm glyph'ler — gizli deco/.base bileşenleri hariç).
+    → {'pairs', 'classes', 'class_pairs', 'ms'} (+ 'skipped': glyph sayısı MAX_GLYPHS'ı aşarsa)
+    """
+    from fontTools.otlLib.builder import buildValue
+    t0 = time.perf_counter()
+    upm = upm or font['head'].unitsPerEm
+    names, derived = _kern_set(font, glyphs)
+    stats = {'pairs': 0, 'classes': [0, 0], 'class_pairs': 0}
+    if len(names) > MAX_GLYPHS:
+        stats['skipped'] = len(names)
+    elif len(names) > 1:
+        L, R, ys = side_profiles(font, names)
+        adv = np.array([font['hmtx'][gn][0] for gn in names], float)
+        step = ys[1] - ys[0] if len(ys) > 1 else upm
+        gaps = pair_gaps(L, R, adv, max(1, int(round(REACH * upm / step))))
+        K = kern_matrix(gaps, adv - R.max(1), L.min(1), upm)
+        left, right = _classes(K), _classes(K.T)
+        # sınıf çifti değeri = blok ortalaması: üyelik matrisleriyle tek çarpım
+        A = np.zeros((len(left), len(names)))
+        B = np.zeros((len(right), len(names)))
+        for c, idx in enumerate(left):
+            A[c, idx] = 1 / len(idx)
+        for c, idx in enumerate(right):
+            B[c, idx] = 1 / len(idx)
+        V = np.rint(A @ K @ B.T).astype(int)
+        members = lambda idx: tuple(gn for i in idx for gn in [names[i]] + derived.get(names[i], []))
+        lg, rg = [members(c) for c in left], [members(c) for c in right]
+        pairs = {(lg[c1], rg[c2]): (buildValue({'XAdvance': int(V[c1, c2])}), None)
+                 for c1, c2 in zip(*np.nonzero(V <= -MIN_KERN))}
+        if pairs:
+            _gpos(font, pairs)
+        stats = {'pairs': int(np.count_nonzero(K)), 'classes': [len(left), len(right)],
+                 'class_pairs': len(pairs)}
+    stats['ms'] = round((time.perf_counter() - t0) * 1000, 1)
+    return stats
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_engine.py — engine.build_font büyük karakter setlerinde
+===============================================================
+Sentetik bir SVG sayfası (N glyph, CJK aralığı U+4E00..) üretir, build_font'u
+ayrı bir süreçte çalıştırır ve süre + tepe RSS ölçer:
+
+  python bench_engine.py                 # 1000, 5000, 10000
+  python bench_engine.py 2000 20000
+  python bench_engine.py --workers 4 5000
+
+Hedefler (tek çekirdek): 10k glyph < 15 sn, tepe RSS < 100 MB.
+Ölçülen (1d15bde, 1 çekirdek Xeon, Python 3.11): 1k 1.0 sn / 47 MB,
+5k 4.9 sn / 59 MB, 10k 9.4-10.5 sn / 76 MB (4e78078 öncesi 10k: 9.7 sn / 115 MB).
+"""
+
+import os, sys, time, json, random, resource, subprocess, tempfile
+
+CJK_START = 0x4E00
+COLS = 100
+CELL = 120
+
+
+def make_sheet(n, seed=7):
+    """N glyph'lik SVG: her glyph translate'li bir <g>, içinde cubic dış kontur + iç delik."""
+    rnd = random.Random(seed)
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" '
+           f'viewBox="0 0 {COLS * CELL} {((n + COLS - 1) // COLS) * CELL}">']
+    for i in range(n):
+        x, y = (i % COLS) * CELL, (i // COLS) * CELL
+        w, h = rnd.uniform(50, 90), rnd.uniform(70, 100)
+        k = rnd.uniform(8, 20)
+        outer = (f"M{k:.2f} 0H{w - k:.2f}C{w - k / 2:.2f} 0 {w:.2f} {k / 2:.2f} {w:.2f} {k:.2f}"
+                 f"V{h - k:.2f}C{w:.2f} {h - k / 2:.2f} {w - k / 2:.2f} {h:.2f} {w - k:.2f} {h:.2f}"
+                 f"H{k:.2f}C{k / 2:.2f} {h:.2f} 0 {h - k / 2:.2f} 0 {h - k:.2f}"
+                 f"V{k:.2f}C0 {k / 2:.2f} {k / 2:.2f} 0 {k:.2f} 0Z")
+        cx, cy, r = w / 2, h / 2, min(w, h) / 4
+        c = r * 0.5523
+        inner = (f"M{cx:.2f} {cy - r:.2f}C{cx - c:.2f} {cy - r:.2f} {cx - r:.2f} {cy - c:.2f} {cx - r:.2f} {cy:.2f}"
+                 f"C{cx - r:.2f} {cy + c:.2f} {cx - c:.2f} {cy + r:.2f} {cx:.2f} {cy + r:.2f}"
+                 f"C{cx + c:.2f} {cy + r:.2f} {cx + r:.2f} {cy + c:.2f} {cx + r:.2f} {cy:.2f}"
+                 f"C{cx + r:.2f} {cy - c:.2f} {cx + c:.2f} {cy - r:.2f} {cx:.2f} {cy - r:.2f}Z")
+        out.append(f'<g transform="translate({x},{y})"><path d="{outer}{inner}"/></g>')
+    out.append('</svg>')
+    return '\n'.join(out).encode('utf-8')
+
+
+def run_one(n, workers=None):
+    """Bu süreçte tek ölçüm → {'glyphs', 'seconds', 'peak_rss_mb', 'ttf_kb', 'loca'}"""
+    import io, contextlib
+    from engine import build_font
+    from fontTools.ttLib import TTFont
+    svg = make_sheet(n)
+    chars = [chr(CJK_START + i) for i in range(n)]
+    out_dir = tempfile.mkdtemp(prefix='vectrod-bench-')
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ttf, _ = build_font(svg, 'Bench', out_dir, char_order=chars, web=(), workers=workers)
+    dt = time.perf_counter() - t0
+    font = TTFont(ttf, lazy=True)
+    res = {'glyphs': len(font.getGlyphOrder()) - 2, 'seconds': round(dt, 2),
+           'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+           'ttf_kb': os.path.getsize(ttf) // 1024, 'loca': font['head'].indexToLocFormat}
+    font.close()
+    return res
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    if args and args[0] == '--one':
+        print(json.dumps(run_one(int(args[1]), workers)))
+        sys.exit(0)
+    sizes = [int(a) for a in args] or [1000, 5000, 10000]
+    print(f"{'glyph':>7} {'süre(sn)':>9} {'RSS(MB)':>8} {'TTF(KB)':>8} {'loca':>5}")
+    for n in sizes:
+        cmd = [sys.executable, os.path.abspath(__file__), '--one', str(n)]
+        if workers:
+            cmd += ['--workers', str(workers)]
+        r = json.loads(subprocess.check_output(cmd, cwd=os.path.dirname(os.path.abspath(__file__))))
+        print(f"{r['glyphs']:>7} {r['seconds']:>9} {r['peak_rss_mb']:>8} {r['ttf_kb']:>8} "
+              f"{'long' if r['loca'] else 'short':>5}")
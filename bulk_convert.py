@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+bulk_convert.py — Toplu SVG → Font dönüştürücü
+===============================================
+Bir klasördeki (CLI) veya bir zip içindeki (HTTP) tüm SVG'leri
+engine.build_font ile paralel olarak fonta çevirir.
+
+  • Her SVG × her stil = bir iş (job), işler CPU çekirdeklerine dağıtılır
+    (spawn süreçleri: thread'li sunucudan fork kilit kalıtıp kilitlenmesin)
+  • Çıktı: fontlar + manifest.json içeren zip (akış halinde yazılır)
+  • manifest.json: dosya başına süre, glyph sayıları ve hatalar
+
+Kullanım:
+  python3 bulk_convert.py ./svgler --styles regular,bold --output fonts.zip
+  python3 engine.py ./svgler --styles regular,italic        # aynı mod
+"""
+
+import os, io, re, sys, json, time, zipfile, tempfile, contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+# stil adı → (bold, italic)
+STYLES = {
+    'regular':    (False, False),
+    'bold':       (True,  False),
+    'italic':     (False, True),
+    'bolditalic': (True,  True),
+}
+
+MAX_ZIP_SVGS = 500          # HTTP yüklemesinde işlenecek en fazla SVG
+MAX_SVG_BYTES = 20 * 1024 * 1024
+
+
+def parse_styles(spec):
+    """'regular,bold' / ['Bold Italic'] → ['regular', 'bold', ...] (geçersizler atlanır)."""
+    if not spec:
+        return ['regular']
+    if isinstance(spec, str):
+        spec = re.split(r'[,\s;]+', spec)
+    out = []
+    for s in spec:
+        key = re.sub(r'[^a-z]', '', str(s).lower())
+        if key in STYLES and key not in out:
+            out.append(key)
+    return out or ['regular']
+
+
+def font_name_for(filename, prefix=''):
+    """'logo harfler.svg' → 'LogoHarfler' (prefix varsa başa eklenir)."""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    words = [w for w in re.split(r'[^0-9A-Za-z]+', stem) if w]
+    name = ''.join(w[:1].upper() + w[1:] for w in words)[:32] or 'CustomFont'
+    return f"{prefix}{name}" if prefix else name
+
+
+def _convert_job(job):
+    """
+    Worker süreçte tek bir (svg, stil) işi. engine.build_font'u geçici bir
+    klasörde çalıştırır, çıktıları bayt olarak döndürür (süreçler arası taşınır).
+    """
+    src, svg_bytes, font_name, style, char_order = job
+    bold, italic = STYLES[style]
+    t0 = time.time()
+    res = {'source': src, 'style': style, 'font_name': font_name,
+           'files': [], 'elapsed_sec': 0.0, 'error': None}
+    try:
+        from engine import build_font
+        with tempfile.TemporaryDirectory(prefix='bulk_') as tmp:
+            svg_path = os.path.join(tmp, 'input.svg')
+            with open(svg_path, 'wb') as f:
+                f.write(svg_bytes)
+            out_dir = os.path.join(tmp, 'output')
+            # build_font çok konuşkan — toplu modda log'u yut
+            with contextlib.redirect_stdout(io.StringIO()):
+                ttf_path, otf_path = build_font(svg_path, font_name, out_dir,
+                                                char_order=char_order,
+                                                bold=bold, italic=italic, web=())
+            if not ttf_path:
+                raise RuntimeError("SVG'de path bulunamadı")
+            for fp in (ttf_path, otf_path):
+                if fp and os.path.exists(fp):
+                    with open(fp, 'rb') as f:
+                        res['files'].append((os.path.basename(fp), f.read()))
+            map_path = ttf_path[:-4] + '_mapping.json'
+            if os.path.exists(map_path):
+                with open(map_path, encoding='utf-8') as f:
+                    m = json.load(f)
+                res['glyphs'] = m.get('success', 0)
+                res['failed_glyphs'] = m.get('failed', 0)
+                res['style_name'] = m.get('style')
+    except Exception as e:
+        res['error'] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+    res['elapsed_sec'] = round(time.time() - t0, 3)
+    return res
+
+
+def make_jobs(svg_items, styles, prefix='', char_order=None):
+    """svg_items: [(kaynak_adı, bytes)] → worker iş listesi."""
+    jobs, used = [], set()
+    for src, data in svg_items:
+        name = font_name_for(src, prefix)
+        base, n = name, 2
+        while name in used:                # aynı isimli iki dosya çakışmasın
+            name = f"{base}{n}"; n += 1
+        used.add(name)
+        for style in styles:
+            jobs.append((src, data, name, style, char_order))
+    return jobs
+
+
+def run_jobs(jobs, workers=None, isolate=False):
+    """
+    İşleri süreç havuzunda çalıştır; tamamlandıkça sonuç üret (generator).
+    isolate=True → tek worker'da bile ayrı süreç (sunucu: GIL'i istek thread'lerine bırak).
+    """
+    if not jobs:
+        return
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1 and not isolate:
+        for job in jobs:
+            yield _convert_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        futures = [pool.submit(_convert_job, j) for j in jobs]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def write_bulk_zip(svg_items, fileobj, styles=None, workers=None,
+                   prefix='', char_order=None, skipped=None, progress=None, isolate=False):
+    """
+    Tüm SVG'leri dönüştürüp fileobj'a zip olarak yaz.
+    fileobj seek desteklemese de olur (HTTP soketi) — her font hazır olduğu
+    anda zip'e eklenir, manifest.json en sona yazılır. Manifest'i döndürür.
+    progress: her iş bitince progress(biten, toplam, ok, hata) çağrılır.
+    """
+    styles = parse_styles(styles)
+    jobs = make_jobs(svg_items, styles, prefix, char_order)
+    workers = max(1, min(workers or os.cpu_count() or 1, max(1, len(jobs))))
+    t0 = time.time()
+    manifest = {
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'sources': len(svg_items), 'styles': styles,
+        'jobs': len(jobs), 'workers': workers,
+        'fonts': [], 'failures': list(skipped or []),
+    }
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for n, res in enumerate(run_jobs(jobs, workers, isolate), 1):
+            entry = {k: res[k] for k in ('source', 'style', 'font_name', 'elapsed_sec')}
+            if res['error']:
+                entry['error'] = res['error']
+                manifest['failures'].append(entry)
+                print(f"  ✗ {res['source']} [{res['style']}] {res['error']}")
+                if progress:
+                    progress(n, len(jobs), len(manifest['fonts']), len(manifest['failures']))
+                continue
+            entry['outputs'] = []
+            for fname, data in res['files']:
+                arc = f"{res['font_name']}/{fname}"
+                zf.writestr(arc, data)
+                entry['outputs'].append(arc)
+            entry['glyphs'] = res.get('glyphs')
+            entry['failed_glyphs'] = res.get('failed_glyphs')
+            manifest['fonts'].append(entry)
+            print(f"  ✓ {res['source']} [{res['style']}] {res['elapsed_sec']}s")
+            if progress:
+                progress(n, len(jobs), len(manifest['fonts']), len(manifest['failures']))
+        manifest['total_sec'] = round(time.time() - t0, 3)
+        manifest['ok'] = len(manifest['fonts'])
+        manifest['failed'] = len(manifest['failures'])
+        zf.writestr('manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2))
+    return manifest
+
+
+def svgs_from_directory(src_dir):
+    """Klasördeki .svg dosyaları (alt klasörler dahil, sıralı)."""
+    items = []
+    for root, _, names in os.walk(src_dir):
+        for n in sorted(names):
+            if n.lower().endswith('.svg'):
+                p = os.path.join(root, n)
+                with open(p, 'rb') as f:
+                    items.append((os.path.relpath(p, src_dir), f.read()))
+    items.sort(key=lambda it: it[0])
+    return items
+
+
+def svgs_from_zip(zip_bytes):
+    """
+    Yüklenen zip'ten SVG'leri çıkar. Dönen: (items, skipped)
+    __MACOSX / gizli dosyalar ve aşırı büyük girdiler atlanır.
+    """
+    items, skipped = [], []
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            base = os.path.basename(name)
+            if info.is_dir() or not base.lower().endswith('.svg'):
+                continue
+            if name.startswith('__MACOSX/') or base.startswith('.'):
+                continue
+            if info.file_size > MAX_SVG_BYTES:
+                skipped.append({'source': name, 'error': 'file too large'})
+                continue
+            if len(items) >= MAX_ZIP_SVGS:
+                skipped.append({'source': name, 'error': f'limit of {MAX_ZIP_SVGS} SVGs reached'})
+                continue
+            items.append((name, zf.read(info)))
+    return items, skipped
+
+
+def convert_directory(src_dir, out_zip, styles=None, workers=None, prefix=''):
+    """CLI girişi: klasör → zip dosyası. Manifest'i döndürür."""
+    items = svgs_from_directory(src_dir)
+    print(f"\n{'='*52}")
+    print(f"  Toplu dönüşüm: {len(items)} SVG × {len(parse_styles(styles))} stil")
+    print(f"  Kaynak : {src_dir}")
+    print(f"  Çıktı  : {out_zip}")
+    print(f"{'='*52}\n")
+    os.makedirs(os.path.dirname(os.path.abspath(out_zip)), exist_ok=True)
+    with open(out_zip, 'wb') as f:
+        manifest = write_bulk_zip(items, f, styles, workers, prefix)
+    print(f"\n  ✅ {manifest['ok']} font  ✗ {manifest['failed']} hata  "
+          f"| {manifest['total_sec']}s | {manifest['workers']} süreç\n")
+    return manifest
+
+
+def main(argv=None):
+    import argparse
+    p = argparse.ArgumentParser(description='Klasördeki tüm SVG\'leri fonta çevir')
+    p.add_argument('src', help='SVG klasörü')
+    p.add_argument('--output', default='./output/fonts.zip', help='çıktı zip yolu')
+    p.add_argument('--styles', default='regular', help='regular,bold,italic,bolditalic')
+    p.add_argument('--workers', type=int, default=None, help='süreç sayısı (varsayılan: çekirdek sayısı)')
+    p.add_argument('--prefix', default='', help='font adlarının önüne eklenecek metin')
+    args = p.parse_args(argv)
+    manifest = convert_directory(args.src, args.output, args.styles, args.workers, args.prefix)
+    return 0 if manifest['ok'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
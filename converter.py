@@ -70,27 +70,25 @@ def get_svg_viewbox(root):
 
 def find_character_glyphs(svg_file):
     """
-    SVG'deki karakterleri bul.
-    Strateji: SVG'deki text/label elementlerini veya grup isimlerini kullan,
-    yoksa sıralı olarak karakterlere ata.
+    SVG'deki karakterleri bul → (root, groups, text_elems).
+    Karakter başına translate'li <g> varsa onlar, yoksa (düzleştirilmiş
+    export) path'ler geometriye göre glyph'lere kümelenir (svg_cluster).
+    groups okuma sırasındadır: satırlar yukarıdan aşağıya, soldan sağa.
     """
+    from engine import collect_groups, sort_groups
     tree = etree.parse(svg_file)
     root = tree.getroot()
     ns = 'http://www.w3.org/2000/svg'
-    
-    glyphs = {}
-    
-    # Önce grupları kontrol et - Canva genelde her karakteri grupta export eder
-    groups = []
-    for elem in root.iter('{%s}g' % ns):
-        label = elem.get('id', '') or elem.get('{http://www.inkscape.org/namespaces/inkscape}label', '')
-        paths_in_group = list(elem.iter('{%s}path' % ns))
-        if paths_in_group:
-            groups.append({'label': label, 'elem': elem, 'paths': paths_in_group})
-    
+
+    groups = sort_groups(collect_groups(root))
+    for g in groups:
+        elem = g.get('elem')
+        g['label'] = '' if elem is None else (
+            elem.get('id', '') or elem.get('{http://www.inkscape.org/namespaces/inkscape}label', ''))
+
     # Text elementlerini bul (karakter etiketleri için)
     text_elems = list(root.iter('{%s}text' % ns))
-    
+
     return root, groups, text_elems
 
 
@@ -15,11 +15,15 @@ Design DNA → glyph features:
 UPM=1000, CAP=700, XH=480, BASE=0, DESC=-150
 fill-rule=evenodd → inline grooves cut through stroke automatically
 """
-import math, io, os
+import math
 from fontTools.fontBuilder import FontBuilder
 from fontTools.pens.ttGlyphPen  import TTGlyphPen
 from fontTools.pens.cu2quPen    import Cu2QuPen
-from fontTools.svgLib.path      import SVGPath as SVGPathLib
+from pen_path import PenPath, join, draw_path, resolve_paths
+from geom_kernel import capsule_spec, arc_spec, arc_segments
+from webfonts import WEB_FORMATS
+from outline_simplify import Simplifier, TOLERANCE as SIMPLIFY_TOL
+from outline_union import Union, ENABLED as REMOVE_OVERLAP
 
 # ── CONSTANTS ────────────────────────────────────────────────────
 UPM  = 1000
@@ -31,7 +35,8 @@ K    = 0.5523   # bezier circle constant
 
 # ── HELPERS ──────────────────────────────────────────────────────
 def _j(*parts):
-    return " ".join(p for p in parts if p and p.strip())
+    """Parçaları tek PenPath'te birleştir (boşlar atlanır)."""
+    return join(*parts)
 
 class CyberGlyphBuilder:
     """
@@ -70,6 +75,10 @@ class CyberGlyphBuilder:
 
         self.decorations = dna.get('decorations', [])
         self.dna = dna
+        # components=True → _place_decos yerleşimi kaydeder, build_from_dna
+        # her (shape,size,angle) için tek gizli glyph üretir
+        self.components = False
+        self.placed     = []
 
     # ── PRIMITIVE STROKES ─────────────────────────────────────────
 
@@ -78,65 +87,32 @@ class CyberGlyphBuilder:
         if sw is None: sw = self.sw
         sw = max(4, sw)
         if sharp is None: sharp = self.sharp
-        dx, dy = x2-x1, y2-y1
-        ln = math.hypot(dx, dy)
-        if ln < 1: return ""
-        nx, ny = -dy/ln*(sw/2),  dx/ln*(sw/2)
-        ux, uy =  dx/ln*(sw/2),  dy/ln*(sw/2)
-
-        if sharp:
-            # Sharp diagonal cut: parallelogram shape
-            return (
-                f"M{x1+nx:.1f},{y1+ny:.1f} "
-                f"L{x2+nx:.1f},{y2+ny:.1f} "
-                f"L{x2-nx:.1f},{y2-ny:.1f} "
-                f"L{x1-nx:.1f},{y1-ny:.1f} Z"
-            )
-        else:
-            # Round caps
-            return (
-                f"M{x1+nx:.1f},{y1+ny:.1f} "
-                f"L{x2+nx:.1f},{y2+ny:.1f} "
-                f"C{x2+nx+ux*K:.1f},{y2+ny+uy*K:.1f} "
-                f"{x2+ux+nx*K:.1f},{y2+uy+ny*K:.1f} "
-                f"{x2+ux:.1f},{y2+uy:.1f} "
-                f"C{x2+ux-nx*K:.1f},{y2+uy-ny*K:.1f} "
-                f"{x2-nx+ux*K:.1f},{y2-ny+uy*K:.1f} "
-                f"{x2-nx:.1f},{y2-ny:.1f} "
-                f"L{x1-nx:.1f},{y1-ny:.1f} "
-                f"C{x1-nx-ux*K:.1f},{y1-ny-uy*K:.1f} "
-                f"{x1-ux-nx*K:.1f},{y1-uy-ny*K:.1f} "
-                f"{x1-ux:.1f},{y1-uy:.1f} "
-                f"C{x1-ux+nx*K:.1f},{y1-uy+ny*K:.1f} "
-                f"{x1+nx-ux*K:.1f},{y1+ny-uy*K:.1f} "
-                f"{x1+nx:.1f},{y1+ny:.1f} Z"
-            )
+        if math.hypot(x2-x1, y2-y1) < 1: return PenPath()
+        # sharp → paralelkenar (çapraz kesik uçlar), değilse yuvarlak kapaklı kapsül
+        return PenPath().band(capsule_spec(x1, y1, x2, y2, sw, K, sharp=sharp))
 
     def _slab(self, cx, y, sw=None):
         """Rectangular slab serif at (cx, y)."""
-        if self.slab_r <= 0: return ""
+        if self.slab_r <= 0: return PenPath()
         if sw is None: sw = self.sw
         sh  = max(6, int(sw * self.slab_r))
         sw2 = int(sw * self.slab_w)
         x1, x2 = cx - sw2//2, cx + sw2//2
         if self.rounded:
             r = min(sh//2, 4)
-            return (
-                f"M{x1+r:.1f},{y:.1f} L{x2-r:.1f},{y:.1f} "
-                f"C{x2:.1f},{y:.1f} {x2:.1f},{y:.1f} {x2:.1f},{y-r:.1f} "
-                f"L{x2:.1f},{y-sh+r:.1f} "
-                f"C{x2:.1f},{y-sh:.1f} {x2:.1f},{y-sh:.1f} {x2-r:.1f},{y-sh:.1f} "
-                f"L{x1+r:.1f},{y-sh:.1f} "
-                f"C{x1:.1f},{y-sh:.1f} {x1:.1f},{y-sh:.1f} {x1:.1f},{y-sh+r:.1f} "
-                f"L{x1:.1f},{y-r:.1f} "
-                f"C{x1:.1f},{y:.1f} {x1:.1f},{y:.1f} {x1+r:.1f},{y:.1f} Z"
-            )
-        return (f"M{x1:.1f},{y:.1f} L{x2:.1f},{y:.1f} "
-                f"L{x2:.1f},{y-sh:.1f} L{x1:.1f},{y-sh:.1f} Z")
+            return (PenPath().M(x1+r, y).L(x2-r, y)
+                    .C(x2, y, x2, y, x2, y-r)
+                    .L(x2, y-sh+r)
+                    .C(x2, y-sh, x2, y-sh, x2-r, y-sh)
+                    .L(x1+r, y-sh)
+                    .C(x1, y-sh, x1, y-sh, x1, y-sh+r)
+                    .L(x1, y-r)
+                    .C(x1, y, x1, y, x1+r, y).Z())
+        return PenPath().poly([(x1, y), (x2, y), (x2, y-sh), (x1, y-sh)])
 
     def _inline_groove(self, x1, y1, x2, y2, sw=None):
         """Thin engraved line through center of stroke (evenodd punches hole)."""
-        if self.inline_r <= 0: return ""
+        if self.inline_r <= 0: return PenPath()
         if sw is None: sw = self.sw
         groove_w = max(3, int(sw * self.inline_r))
         return self._stroke(x1, y1, x2, y2, groove_w, sharp=True)
@@ -144,52 +120,29 @@ class CyberGlyphBuilder:
     def _oval(self, cx, cy, rx, ry):
         """Filled ellipse (outer bowl)."""
         kx, ky = rx*K, ry*K
-        return (
-            f"M{cx:.1f},{cy-ry:.1f} "
-            f"C{cx+kx:.1f},{cy-ry:.1f} {cx+rx:.1f},{cy-ky:.1f} {cx+rx:.1f},{cy:.1f} "
-            f"C{cx+rx:.1f},{cy+ky:.1f} {cx+kx:.1f},{cy+ry:.1f} {cx:.1f},{cy+ry:.1f} "
-            f"C{cx-kx:.1f},{cy+ry:.1f} {cx-rx:.1f},{cy+ky:.1f} {cx-rx:.1f},{cy:.1f} "
-            f"C{cx-rx:.1f},{cy-ky:.1f} {cx-kx:.1f},{cy-ry:.1f} {cx:.1f},{cy-ry:.1f} Z"
-        )
+        return (PenPath().M(cx, cy-ry)
+                .C(cx+kx, cy-ry, cx+rx, cy-ky, cx+rx, cy)
+                .C(cx+rx, cy+ky, cx+kx, cy+ry, cx, cy+ry)
+                .C(cx-kx, cy+ry, cx-rx, cy+ky, cx-rx, cy)
+                .C(cx-rx, cy-ky, cx-kx, cy-ry, cx, cy-ry).Z())
 
     def _counter(self, cx, cy, rx, ry):
         """Counter-clockwise hole (evenodd punch)."""
         kx, ky = rx*K, ry*K
-        return (
-            f"M{cx:.1f},{cy-ry:.1f} "
-            f"C{cx-kx:.1f},{cy-ry:.1f} {cx-rx:.1f},{cy-ky:.1f} {cx-rx:.1f},{cy:.1f} "
-            f"C{cx-rx:.1f},{cy+ky:.1f} {cx-kx:.1f},{cy+ry:.1f} {cx:.1f},{cy+ry:.1f} "
-            f"C{cx+kx:.1f},{cy+ry:.1f} {cx+rx:.1f},{cy+ky:.1f} {cx+rx:.1f},{cy:.1f} "
-            f"C{cx+rx:.1f},{cy-ky:.1f} {cx+kx:.1f},{cy-ry:.1f} {cx:.1f},{cy-ry:.1f} Z"
-        )
+        return (PenPath().M(cx, cy-ry)
+                .C(cx-kx, cy-ry, cx-rx, cy-ky, cx-rx, cy)
+                .C(cx-rx, cy+ky, cx-kx, cy+ry, cx, cy+ry)
+                .C(cx+kx, cy+ry, cx+rx, cy+ky, cx+rx, cy)
+                .C(cx+rx, cy-ky, cx+kx, cy-ry, cx, cy-ry).Z())
 
     def _arc(self, cx, cy, rx, ry, a1d, a2d, sw=None):
         """Thick arc stroke (polygon approx)."""
         if sw is None: sw = self.sw
         sw = max(4, sw)
-        N = 20
         a1 = math.radians(a1d); a2 = math.radians(a2d)
         while a2 <= a1: a2 += 2*math.pi
-        pts = [(cx+rx*math.cos(a1+(a2-a1)*i/N),
-                cy+ry*math.sin(a1+(a2-a1)*i/N)) for i in range(N+1)]
-        half = sw/2
-        outer, inner = [], []
-        for i, (px, py) in enumerate(pts):
-            if i == 0: ddx, ddy = pts[1][0]-px, pts[1][1]-py
-            elif i == len(pts)-1: ddx, ddy = px-pts[-2][0], py-pts[-2][1]
-            else: ddx, ddy = pts[i+1][0]-pts[i-1][0], pts[i+1][1]-pts[i-1][1]
-            ln = math.hypot(ddx, ddy) or 0.001
-            nx2, ny2 = -ddy/ln*half, ddx/ln*half
-            outer.append((px+nx2, py+ny2))
-            inner.append((px-nx2, py-ny2))
-
-        parts = [f"M{outer[0][0]:.1f},{outer[0][1]:.1f}"]
-        for p in outer[1:]: parts.append(f"L{p[0]:.1f},{p[1]:.1f}")
-        i_end = inner[-1]
-        parts.append(f"L{i_end[0]:.1f},{i_end[1]:.1f}")
-        for p in reversed(inner[:-1]): parts.append(f"L{p[0]:.1f},{p[1]:.1f}")
-        parts.append("Z")
-        return " ".join(parts)
+        N = arc_segments(rx, ry, a2-a1, sw, 20)
+        return PenPath().band(arc_spec(cx, cy, rx, ry, a1, a2, sw, N))
 
     # ── DECORATION SHAPES ─────────────────────────────────────────
 
@@ -262,7 +215,7 @@ class CyberGlyphBuilder:
         elif name == 'flower':
             # Soft flower fallback for non-cyber modes
             petals = 5; inner_r = size*0.18; outer_r = size*0.48
-            parts = []
+            path = PenPath()
             for i in range(petals):
                 a_mid  = 2*math.pi*i/petals - math.pi/2 + a
                 spread = math.pi/petals * 0.78
@@ -276,11 +229,10 @@ class CyberGlyphBuilder:
                 cp2x = tx+(b2x-tx)*0.45+(b2y-ty)*side
                 cp2y = ty+(b2y-ty)*0.45-(b2x-tx)*side
                 mid_x = (b1x+b2x)/2*0.8; mid_y = (b1y+b2y)/2*0.8
-                if i==0: parts.append(f"M{b1x:.1f},{b1y:.1f}")
-                parts.append(f"C{cp1x:.1f},{cp1y:.1f} {cp2x:.1f},{cp2y:.1f} {tx:.1f},{ty:.1f}")
-                parts.append(f"C{cp2x:.1f},{cp2y:.1f} {mid_x:.1f},{mid_y:.1f} {b2x:.1f},{b2y:.1f}")
-            parts.append("Z")
-            return " ".join(parts)
+                if i==0: path.M(b1x, b1y)
+                path.C(cp1x, cp1y, cp2x, cp2y, tx, ty)
+                path.C(cp2x, cp2y, mid_x, mid_y, b2x, b2y)
+            return path.Z()
 
         elif name == 'leaf':
             h = size*0.62; w = size*0.24
@@ -288,9 +240,9 @@ class CyberGlyphBuilder:
             tip  = r2(h,0); base = r2(-h*0.12,0)
             cl1  = r2(h*0.55, w*0.90); cl2 = r2(-h*0.05, w*0.65)
             cr1  = r2(h*0.55,-w*0.90); cr2 = r2(-h*0.05,-w*0.65)
-            return (f"M{tip[0]:.1f},{tip[1]:.1f} "
-                    f"C{cl1[0]:.1f},{cl1[1]:.1f} {cl2[0]:.1f},{cl2[1]:.1f} {base[0]:.1f},{base[1]:.1f} "
-                    f"C{cr2[0]:.1f},{cr2[1]:.1f} {cr1[0]:.1f},{cr1[1]:.1f} {tip[0]:.1f},{tip[1]:.1f} Z")
+            return (PenPath().M(*tip)
+                    .C(*cl1, *cl2, *base)
+                    .C(*cr2, *cr1, *tip).Z())
 
         elif name == 'crown_spike':
             # Gothic spike
@@ -329,6 +281,9 @@ class CyberGlyphBuilder:
             ax, ay = self._anchor_pos(char, adv, anchor_type)
             if ax is None:
                 continue
+            if self.components:
+                self.placed.append(((shape, int(round(size)), angle), ax, ay))
+                continue
             deco = self._deco_shape(shape, ax, ay, size, angle)
             if deco:
                 parts.append(deco)
@@ -365,7 +320,7 @@ class CyberGlyphBuilder:
     # ── GLYPH BUILDER ─────────────────────────────────────────────
 
     def build_glyph(self, char: str, char_idx: int = 0):
-        """Returns (svg_path, advance_width) for a character."""
+        """Returns (PenPath, advance_width) for a character."""
         sw = self.sw
         SB = int(55 * self.ws)
 
@@ -739,7 +694,7 @@ class CyberGlyphBuilder:
         else:
             # Fallback: simple rectangle placeholder
             W=WN; CX=SB+W//2
-            p = s(CX-sw,BASE,CX-sw,CAP) + " " + s(CX+sw,BASE,CX+sw,CAP)
+            p = _j(s(CX-sw,BASE,CX-sw,CAP), s(CX+sw,BASE,CX+sw,CAP))
 
         advance = adv(W) if char not in ('.', ',', '!', '?', ':', ';', ' ') else adv(W)
 
@@ -755,46 +710,71 @@ class CyberGlyphBuilder:
 
 CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?:;-_/()[]+@#&=*%'
 
-def _to_glyph(path_d):
-    svg = (f'<svg xmlns="http://www.w3.org/2000/svg">'
-           f'<path d="{path_d}" fill-rule="evenodd"/></svg>')
+def _to_glyph(path_d, simp=None):
+    """PenPath | SVG d → TTGlyph. simp: outline_simplify.Simplifier — verilirse kontürler cu2qu'dan önce sadeleşir."""
     pen = TTGlyphPen(None)
-    SVGPathLib(io.BytesIO(svg.encode())).draw(
-        Cu2QuPen(pen, max_err=0.6, reverse_direction=True))
+    out = Cu2QuPen(pen, max_err=0.6, reverse_direction=True)
+    draw_path(path_d, simp.pen(out) if simp else out)
     return pen.glyph()
 
+def _union1(un, path):
+    """Tek path için union (un None → aynen)."""
+    return un.run([path])[0] if un else path
+
 def _empty():
     pen = TTGlyphPen(None)
     pen.moveTo((0,0)); pen.lineTo((1,0)); pen.lineTo((1,1)); pen.lineTo((0,1))
     pen.closePath(); return pen.glyph()
 
-def build_from_dna(dna: dict, output_path: str, font_name: str = None):
+def compile_artifact(dna: dict, font_name: str = None, simplify=SIMPLIFY_TOL, overlap=REMOVE_OVERLAP):
     """
-    Build a font from a DNA recipe dict.
+    Build a font from a DNA recipe dict → in-memory FontArtifact.
     DNA format matches ai_distortion.get_effect_recipe() output.
+    simplify: outline simplification tolerance in font units (0 → off).
+    overlap:  skia-pathops union per glyph (overlapping strokes → one contour set).
     """
     if font_name is None:
         font_name = dna.get('font_name', 'VectrodFont')
 
+    from deco_components import DecoComponents
+    from font_artifact import FontArtifact
     builder  = CyberGlyphBuilder(dna)
+    builder.components = True
+    simp     = Simplifier(simplify)
+    un       = Union() if overlap else None
+    decos    = DecoComponents(lambda shape, size, angle:
+                              _to_glyph(_union1(un, builder._deco_shape(shape, 0, 0, size, angle)), simp))
     chars    = list(CHARS)
     gnames   = ['.notdef', 'space'] + [f'uni{ord(c):04X}' for c in chars]
 
-    fb = FontBuilder(UPM, isTTF=True)
-    fb.setupGlyphOrder(gnames)
-    fb.setupCharacterMap({32: 'space', **{ord(c): f'uni{ord(c):04X}' for c in chars}})
-
     glyph_map = {'.notdef': _empty(), 'space': _empty()}
     metrics   = {'.notdef': (500, 0), 'space': (int(220 * builder.ws), 0)}
 
-    ok = fail = 0
+    # Önce tüm outline'lar; stroke/yay band'leri tek numpy geçişinde çözülür
+    built = {}
     for idx, c in enumerate(chars):
-        gn = f'uni{ord(c):04X}'
         try:
+            builder.placed = []
             path, adv = builder.build_glyph(c, idx)
+            built[c] = (path, adv, builder.placed)
+        except Exception as e:
+            built[c] = e
+    resolve_paths([b[0] for b in built.values() if isinstance(b, tuple)])
+    if un:
+        done = [c for c, b in built.items() if isinstance(b, tuple)]
+        for c, p in zip(done, un.run([built[c][0] for c in done])):
+            built[c] = (p,) + built[c][1:]
+
+    ok = fail = 0
+    for c, b in built.items():
+        gn = f'uni{ord(c):04X}'
+        try:
+            if isinstance(b, Exception):
+                raise b
+            path, adv, placed = b
             if not path.strip():
                 raise ValueError("empty path")
-            glyph_map[gn] = _to_glyph(path)
+            glyph_map[gn] = decos.compose(gn, _to_glyph(path, simp), placed, glyph_map)
             metrics[gn]   = (adv, 0)
             ok += 1
         except Exception as e:
@@ -803,10 +783,20 @@ def build_from_dna(dna: dict, output_path: str, font_name: str = None):
             metrics[gn]   = (500, 0)
             fail += 1
 
+    # Gizli glyph'ler (.base / deco_*) — cmap'te yok, advance 0
+    for gn in glyph_map:
+        if gn not in metrics:
+            metrics[gn] = (0, 0)
+    gnames += [gn for gn in glyph_map if gn not in gnames]
+
+    fb = FontBuilder(UPM, isTTF=True)
+    fb.setupGlyphOrder(gnames)
+    fb.setupCharacterMap({32: 'space', **{ord(c): f'uni{ord(c):04X}' for c in chars}})
+
     # Cu2Qu refinement
     conv = {}
     for gn, g in glyph_map.items():
-        if not hasattr(g, 'draw'): conv[gn] = g; continue
+        if not hasattr(g, 'draw') or g.isComposite(): conv[gn] = g; continue
         try:
             p2 = TTGlyphPen(None)
             g.draw(Cu2QuPen(p2, max_err=0.6, reverse_direction=False))
@@ -839,9 +829,20 @@ def build_from_dna(dna: dict, output_path: str, font_name: str = None):
     fb.setupPost(isFixedPitch=0, underlinePosition=-100, underlineThickness=sw)
     fb.setupHead(unitsPerEm=UPM, lowestRecPPEM=8, indexToLocFormat=0)
 
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-    fb.font.save(output_path)
+    from accents import synthesize_accents
+    synthesize_accents(fb.font, stroke=sw)
+
+    art = FontArtifact(fb.font, {'ok': ok, 'fail': fail, 'sw': sw,
+                                 'deco_glyphs': sum(1 for g in decos.glyphs.values() if g),
+                                 'deco_refs': decos.refs, 'simplify': simp.stats,
+                                 'union': un.stats() if un else None})
+    print(f"  ✅ cyber_engine: {len(art.data)/1024:.1f}KB | {ok}✓ {fail}✗ | sw={sw} ws={builder.ws:.2f} "
+          f"| {art.stats['deco_glyphs']} deco glyph, {decos.refs} ref | {simp.report()}"
+          + (f" | union {un.report()}" if un else ""))
+    return art
+
 
-    sz = os.path.getsize(output_path) / 1024
-    print(f"  ✅ cyber_engine: {sz:.1f}KB | {ok}✓ {fail}✗ | sw={sw} ws={builder.ws:.2f}")
+def build_from_dna(dna: dict, output_path: str, font_name: str = None, web=WEB_FORMATS):
+    """DNA → TTF (+ web formatları) diske."""
+    compile_artifact(dna, font_name).write(output_path, otf=False, web=web).wait()
     return output_path
@@ -0,0 +1,67 @@
+"""
+deco_components.py — Dekorasyonları composite component olarak yerleştirme
+==========================================================================
+Aynı çiçek / yaprak / şimşek onlarca harfte tekrar eder. Her kopyayı harfin
+içine gömmek yerine (shape, size, angle) başına tek bir gizli glyph çizilir,
+harf glyph'i bu glyph'e offset ile referans veren bir composite olur:
+
+  uni0041       = composite[ uni0041.base (0,0), deco_flower_145_0 (cx,cy) ]
+  uni0041.base  = harfin kendi konturları (cmap'te yok)
+  deco_…        = dekorasyon, merkezi orijinde (cmap'te yok)
+
+Kullanım (vectrod_v3.build_font, cyber_engine.build_from_dna):
+  dc = DecoComponents(lambda shape, size, angle: _to_glyph(path_at_origin))
+  glyph_map[gn] = dc.compose(gn, body_glyph, placements, glyph_map)
+"""
+
+
+def deco_glyph_name(shape, size, angle):
+    """('flower', 145, -90) → 'deco_flower_145_m90' (post tablosu için güvenli)."""
+    a = int(round(angle))
+    s = ''.join(ch if ch.isalnum() else '_' for ch in str(shape))
+    return f"deco_{s}_{int(round(size))}_{'m' if a < 0 else ''}{abs(a)}"
+
+
+class DecoComponents:
+    """
+    Bir font build'i boyunca dekorasyon glyph'lerini bir kez çizer ve paylaştırır.
+    draw(shape, size, angle) → orijin merkezli TTGlyph (çizilemezse None/hata).
+    """
+    def __init__(self, draw):
+        self._draw = draw
+        self.glyphs = {}        # deco glyph adı → TTGlyph | None
+        self.refs = 0           # toplam component referansı (istatistik)
+
+    def glyph_for(self, key):
+        name = deco_glyph_name(*key)
+        if name not in self.glyphs:
+            try:
+                g = self._draw(*key)
+                self.glyphs[name] = g if g is not None and g.numberOfContours > 0 else None
+            except Exception:
+                self.glyphs[name] = None
+        return name if self.glyphs[name] is not None else None
+
+    def compose(self, gn, body, placements, glyph_map):
+        """
+        placements: [((shape, size, angle), cx, cy), ...]
+        Dekorasyon yoksa body'yi olduğu gibi döndürür; varsa body'yi
+        '<gn>.base' olarak glyph_map'e koyar ve composite döndürür.
+        """
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+        comps = []
+        for key, cx, cy in placements:
+            name = self.glyph_for(key)
+            if name:
+                glyph_map[name] = self.glyphs[name]
+                comps.append((name, (1, 0, 0, 1, int(round(cx)), int(round(cy)))))
+        if not comps:
+            return body
+        pen = TTGlyphPen(glyph_map)
+        if body is not None and body.numberOfContours > 0:
+            glyph_map[f'{gn}.base'] = body
+            pen.addComponent(f'{gn}.base', (1, 0, 0, 1, 0, 0))
+        for name, tr in comps:
+            pen.addComponent(name, tr)
+        self.refs += len(comps)
+        return pen.glyph()
@@ -223,83 +223,39 @@ def build_font_from_dna(
 
     ttf_out = os.path.join(output_dir, f"{font_name}_Regular.ttf")
 
-    # ── Step 3: Build font ───────────────────────────────────────
+    # ── Step 3: Build font (in memory) ───────────────────────────
     if engine_name == 'floral':
-        ttf_out = _build_floral(dna, ttf_out, font_name)
+        art = _build_floral(dna, font_name)
     else:
-        ttf_out = _build_cyber(dna, ttf_out, font_name)
+        art = _build_cyber(dna, font_name)
 
-    if not ttf_out or not os.path.exists(ttf_out):
+    if art is None or not art.data:
         raise RuntimeError("Font build failed")
 
-    # ── Step 4: Generate preview SVGs ───────────────────────────
-    glyph_svgs = _make_preview_svgs(ttf_out)
+    # ── Step 4: Write TTF + OTF (+ web) once; previews come from the artifact
+    paths = art.write(ttf_out).wait()
+    if 'ttf' not in paths:
+        raise RuntimeError("Font write failed")
 
-    # ── Step 5: Create OTF copy ──────────────────────────────────
-    otf_out = ttf_out.replace('.ttf', '.otf')
-    try:
-        from fontTools.ttLib import TTFont as _TT
-        f = _TT(ttf_out)
-        f.flavor = None
-        f.save(otf_out)
-    except Exception as e:
-        print(f"[DNA] OTF copy failed: {e}")
-        otf_out = None
+    print(f"[DNA] ✅ Done in {time.time()-t0:.1f}s | {len(art.data)/1024:.1f}KB | engine={engine_name}")
+    return paths['ttf'], paths.get('otf'), dna, art.previews
 
-    sz = os.path.getsize(ttf_out) / 1024
-    print(f"[DNA] ✅ Done in {time.time()-t0:.1f}s | {sz:.1f}KB | engine={engine_name}")
-    return ttf_out, otf_out, dna, glyph_svgs
 
-
-def _build_floral(dna, output_path, font_name):
+def _build_floral(dna, font_name):
     """Build using floral_engine with DNA parameters."""
     import importlib, sys
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     fe = importlib.import_module('floral_engine')
-    # Inject DNA stroke_weight into floral_engine constants
-    fe.SW = max(18, min(60, int(dna.get('stroke_weight', 28))))
-    fe.LS = int(fe.SW * 2.6)
-    fe.BS = int(fe.SW * 1.8)
-    # Rebuild GLYPHS with new constants (functions use module-level vars)
-    path = fe.build(output_path, font_name)
-    return path
+    # stroke_weight FloralBuilder örneğinde — modül global'i değişmez, eşzamanlı build'ler güvenli
+    return fe.compile_artifact(dna, font_name)
 
 
-def _build_cyber(dna, output_path, font_name):
+def _build_cyber(dna, font_name):
     """Build using cyber_engine with DNA parameters."""
     import importlib, sys
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     ce = importlib.import_module('cyber_engine')
-    path = ce.build_from_dna(dna, output_path, font_name)
-    return path
-
-
-def _make_preview_svgs(ttf_path: str) -> dict:
-    """Extract glyph preview paths from TTF for frontend rendering."""
-    try:
-        from fontTools.ttLib import TTFont
-        from fontTools.pens.svgPathPen import SVGPathPen
-        f     = TTFont(ttf_path)
-        cmap  = f.getBestCmap()
-        gset  = f.getGlyphSet()
-        svgs  = {}
-        for char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789':
-            cp = ord(char)
-            gn = cmap.get(cp)
-            if not gn: continue
-            try:
-                pen = SVGPathPen(gset)
-                gset[gn].draw(pen)
-                d = pen.getCommands()
-                w = gset[gn].width
-                if d:
-                    svgs[char] = {'d': d, 'adv': w}
-            except Exception:
-                pass
-        return svgs
-    except Exception as e:
-        print(f"[DNA] Preview SVG error: {e}")
-        return {}
+    return ce.compile_artifact(dna, font_name)
 
 
 # ── STANDALONE TEST ───────────────────────────────────────────────
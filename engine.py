@@ -2,11 +2,15 @@ __ENGINE_VERSION__ = "v7.8-global-scale"
 #!/usr/bin/env python3
 """SVG → TTF/OTF Font Engine v7.8 — global scale fix"""
 
-import sys, os, re, json, io
+import sys, os, re, json, io, copy
 from lxml import etree
 from fontTools.fontBuilder import FontBuilder
 from fontTools.pens.ttGlyphPen import TTGlyphPen
 from fontTools.svgLib.path import SVGPath as SVGPathLib
+from webfonts import save_font, WEB_FORMATS
+from outline_simplify import Simplifier, TOLERANCE as SIMPLIFY_TOL
+from svg_cluster import cluster_groups, detect_lines
+from auto_kern import kern_font, ENABLED as AUTOKERN
 
 DEFAULT_CHAR_ORDER = (
     'A','B','C','D','E','F','G','H','I','J','K','L','M',
@@ -62,18 +66,9 @@ def collect_groups(root):
     walk(root)
 
     if not groups:
-        def walk2(elem):
-            if not isinstance(elem.tag, str):
-                return
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-            if tag == 'g':
-                paths = [e for e in elem.iter('{%s}path' % ns) if isinstance(e.tag, str)]
-                if paths:
-                    groups.append({'paths': paths, 'elem': elem, 'tx': 0, 'ty': 0})
-                    return
-            for child in elem:
-                walk2(child)
-        walk2(root)
+        # Karakter başına translate'li <g> yok (düzleştirilmiş export):
+        # path'ler geometriye göre glyph'lere kümelenir — bkz. svg_cluster
+        groups = cluster_groups(root)
 
     return groups
 
@@ -97,20 +92,20 @@ def get_group_bbox(group):
 
 
 def sort_groups(groups):
-    if groups and groups[0].get('tx') is not None:
-        def sort_key(g):
-            tx = g.get('tx', 0)
-            ty = g.get('ty', 0)
-            row = round(ty / 50) * 50
-            return (row, tx)
-        return sorted(groups, key=sort_key)
-    def group_pos(g):
-        bb = get_group_bbox(g)
+    """
+    Okuma sırası: satırlar yukarıdan aşağıya, her satır soldan sağa.
+    Satırlar sabit bir ızgarayla değil, glyph bbox'larının dikey
+    izdüşümündeki boşluklarla bulunur (svg_cluster.detect_lines).
+    """
+    boxes = []
+    for g in groups:
+        bb = g.get('bbox')
         if bb is None:
-            return (9999, 9999)
-        row = round(bb[1] / 50) * 50
-        return (row, bb[0])
-    return sorted(groups, key=group_pos)
+            tx, ty = g.get('tx', 0), g.get('ty', 0)
+            bb = get_group_bbox(g) or (0, 0, 0, 0)
+            bb = (tx + bb[0], ty + bb[1], tx + bb[2], ty + bb[3])
+        boxes.append(bb)
+    return [groups[i] for row in detect_lines(boxes) for i in row]
 
 
 def scale_path(d, sx, sy, tx, ty):
@@ -176,13 +171,17 @@ def scale_path(d, sx, sy, tx, ty):
     return ' '.join(result)
 
 
-def draw_glyph(group, ascender=800, descender=-200, ref_height=None, svg_baseline_y=None,
-               global_scale=None, global_bottom=None):
+def outline_glyph(group, ascender=800, descender=-200, ref_height=None, svg_baseline_y=None,
+                  global_scale=None, global_bottom=None):
     """
-    SVG grubunu TTF glyph'e çevir.
+    SVG grubunu glyph IR'ına çevir: (RecordingPen komutları, advance).
+    Komutlar cubic, TrueType kontur yönünde — stil türetme (bold/italic)
+    ve cu2qu bu ortak IR üzerinde çalışır.
     global_scale: tüm fontun ortak scale'i — tüm glyphlar aynı boyutta çıkar.
     global_bottom: SVG'deki tüm glyphların en alttaki noktası (baseline referansı).
     """
+    from fontTools.pens.recordingPen import RecordingPen
+
     bb = get_group_bbox(group)
     if bb is None:
         return None, 500
@@ -228,13 +227,12 @@ def draw_glyph(group, ascender=800, descender=-200, ref_height=None, svg_baselin
     svg_bytes = svg_str.encode('utf-8')
     try:
         import pathops
-        from fontTools.pens.cu2quPen import Cu2QuPen
         ops_path = pathops.Path()
         SVGPathLib(io.BytesIO(svg_bytes)).draw(ops_path)
         pathops.simplify(ops_path, pathops.FillType.WINDING)
-        pen = TTGlyphPen(None)
-        ops_path.draw(Cu2QuPen(pen, max_err=0.5, reverse_direction=False))
-        return pen.glyph(), target_w
+        rec = RecordingPen()
+        ops_path.draw(rec)
+        return rec.value, target_w
     except ImportError:
         pass
     except Exception:
@@ -242,14 +240,45 @@ def draw_glyph(group, ascender=800, descender=-200, ref_height=None, svg_baselin
 
     # ── Fallback B: direct winding ───────────────────────────────────
     try:
-        from fontTools.pens.cu2quPen import Cu2QuPen
-        pen = TTGlyphPen(None)
-        SVGPathLib(io.BytesIO(svg_bytes)).draw(Cu2QuPen(pen, max_err=0.5, reverse_direction=True))
-        return pen.glyph(), target_w
+        from fontTools.pens.reverseContourPen import ReverseContourPen
+        rec = RecordingPen()
+        SVGPathLib(io.BytesIO(svg_bytes)).draw(ReverseContourPen(rec))
+        return rec.value, target_w
     except Exception as e2:
         raise RuntimeError(f"all render paths failed: {e2}")
 
 
+def ir_to_glyph(commands, max_err=0.5):
+    """IR komutlarını (cubic) quadratic TTGlyph'e çevir."""
+    from fontTools.pens.cu2quPen import Cu2QuPen
+    from fontTools.pens.recordingPen import replayRecording
+    pen = TTGlyphPen(None)
+    replayRecording(commands, Cu2QuPen(pen, max_err=max_err, reverse_direction=False))
+    return pen.glyph()
+
+
+def draw_glyph(group, ascender=800, descender=-200, ref_height=None, svg_baseline_y=None,
+               global_scale=None, global_bottom=None):
+    """
+    SVG grubunu TTF glyph'e çevir.
+    global_scale: tüm fontun ortak scale'i — tüm glyphlar aynı boyutta çıkar.
+    global_bottom: SVG'deki tüm glyphların en alttaki noktası (baseline referansı).
+    """
+    commands, adv = outline_glyph(group, ascender, descender, ref_height, svg_baseline_y,
+                                  global_scale, global_bottom)
+    if commands is None:
+        return None, adv
+    return ir_to_glyph(commands), adv
+
+
+def glyph_name(ch):
+    """Karakter → glyph adı: 'space', BMP için uniXXXX, üst düzlemler için uXXXXX."""
+    if ch == ' ':
+        return 'space'
+    cp = ord(ch)
+    return f'uni{cp:04X}' if cp <= 0xFFFF else f'u{cp:05X}'
+
+
 def make_empty_glyph():
     pen = TTGlyphPen(None)
     pen.moveTo((0, 0))
@@ -260,22 +289,89 @@ def make_empty_glyph():
     return pen.glyph()
 
 
-def build_font(svg_file, font_name, output_dir,
-               char_order=None, bold=False, italic=False,
-               units_per_em=1000):
+# ── STİL TÜRETME (bold / italic) ─────────────────────────────────────
+# Aile modunda SVG bir kez okunur; Bold/Italic varyantları aynı IR'dan
+# outline offset (pathops) ve shear ile türetilir.
+STYLE_FLAGS = {
+    'regular':    (False, False),
+    'bold':       (True,  False),
+    'italic':     (False, True),
+    'bolditalic': (True,  True),
+}
+BOLD_OFFSET  = 0.022   # UPM oranı — her yöne ~22 unit kalınlaştırma
+ITALIC_ANGLE = 12.0    # derece, sağa yatık
 
-    print(f"\n{'='*52}")
-    print(f"  SVG → Font Converter v7.8")
-    print(f"  Dosya : {os.path.basename(svg_file)}")
-    print(f"  Font  : {font_name}")
-    print(f"{'='*52}\n")
 
-    if char_order is None:
-        char_order = list(DEFAULT_CHAR_ORDER)
+def style_info(bold, italic):
+    """(style_name, usWeightClass, fsSelection, macStyle)"""
+    if bold and italic:
+        return 'Bold Italic', 700, 0x21, 0x03
+    if bold:
+        return 'Bold', 700, 0x20, 0x01
+    if italic:
+        return 'Italic', 400, 0x01, 0x02
+    return 'Regular', 400, 0x40, 0x00
+
+
+def embolden_ir(commands, offset):
+    """Konturu her yöne `offset` kadar genişlet: kontur + stroke(2*offset) birleşimi."""
+    import pathops
+    from fontTools.pens.recordingPen import RecordingPen, replayRecording
+    from fontTools.pens.transformPen import TransformPen
+    src = pathops.Path()
+    replayRecording(commands, src.getPen())
+    stroked = pathops.Path()
+    replayRecording(commands, stroked.getPen())
+    stroked.stroke(offset * 2, pathops.LineCap.BUTT_CAP, pathops.LineJoin.MITER_JOIN, 4)
+    fat = pathops.op(src, stroked, pathops.PathOp.UNION, fix_winding=True)
+    rec = RecordingPen()
+    fat.draw(TransformPen(rec, (1, 0, 0, 1, offset, 0)))   # sol bearing korunur
+    return rec.value
+
+
+def slant_ir(commands, angle=ITALIC_ANGLE):
+    """Baseline etrafında shear: x' = x + y·tan(açı)."""
+    import math
+    from fontTools.pens.recordingPen import RecordingPen, replayRecording
+    from fontTools.pens.transformPen import TransformPen
+    rec = RecordingPen()
+    replayRecording(commands, TransformPen(rec, (1, 0, math.tan(math.radians(angle)), 1, 0, 0)))
+    return rec.value
+
+
+def parse_svg(svg):
+    """
+    Dosya yolu, ham bayt veya zaten parse edilmiş lxml ağacı/elemanı → kök eleman.
+    Upload'lar diske yazılmadan doğrudan buraya verilebilir.
+    """
+    if isinstance(svg, etree._ElementTree):
+        return svg.getroot()
+    if isinstance(svg, etree._Element):
+        return svg
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+    if isinstance(svg, (bytes, bytearray)):
+        return etree.fromstring(bytes(svg), parser)
+    return etree.parse(svg, parser).getroot()
+
+
+def svg_label(svg):
+    """Log için kaynak adı."""
+    return os.path.basename(svg) if isinstance(svg, str) else f"<{type(svg).__name__}>"
 
+
+def load_svg_shapes(svg, ascender=800, descender=-200, limit=None,
+                    workers=None, quadratic=False, simplify=SIMPLIFY_TOL):
+    """
+    SVG'yi bir kez oku, grupları sırala ve her grubun outline'ını çiz.
+    Karakter ataması yok — sonuç char_order'dan bağımsızdır, remap'lerde
+    yeniden kullanılır (bkz. upload_store). limit: sadece ilk N grup çizilir.
+    workers: chunk başına süreç sayısı (None → büyük setlerde cpu_count).
+    quadratic=True: şekiller hazır TTGlyph olarak döner (stil türetilemez).
+    simplify: outline sadeleştirme toleransı (font birimi, 0 → kapalı).
+    → {'shapes': [(komutlar | None, advance)], 'errors': {idx: mesaj}, 'ascender', 'descender'}
+    """
     print("[1/6] SVG okunuyor...")
-    tree = etree.parse(svg_file)
-    root = tree.getroot()
+    root = parse_svg(svg)
     viewbox = get_svg_viewbox(root)
     print(f"      ViewBox: {viewbox}")
 
@@ -285,35 +381,17 @@ def build_font(svg_file, font_name, output_dir,
 
     if not groups:
         print("HATA: SVG'de hiç path bulunamadı!")
-        return None, None
+        return None
 
     groups = sort_groups(groups)
     print(f"      Sıralandı: soldan sağa, yukarıdan aşağıya")
 
-    print("[3/6] Karakterlere atanıyor...")
-    n = min(len(groups), len(char_order))
-    char_map = {char_order[i]: groups[i] for i in range(n)}
-    print(f"      {n} karakter atandı")
-
-    print("[4/6] Font yapısı kuruluyor...")
-    ascender, descender = 800, -200
-
-    glyph_order  = ['.notdef']
-    char_to_glyph = {}
-    for ch in char_map:
-        name = 'space' if ch == ' ' else f'uni{ord(ch):04X}'
-        glyph_order.append(name)
-        char_to_glyph[ch] = name
-    if 'space' not in glyph_order:
-        glyph_order.append('space')
-
-    fb = FontBuilder(units_per_em, isTTF=True)
-    fb.setupGlyphOrder(glyph_order)
-    cmap = {ord(ch): name for ch, name in char_to_glyph.items()}
-    cmap[32] = 'space'
-    fb.setupCharacterMap(cmap)
-
-    print("[5/6] Glyphlar çiziliyor...")
+    print("[3/6] Glyphlar çiziliyor...")
+    # lxml elemanları yerine sadece path verisi: ağaç serbest kalır,
+    # gruplar worker süreçlere pickle'lanabilir
+    groups = [{'paths': [{'d': p.get('d', '')} for p in g['paths']],
+               'tx': g['tx'], 'ty': g['ty']} for g in groups[:limit]]
+    del root
 
     # ── GLOBAL SCALE ────────────────────────────────────────────────
     # Tüm glyphlarda AYNI scale kullan.
@@ -340,11 +418,184 @@ def build_font(svg_file, font_name, output_dir,
         global_bottom = None
         print(f"      Global scale: fallback mode")
 
+    args = (ascender, descender, global_scale, global_bottom, quadratic, simplify)
+    shapes, errors, simp = [], {}, Simplifier(simplify)
+    for chunk, counts in _outline_chunks(groups, args, workers):
+        simp.merge(counts)
+        for cmds, adv, err in chunk:
+            if err is not None:
+                errors[len(shapes)] = err
+            shapes.append((cmds, adv))
+    if simplify > 0:
+        print(f"      Sadeleştirme: {simp.report()}")
+    return {'shapes': shapes, 'errors': errors, 'simplify': simp.stats,
+            'ascender': ascender, 'descender': descender}
+
+
+# ── BÜYÜK SETLER (CJK / ikon fontları) ───────────────────────────────
+# Gruplar CHUNK'lar halinde çizilir; PARALLEL_MIN üstünde chunk'lar ayrı
+# süreçlere dağıtılır. quadratic=True'da worker cubic → quadratic dönüşümü
+# de yapar ve sadece TTGlyph döner — cubic IR hiçbir zaman bütünüyle
+# bellekte birikmez (glyph başına ~5KB yerine ~1.5KB).
+CHUNK        = 256
+PARALLEL_MIN = 1000     # glyph
+
+
+def _outline_chunk(job):
+    groups, ascender, descender, global_scale, global_bottom, quadratic, simplify = job
+    out, simp = [], Simplifier(simplify)
+    for group in groups:
+        try:
+            cmds, adv = outline_glyph(group, ascender, descender,
+                                      global_scale=global_scale,
+                                      global_bottom=global_bottom)
+            if cmds is None:
+                raise ValueError("glyph None döndü")
+            cmds = simp.commands(cmds)
+            out.append((ir_to_glyph(cmds) if quadratic else cmds, adv, None))
+        except Exception as e:
+            out.append((None, 400, str(e)))
+    return out, simp.counts
+
+
+def _outline_chunks(groups, args, workers=None):
+    """Chunk sonuçlarını sırayla üret: ([(komutlar | TTGlyph | None, advance, hata)], nokta sayıları)."""
+    chunks = [groups[i:i + CHUNK] for i in range(0, len(groups), CHUNK)]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(groups) >= PARALLEL_MIN else 1
+    workers = max(1, min(workers, len(chunks)))
+    if workers == 1:
+        for c in chunks:
+            yield _outline_chunk((c,) + args)
+        return
+    print(f"      {len(chunks)} chunk, {workers} süreç")
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+    # spawn: sunucu süreci thread'li (font-write havuzu, ısıtma) → fork kilit kalıtabilir
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        yield from pool.map(_outline_chunk, [(c,) + args for c in chunks])
+
+
+PUA = (0xE000, 0xF8FF)
+
+
+def pua_chars(n, used=()):
+    """İkon fontları için n adet Private Use karakteri (BMP PUA, sonra Plane 15)."""
+    used, out = set(used), []
+    for cp in list(range(PUA[0], PUA[1] + 1)) + list(range(0xF0000, 0xFFFFE)):
+        if len(out) >= n:
+            break
+        if chr(cp) not in used:
+            out.append(chr(cp))
+    return out
+
+
+def assign_chars(svg_shapes, char_order=None, pua=False):
+    """
+    Sıralı şekilleri karakterlere ata → glyph IR.
+    'index' her karakterin şekil sırasını tutar (glyph önbelleği anahtarı).
+    pua=True: char_order'dan artan şekiller Private Use alanına atanır (ikon fontları).
+    """
+    if char_order is None:
+        char_order = list(DEFAULT_CHAR_ORDER)
+    shapes, errors = svg_shapes['shapes'], svg_shapes['errors']
+    print("[4/6] Karakterlere atanıyor...")
+    bad = [c for c in char_order if len(c) != 1]
+    if bad:
+        print(f"      [UYARI] tek kod noktası olmayan {len(bad)} giriş atlandı")
+        char_order = [c for c in char_order if len(c) == 1]
+    if pua and len(shapes) > len(char_order):
+        extra = pua_chars(len(shapes) - len(char_order), char_order)
+        char_order = list(char_order) + extra
+        print(f"      {len(extra)} şekil PUA'ya atandı (U+{ord(extra[0]):04X}…U+{ord(extra[-1]):04X})")
+    n = min(len(shapes), len(char_order))
+    # ch → (komutlar | None, advance); None = boş glyph
+    outlines, index, failed = {}, {}, []
+    for i in range(n):
+        ch = char_order[i]
+        if ch == ' ':
+            outlines[ch] = (None, 250)
+            continue
+        outlines[ch] = shapes[i]
+        index[ch] = i
+        if i in errors:
+            print(f"      [UYARI] '{ch}' çizilemedi: {errors[i]}")
+            failed.append(ch)
+    print(f"      {n} karakter atandı — ✓ {len(outlines) - len(failed) - (' ' in outlines)} "
+          f"başarılı  ✗ {len(failed)} başarısız")
+    return {'outlines': outlines, 'failed': failed, 'index': index,
+            'simplify': svg_shapes.get('simplify'),
+            'ascender': svg_shapes['ascender'], 'descender': svg_shapes['descender']}
+
+
+def load_glyph_ir(svg, char_order=None, ascender=800, descender=-200,
+                  workers=None, quadratic=False, pua=False, simplify=SIMPLIFY_TOL):
+    """
+    SVG'yi bir kez oku, normalize et ve glyph IR'ını çıkar.
+    svg: dosya yolu, ham bayt veya parse edilmiş lxml ağacı (bkz. parse_svg).
+    Dönen sözlük süreçler arası taşınabilir (pickle) — aile varyantları
+    ayrı süreçlerde aynı IR'dan derlenir.
+    """
+    if char_order is None:
+        char_order = list(DEFAULT_CHAR_ORDER)
+    svg_shapes = load_svg_shapes(svg, ascender, descender,
+                                 limit=None if pua else len(char_order),
+                                 workers=workers, quadratic=quadratic, simplify=simplify)
+    if svg_shapes is None:
+        return None
+    return assign_chars(svg_shapes, char_order, pua=pua)
+
 
+def ir_previews(ir):
+    """Çizim aşamasının outline'ları → {ch: {'d': SVG path, 'adv'}} (font birimleri, y yukarı)."""
+    from fontTools.pens.svgPathPen import SVGPathPen
+    from fontTools.pens.recordingPen import replayRecording
+    out = {}
+    for ch, (cmds, adv) in ir['outlines'].items():
+        if not cmds:
+            continue
+        pen = SVGPathPen(None)
+        if isinstance(cmds, list):
+            replayRecording(cmds, pen)
+        else:
+            cmds.draw(pen, None)            # quadratic IR: hazır TTGlyph
+        out[ch] = {'d': pen.getCommands(), 'adv': adv}
+    return out
 
 
+def compile_font(ir, font_name, output_dir, bold=False, italic=False,
+                 synthesize=False, units_per_em=1000, web=WEB_FORMATS, glyph_cache=None,
+                 kern=AUTOKERN):
+    """
+    Glyph IR'ından tek bir stil derle ve kaydet → (ttf_path, otf_path).
+    web: TTF'in yanına yazılacak web formatları (woff2/woff), () → sadece TTF.
+    glyph_cache: {(şekil sırası, offset, slant): TTGlyph} — remap/rename'de
+    outline'lar yeniden çizilmez, sadece cmap/name ve diğer tablolar kurulur.
+    IR outline'ları cubic komutlar ya da (quadratic=True ile yüklendiyse) hazır
+    TTGlyph olabilir; ikincisinde stil türetilemez.
+    synthesize=False: bold/italic sadece isim ve OS/2 bitleri (SVG zaten o stilde).
+    synthesize=True : outline offset ve shear ile stil gerçekten türetilir.
+    kern: yan profillerden sınıf tabanlı GPOS kern (auto_kern).
+    """
+    ascender, descender = ir['ascender'], ir['descender']
+    outlines, failed = ir['outlines'], ir['failed']
+    style_name, weight, fs_sel, mac_style = style_info(bold, italic)
 
+    print(f"[5/6] Font yapısı kuruluyor ({style_name})...")
+    glyph_order  = ['.notdef']
+    char_to_glyph = {}
+    for ch in outlines:
+        name = glyph_name(ch)
+        glyph_order.append(name)
+        char_to_glyph[ch] = name
+    if 'space' not in glyph_order:
+        glyph_order.append('space')
 
+    fb = FontBuilder(units_per_em, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    cmap = {ord(ch): name for ch, name in char_to_glyph.items()}
+    cmap[32] = 'space'
+    fb.setupCharacterMap(cmap)
 
     glyphs  = {}
     metrics = {}
@@ -354,59 +605,56 @@ def build_font(svg_file, font_name, output_dir,
         glyphs['space'] = make_empty_glyph()
         metrics['space'] = (250, 0)
 
-    ok = fail = 0
+    offset = int(round(units_per_em * BOLD_OFFSET)) if (synthesize and bold) else 0
+    slant  = synthesize and italic
+    if synthesize and (bold or italic):
+        print(f"      Stil türetiliyor: offset={offset}  shear={ITALIC_ANGLE if slant else 0}°")
+
+    print("      Cubic → Quadratic dönüştürülüyor...")
+    index, reused = ir.get('index', {}), 0
     for ch, gname in char_to_glyph.items():
-        if ch == ' ':
-            glyphs[gname] = make_empty_glyph()
-            metrics[gname] = (250, 0)
+        cmds, adv = outlines[ch]
+        if cmds is None:
+            glyphs[gname]  = make_empty_glyph()
+            metrics[gname] = (adv + 2 * offset if ch == ' ' else adv, 0)
             continue
-        group = char_map[ch]
-        try:
-            g, adv = draw_glyph(group, ascender, descender,
-                                global_scale=global_scale,
-                                global_bottom=global_bottom)
-            if g is None:
-                raise ValueError("glyph None döndü")
-            glyphs[gname]  = g
+        if not isinstance(cmds, list):
+            glyphs[gname]  = cmds
             metrics[gname] = (adv, 0)
-            ok += 1
-        except Exception as e:
-            print(f"      [UYARI] '{ch}' çizilemedi: {e}")
-            glyphs[gname]  = make_empty_glyph()
-            metrics[gname] = (400, 0)
-            fail += 1
-
-    print(f"      ✓ {ok} başarılı  ✗ {fail} başarısız")
-
-    print("      Cubic → Quadratic dönüştürülüyor...")
-    from fontTools.pens.cu2quPen import Cu2QuPen
-    from fontTools.pens.ttGlyphPen import TTGlyphPen as TTGPen2
-    converted = {}
-    for gname, glyph in glyphs.items():
-        if glyph is None or not hasattr(glyph, 'draw'):
-            converted[gname] = glyph
+            continue
+        key = (index.get(ch), offset, slant)
+        if glyph_cache is not None and key[0] is not None and key in glyph_cache:
+            glyphs[gname]  = copy.deepcopy(glyph_cache[key])
+            metrics[gname] = (adv + 2 * offset, 0)
+            reused += 1
             continue
         try:
-            pen2   = TTGPen2(None)
-            cu2qu  = Cu2QuPen(pen2, max_err=1.0, reverse_direction=False)
-            glyph.draw(cu2qu)
-            converted[gname] = pen2.glyph()
-        except Exception:
-            converted[gname] = glyph
-    glyphs = converted
+            if offset:
+                cmds = embolden_ir(cmds, offset)
+            if slant:
+                cmds = slant_ir(cmds)
+            glyphs[gname] = ir_to_glyph(cmds)
+        except Exception as e:
+            print(f"      [UYARI] '{ch}' türetilemedi, orijinal kullanılıyor: {e}")
+            glyphs[gname] = ir_to_glyph(outlines[ch][0])
+        metrics[gname] = (adv + 2 * offset, 0)
+        if glyph_cache is not None and key[0] is not None:
+            glyph_cache[key] = copy.deepcopy(glyphs[gname])
+    if reused:
+        print(f"      {reused} glyph önbellekten (outline yeniden çizilmedi)")
 
     fb.setupGlyf(glyphs)
+    # lsb'leri glyph sınırlarından hesapla (shear/offset sonrası doğru olsun)
+    glyf = fb.font['glyf']
+    metrics = {g: (adv, getattr(glyf[g], 'xMin', 0)) for g, (adv, _) in metrics.items()}
     fb.setupHorizontalMetrics(metrics)
-    fb.setupHorizontalHeader(ascent=ascender, descent=descender)
-
-    if bold and italic:
-        style_name, weight, fs_sel = 'Bold Italic', 700, 0x03
-    elif bold:
-        style_name, weight, fs_sel = 'Bold', 700, 0x20
-    elif italic:
-        style_name, weight, fs_sel = 'Italic', 400, 0x02
+    if slant:
+        import math
+        fb.setupHorizontalHeader(ascent=ascender, descent=descender,
+                                 caretSlopeRise=1000,
+                                 caretSlopeRun=int(round(1000 * math.tan(math.radians(ITALIC_ANGLE)))))
     else:
-        style_name, weight, fs_sel = 'Regular', 400, 0x40
+        fb.setupHorizontalHeader(ascent=ascender, descent=descender)
 
     fb.setupNameTable({
         "familyName": font_name,
@@ -425,8 +673,21 @@ def build_font(svg_file, font_name, output_dir,
         fsSelection=fs_sel, achVendID="CSTM",
         ulUnicodeRange1=0b10000000000000000000000011111111,
     )
-    fb.setupPost(isFixedPitch=0, underlinePosition=-100, underlineThickness=50)
-    fb.setupHead(unitsPerEm=units_per_em, lowestRecPPEM=8, indexToLocFormat=0)
+    fb.setupPost(isFixedPitch=0, underlinePosition=-100, underlineThickness=50,
+                 italicAngle=-ITALIC_ANGLE if slant else 0)   # SVG zaten italikse açıyı bilmiyoruz
+    # loca formatı kaydederken glyf boyutundan seçilir: < 128KB → kısa, değilse uzun
+    fb.setupHead(unitsPerEm=units_per_em, lowestRecPPEM=8, macStyle=mac_style)
+    if max(cmap) > 0x2FF:
+        fb.font['OS/2'].recalcUnicodeRanges(fb.font)
+
+    from accents import synthesize_accents
+    n_acc = synthesize_accents(fb.font)
+    if n_acc:
+        print(f"      + {n_acc} aksanlı karakter (composite)")
+    kern_stats = kern_font(fb.font) if kern else None
+    if kern_stats and not kern_stats.get('skipped'):
+        print(f"      Kerning: {kern_stats['pairs']} çift → {kern_stats['class_pairs']} sınıf çifti "
+              f"({kern_stats['classes'][0]}×{kern_stats['classes'][1]} sınıf, {kern_stats['ms']} ms)")
 
     print("[6/6] Dosyalar kaydediliyor...")
     os.makedirs(output_dir, exist_ok=True)
@@ -435,35 +696,159 @@ def build_font(svg_file, font_name, output_dir,
     ttf_path   = os.path.join(output_dir, f"{safe}_{safe_style}.ttf")
     otf_path   = os.path.join(output_dir, f"{safe}_{safe_style}.otf")
 
-    fb.font.save(ttf_path)
+    saved = save_font(fb.font, ttf_path, web)
     print(f"      ✓ TTF: {ttf_path}")
+    for fmt in web or ():
+        if fmt in saved:
+            print(f"      ✓ {fmt.upper()}: {saved[fmt]}")
     import shutil
     shutil.copy2(ttf_path, otf_path)
     print(f"      ✓ OTF: {otf_path}")
 
+    ok = sum(1 for ch in outlines if ch != ' ') - len(failed)
+    fail = len(failed)
     mapping = {
         "font_name": font_name, "style": style_name,
         "total": ok+fail, "success": ok, "failed": fail,
         "characters": list(char_to_glyph.keys())
     }
+    if ir.get('simplify'):
+        mapping["simplify"] = ir['simplify']
+    if kern_stats:
+        mapping["kern"] = kern_stats
     with open(os.path.join(output_dir, f"{safe}_{safe_style}_mapping.json"), 'w', encoding='utf-8') as f:
         json.dump(mapping, f, ensure_ascii=False, indent=2)
 
+    return ttf_path, otf_path
+
+
+def build_font(svg, font_name, output_dir,
+               char_order=None, bold=False, italic=False,
+               units_per_em=1000, web=WEB_FORMATS, previews=False,
+               workers=None, pua=False, simplify=SIMPLIFY_TOL, kern=AUTOKERN):
+    """
+    svg: dosya yolu, ham bayt veya parse edilmiş lxml ağacı.
+    → (ttf_path, otf_path), previews=True ise (ttf_path, otf_path, {ch: {'d','adv'}})
+    Binlerce glyph'lik sayfalar chunk'lar halinde (workers süreçte) çizilir;
+    pua=True: char_order'dan fazla şekil Private Use alanına atanır.
+    simplify: outline sadeleştirme toleransı (font birimi, 0 → kapalı).
+    kern=False: otomatik kerning (GPOS) atlanır.
+    """
+    print(f"\n{'='*52}")
+    print(f"  SVG → Font Converter v7.8")
+    print(f"  Dosya : {svg_label(svg)}")
+    print(f"  Font  : {font_name}")
+    print(f"{'='*52}\n")
+
+    ir = load_glyph_ir(svg, char_order, workers=workers, quadratic=True, pua=pua,
+                       simplify=simplify)
+    if ir is None:
+        return (None, None, {}) if previews else (None, None)
+    ttf_path, otf_path = compile_font(ir, font_name, output_dir, bold, italic,
+                                      units_per_em=units_per_em, web=web, kern=kern)
+
+    ok = len(ir['outlines']) - len(ir['failed']) - (' ' in ir['outlines'])
     print(f"\n{'='*52}")
-    print(f"  ✅ TAMAMLANDI! {ok}/{ok+fail} glyph başarılı")
+    print(f"  ✅ TAMAMLANDI! {ok}/{ok+len(ir['failed'])} glyph başarılı")
     print(f"  TTF : {ttf_path}")
     print(f"  OTF : {otf_path}")
     print(f"{'='*52}\n")
+    if previews:
+        return ttf_path, otf_path, ir_previews(ir)
     return ttf_path, otf_path
 
 
+def _compile_variant(args):
+    ir, font_name, output_dir, style, units_per_em = args
+    bold, italic = STYLE_FLAGS[style]
+    import contextlib
+    with contextlib.redirect_stdout(io.StringIO()):
+        return style, compile_font(ir, font_name, output_dir, bold, italic,
+                                   synthesize=True, units_per_em=units_per_em)
+
+
+def compile_family(ir, font_name, output_dir,
+                   styles=('regular', 'bold', 'italic', 'bolditalic'),
+                   workers=None, units_per_em=1000, glyph_cache=None):
+    """
+    Tek IR'dan stilleri derle → {stil: (ttf_path, otf_path)}.
+    glyph_cache verilirse süreç içinde sırayla derlenir (önbellek paylaşılsın diye).
+    """
+    jobs = [(ir, font_name, output_dir, s, units_per_em) for s in styles if s in STYLE_FLAGS]
+    workers = 1 if glyph_cache is not None else max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    print(f"[5/6] {len(jobs)} stil derleniyor ({workers} süreç)...")
+    if glyph_cache is not None:
+        return {s: compile_font(ir, font_name, output_dir, *STYLE_FLAGS[s], synthesize=True,
+                                units_per_em=units_per_em, glyph_cache=glyph_cache)
+                for _, _, _, s, _ in jobs}
+    if workers == 1:
+        return dict(_compile_variant(j) for j in jobs)
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        return dict(pool.map(_compile_variant, jobs))
+
+
+def build_family(svg, font_name, output_dir, char_order=None,
+                 styles=('regular', 'bold', 'italic', 'bolditalic'),
+                 workers=None, units_per_em=1000, previews=False):
+    """
+    Aile modu: SVG bir kez okunur, Regular/Bold/Italic/Bold Italic aynı
+    glyph IR'ından türetilip paralel derlenir. Hepsi aynı familyName'i
+    paylaşır (RIBBI style linking) → {stil: (ttf_path, otf_path)}
+    previews=True → ({stil: (ttf, otf)}, Regular önizleme path'leri)
+    """
+    print(f"\n{'='*52}")
+    print(f"  SVG → Font Family v7.8")
+    print(f"  Dosya : {svg_label(svg)}")
+    print(f"  Font  : {font_name}  ({', '.join(styles)})")
+    print(f"{'='*52}\n")
+
+    ir = load_glyph_ir(svg, char_order)
+    if ir is None:
+        return ({}, {}) if previews else {}
+
+    results = compile_family(ir, font_name, output_dir, styles, workers, units_per_em)
+
+    print(f"\n{'='*52}")
+    print(f"  ✅ AİLE TAMAMLANDI! {len(results)} stil")
+    for s, (ttf, _) in results.items():
+        print(f"  {s:<11}: {ttf}")
+    print(f"{'='*52}\n")
+    if previews:
+        return results, ir_previews(ir)
+    return results
+
+
 if __name__ == '__main__':
     import argparse
     p = argparse.ArgumentParser()
-    p.add_argument('svg')
+    p.add_argument('svg', help='SVG dosyası veya SVG klasörü (toplu mod)')
     p.add_argument('--name', default='CustomFont')
     p.add_argument('--output', default='./output')
     p.add_argument('--bold', action='store_true')
     p.add_argument('--italic', action='store_true')
+    p.add_argument('--family', action='store_true', help='tek parse ile Regular/Bold/Italic/Bold Italic')
+    p.add_argument('--styles', default=None, help='toplu mod: regular,bold,italic,bolditalic')
+    p.add_argument('--workers', type=int, default=None, help='süreç sayısı (toplu mod / büyük setler)')
+    p.add_argument('--chars', default=None, help='karakter sırasını içeren UTF-8 metin dosyası')
+    p.add_argument('--pua', action='store_true', help='artan şekilleri Private Use alanına ata (ikon fontu)')
+    p.add_argument('--simplify', type=float, default=SIMPLIFY_TOL, help='sadeleştirme toleransı (font birimi, 0=kapalı)')
+    p.add_argument('--no-kern', action='store_true', help='otomatik kerning (GPOS) üretme')
     args = p.parse_args()
-    build_font(args.svg, args.name, args.output, bold=args.bold, italic=args.italic)
+    if os.path.isdir(args.svg):
+        from bulk_convert import convert_directory
+        styles = args.styles or {(False, False): 'regular', (True, False): 'bold',
+                                 (False, True): 'italic', (True, True): 'bolditalic'}[(args.bold, args.italic)]
+        out_zip = os.path.join(args.output, 'fonts.zip')
+        convert_directory(args.svg, out_zip, styles, args.workers)
+    elif args.family:
+        build_family(args.svg, args.name, args.output, workers=args.workers)
+    else:
+        chars = None
+        if args.chars:
+            with open(args.chars, encoding='utf-8') as f:
+                chars = [c for c in f.read() if not c.isspace() or c == ' ']
+        build_font(args.svg, args.name, args.output, char_order=chars, bold=args.bold,
+                   italic=args.italic, workers=args.workers, pua=args.pua,
+                   simplify=args.simplify, kern=not args.no_kern)
@@ -0,0 +1,102 @@
+"""
+font_artifact.py — Derlenmiş fontun bellekteki tek temsili
+==========================================================
+Motorlar TTF'i diske yazıp tekrar açmak yerine bir FontArtifact döndürür:
+
+  art = vectrod_v3.compile_artifact(dna, 'Foo')
+  art.data       → derlenmiş TTF baytları (tek derleme)
+  art.previews   → {ch: {'d', 'adv'}} önizleme path'leri (bellekteki fonttan)
+  art.cmap       → {codepoint: glyph adı}
+  art.stats      → {'glyphs', 'bytes', 'ok', 'fail', ...}
+  art.write('out/Foo_Regular.ttf')   → TTF + OTF + WOFF2/WOFF arka planda yazılır
+  art.wait()                         → {format: path}
+  art.renamed('Bar')                 → aynı glyph'ler, yeni aile adı (yalnız name tablosu)
+
+Aynı istekte font ne yeniden parse edilir ne de diskten tekrar okunur.
+"""
+
+import io, os
+from concurrent.futures import ThreadPoolExecutor
+
+from webfonts import WEB_FORMATS, flavor_bytes, web_path, woff2_available, glyph_paths
+
+PREVIEW_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+
+_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='font-write')
+
+
+class FontArtifact:
+    """Derlenmiş TTF baytları + önizleme path'leri + cmap + istatistik."""
+
+    def __init__(self, font, stats=None, preview_chars=PREVIEW_CHARS):
+        self.previews = glyph_paths(font, preview_chars)
+        self.cmap = dict(font.getBestCmap() or {})
+        buf = io.BytesIO()
+        font.save(buf)
+        self.data = buf.getvalue()
+        self.stats = {'glyphs': max(0, len(font.getGlyphOrder()) - 2),
+                      'bytes': len(self.data), **(stats or {})}
+        self.paths = {}
+        self._job = None
+
+    @property
+    def chars(self):
+        return [chr(cp) for cp in sorted(self.cmap)]
+
+    def renamed(self, font_name):
+        """
+        Aynı font, yeni aile adı → yeni FontArtifact. Sadece 'name' tablosu
+        yeniden derlenir; önizleme, cmap ve istatistik paylaşılır.
+        """
+        from fontTools.ttLib import TTFont
+        font = TTFont(io.BytesIO(self.data), lazy=True, recalcBBoxes=False, recalcTimestamp=False)
+        name = font['name']
+        old = name.getDebugName(1)
+        if old and old != font_name:
+            for rec in name.names:
+                if rec.nameID in (1, 3, 4, 6, 16, 21):
+                    rec.string = rec.toUnicode().replace(old, font_name)
+        buf = io.BytesIO()
+        font.save(buf)
+        art = object.__new__(FontArtifact)
+        art.previews, art.cmap = self.previews, self.cmap
+        art.data = buf.getvalue()
+        art.stats = {**self.stats, 'bytes': len(art.data)}
+        art.paths = {}
+        art._job = None
+        return art
+
+    def write(self, ttf_path, otf=True, web=WEB_FORMATS, background=True):
+        """
+        Tüm dosyaları tek seferde yaz. Yollar hemen self.paths'e girer;
+        yazma arka planda sürer — dosyaya erişmeden önce wait() çağır.
+        """
+        self.paths = {'ttf': ttf_path}
+        if otf:
+            self.paths['otf'] = os.path.splitext(ttf_path)[0] + '.otf'
+        for fmt in web or ():
+            if fmt == 'woff2' and not woff2_available():
+                continue
+            self.paths[fmt] = web_path(ttf_path, fmt)
+        jobs = dict(self.paths)
+        self._job = _writer.submit(self._write, jobs) if background else None
+        if not background:
+            self._write(jobs)
+        return self
+
+    def _write(self, jobs):
+        os.makedirs(os.path.dirname(os.path.abspath(jobs['ttf'])), exist_ok=True)
+        for fmt, path in jobs.items():
+            try:
+                data = self.data if fmt in ('ttf', 'otf') else flavor_bytes(self.data, fmt)
+                with open(path, 'wb') as f:
+                    f.write(data)
+            except Exception as e:
+                print(f"  [{fmt.upper()}] {e}")
+                self.paths.pop(fmt, None)
+
+    def wait(self):
+        if self._job is not None:
+            self._job.result()
+            self._job = None
+        return self.paths
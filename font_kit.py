@@ -0,0 +1,125 @@
+"""
+font_kit.py — Web font kit: unicode-range WOFF2 parçaları + @font-face CSS
+==========================================================================
+Sitesine fontu koyan kullanıcı için hazır paket:
+
+  Foo-basic-latin.woff2   U+0020-007E
+  Foo-latin1.woff2        U+00A0-00FF
+  Foo-latin-ext.woff2     Türkçe ğ ş ı İ + Latin Extended
+  Foo-punctuation.woff2   “ ” – — … € ™
+  Foo.css                 @font-face × parça (font-display + unicode-range)
+  preload.html            <link rel="preload"> (Basic Latin)
+
+Tarayıcı sadece sayfada geçen karakterlerin parçasını indirir.
+Parçalar derlenmiş TTF baytlarından tek geçişte kesilir; kit session
+klasöründe (output/kit/) saklanır ve font değişmedikçe yeniden üretilmez.
+"""
+
+import io, os, re, json, zipfile
+
+from font_subset import subset_bytes, font_hash
+
+# (parça adı, aralıklar) — sıra CSS'teki sıradır
+SHARDS = [
+    ('basic-latin', [(0x0000, 0x007F)]),
+    ('latin1',      [(0x0080, 0x00FF)]),
+    ('latin-ext',   [(0x0100, 0x024F), (0x1E00, 0x1EFF)]),
+    ('punctuation', [(0x2000, 0x206F), (0x20A0, 0x20CF), (0x2100, 0x214F)]),
+]
+DISPLAY = ('auto', 'block', 'swap', 'fallback', 'optional')
+
+
+def _ranges(cps):
+    """[65, 66, 67, 97] → 'U+41-43, U+61' (CSS unicode-range)."""
+    out, cps = [], sorted(cps)
+    i = 0
+    while i < len(cps):
+        j = i
+        while j + 1 < len(cps) and cps[j + 1] == cps[j] + 1:
+            j += 1
+        out.append(f"U+{cps[i]:X}" if i == j else f"U+{cps[i]:X}-{cps[j]:X}")
+        i = j + 1
+    return ', '.join(out)
+
+
+def _font_info(data):
+    from fontTools.ttLib import TTFont
+    font = TTFont(io.BytesIO(data), lazy=True)
+    cmap = set((font.getBestCmap() or {}).keys())
+    family = font['name'].getBestFamilyName() or 'CustomFont'
+    weight = font['OS/2'].usWeightClass if 'OS/2' in font else 400
+    italic = bool(font['post'].italicAngle) if 'post' in font else False
+    font.close()
+    return cmap, family, weight, italic
+
+
+def build_kit(ttf_path, out_dir, display='swap'):
+    """
+    TTF → kit klasörü. Dönen manifest:
+      {'family', 'hash', 'display', 'shards': [{name, file, size, unicode_range}], 'css', 'preload'}
+    Aynı font + display için klasörde geçerli bir kit varsa onu döndürür.
+    """
+    display = display if display in DISPLAY else 'swap'
+    fh = font_hash(ttf_path)
+    man_path = os.path.join(out_dir, 'manifest.json')
+    try:
+        with open(man_path, encoding='utf-8') as f:
+            man = json.load(f)
+        if man.get('hash') == fh and man.get('display') == display and \
+                all(os.path.exists(os.path.join(out_dir, s['file'])) for s in man['shards']):
+            return man
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(ttf_path, 'rb') as f:
+        data = f.read()
+    cmap, family, weight, italic = _font_info(data)
+    base = re.sub(r'[^\w-]', '_', os.path.splitext(os.path.basename(ttf_path))[0])
+    os.makedirs(out_dir, exist_ok=True)
+
+    shards, faces = [], []
+    for name, ranges in SHARDS:
+        cps = [cp for cp in cmap if any(lo <= cp <= hi for lo, hi in ranges)]
+        if not cps:
+            continue
+        fname = f"{base}-{name}.woff2"
+        blob = subset_bytes(data, unicodes=cps, fmt='woff2')
+        with open(os.path.join(out_dir, fname), 'wb') as f:
+            f.write(blob)
+        urange = _ranges(cps)
+        shards.append({'name': name, 'file': fname, 'size': len(blob), 'unicode_range': urange})
+        faces.append(
+            f"/* {name} */\n"
+            f"@font-face {{\n"
+            f"  font-family: '{family}';\n"
+            f"  font-style: {'italic' if italic else 'normal'};\n"
+            f"  font-weight: {weight};\n"
+            f"  font-display: {display};\n"
+            f"  src: url('./{fname}') format('woff2');\n"
+            f"  unicode-range: {urange};\n"
+            f"}}\n")
+
+    css_name = f"{base}.css"
+    with open(os.path.join(out_dir, css_name), 'w', encoding='utf-8') as f:
+        f.write(f"/* {family} — Vectrod web font kit */\n\n" + '\n'.join(faces))
+    first = shards[0]['file'] if shards else None
+    preload = (f'<link rel="preload" href="/fonts/{first}" as="font" type="font/woff2" crossorigin>\n'
+               if first else '')
+    preload += f'<link rel="stylesheet" href="/fonts/{css_name}">\n'
+    with open(os.path.join(out_dir, 'preload.html'), 'w', encoding='utf-8') as f:
+        f.write(preload)
+
+    man = {'family': family, 'hash': fh, 'display': display, 'shards': shards,
+           'css': css_name, 'preload': 'preload.html'}
+    with open(man_path, 'w', encoding='utf-8') as f:
+        json.dump(man, f, ensure_ascii=False, indent=2)
+    print(f"[KIT] {family}: {len(shards)} parça, "
+          f"{sum(s['size'] for s in shards) // 1024}KB woff2 ({display})")
+    return man
+
+
+def write_kit_zip(out_dir, man, fileobj):
+    """Kit klasörü → zip (fileobj'e yazılır)."""
+    with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name in [s['file'] for s in man['shards']] + [man['css'], man['preload']]:
+            zf.write(os.path.join(out_dir, name), name)
@@ -0,0 +1,104 @@
+"""
+font_subset.py — Önizleme için font alt kümesi (fontTools.subset)
+==================================================================
+Tarayıcı örnek metni çizmek için fontun tamamına ihtiyaç duymaz; sadece
+metindeki karakterlerin glyph'leri (+ composite bileşenleri) yeterli.
+
+  • subset_font(path, text)   → (bytes, etag, format)
+  • Önbellek anahtarı: (font içeriğinin sha1'i, normalize metin, format)
+    Aynı font + aynı karakter kümesi tekrar subset'lenmez (LRU).
+  • format: 'ttf' | 'woff' | 'woff2' (woff2 brotli gerektirir, yoksa ttf)
+"""
+
+import io, os, hashlib, threading
+from collections import OrderedDict
+from webfonts import MIME, woff2_available
+
+CACHE_MAX = 256                  # subset sonucu sayısı
+HASH_MAX = 1024                  # hash'i tutulan font dosyası sayısı
+MAX_TEXT = 2000                  # karakter
+
+_cache = OrderedDict()           # (font_sha1, text, fmt) → bytes
+_hashes = OrderedDict()          # path → ((mtime, size), sha1), LRU
+_lock = threading.Lock()
+
+
+def font_hash(path):
+    """Font dosyasının sha1'i — (mtime, size) değişmedikçe bir kez hesaplanır.
+    Dosya başına tek kayıt (eski sürüm üzerine yazılır), en fazla HASH_MAX dosya."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        hit = _hashes.get(path)
+        if hit is not None and hit[0] == stamp:
+            _hashes.move_to_end(path)
+            return hit[1]
+    with open(path, 'rb') as f:
+        h = hashlib.sha1(f.read()).hexdigest()
+    with _lock:
+        _hashes[path] = (stamp, h)
+        _hashes.move_to_end(path)
+        while len(_hashes) > HASH_MAX:
+            _hashes.popitem(last=False)
+    return h
+
+
+def normalize_text(text):
+    """Sıra/tekrar önemsiz: 'baba' ve 'ab' aynı subset'i verir."""
+    return ''.join(sorted(set((text or '')[:MAX_TEXT])))
+
+
+def resolve_format(fmt):
+    fmt = (fmt or 'ttf').lower()
+    if fmt not in ('ttf', 'woff', 'woff2'):
+        fmt = 'ttf'
+    if fmt == 'woff2' and not woff2_available():
+        fmt = 'ttf'
+    return fmt
+
+
+def subset_bytes(font_data, text=None, unicodes=None, fmt='ttf'):
+    """Ham font baytlarından subset üret (önbelleksiz)."""
+    from fontTools.ttLib import TTFont
+    from fontTools import subset
+    opts = subset.Options()
+    opts.layout_features = ['*']
+    opts.name_IDs = ['*']
+    opts.notdef_outline = True
+    opts.recalc_bounds = True
+    opts.drop_tables += ['DSIG']
+    if fmt in ('woff', 'woff2'):
+        opts.flavor = fmt
+    font = TTFont(io.BytesIO(font_data))
+    ss = subset.Subsetter(opts)
+    ss.populate(text=text or '', unicodes=unicodes or [])
+    ss.subset(font)
+    buf = io.BytesIO()
+    font.flavor = opts.flavor
+    font.save(buf)
+    return buf.getvalue()
+
+
+def subset_font(path, text, fmt='ttf'):
+    """
+    Dosyadaki fontu `text` karakterlerine indir. Dönen: (bytes, etag, fmt)
+    Sonuç (font hash, metin, format) anahtarıyla önbelleklenir.
+    """
+    fmt = resolve_format(fmt)
+    text = normalize_text(text) or ' '
+    fh = font_hash(path)
+    key = (fh, text, fmt)
+    etag = hashlib.sha1(f"{fh}|{fmt}|{text}".encode('utf-8')).hexdigest()[:20]
+    with _lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            return data, etag, fmt
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = subset_bytes(raw, text=text, fmt=fmt)
+    with _lock:
+        _cache[key] = data
+        while len(_cache) > CACHE_MAX:
+            _cache.popitem(last=False)
+    return data, etag, fmt
@@ -0,0 +1,226 @@
+"""
+geom_kernel.py — Vektörel stroke / yay geometrisi (tüm motorlar ortak)
+======================================================================
+vectrod_v3.stroke/arc_thick, cyber_engine._stroke/_arc ve
+floral_engine.FloralBuilder.stroke/arc_stroke aynı işi yapıyordu: merkez çizgisinden
+örnekler, normaller, ± sw/2 offset. Primitifler artık bir "band" tanımı
+üretir (PenPath.band); band'ler çizim anında, compile döngülerinde ise
+fontun tamamı için (pen_path.resolve_paths) tek numpy geçişinde çözülür:
+
+  spec = capsule_spec(x1, y1, x2, y2, sw, K=0.5523)        # yuvarlak / sharp uçlu stroke
+  spec = arc_spec(cx, cy, rx, ry, a1, a2, sw, n=20)        # kalın yay (poligon)
+  spec = arc_spec(..., n=24, capped=True, K=0.5523)        # floral: cubic uç kapaklı yay
+  ops  = resolve([spec, ...])   # → her spec için pen komut listesi (RecordingPen biçimi)
+
+Uyarlamalı örnekleme: arc_segments() kiriş hatası ≤ tol olacak şekilde
+parça sayısını eğrilikten hesaplar (VECTROD_ARC_TOL, birim: font birimi).
+tol=0 → motorların sabit n'i (20 / 24) — çıktı eski Python döngüsüyle
+bayt-bayt aynı. Variable font master'ları nokta-uyumlu kalmak zorunda;
+build_variable fixed_segments() içinde çalışır.
+"""
+
+import math, os, threading
+from contextlib import contextmanager
+
+import numpy as np
+
+ARC_TOL = float(os.environ.get('VECTROD_ARC_TOL', 0) or 0)
+ARC_MIN_SEG = 4
+ARC_MAX_SEG = 96
+
+_local = threading.local()
+
+
+# ── ÖRNEKLEME ────────────────────────────────────────────────────
+
+@contextmanager
+def fixed_segments():
+    """Bu thread'de uyarlamalı örneklemeyi kapat (VF master'ları için)."""
+    prev = getattr(_local, 'tol', None)
+    _local.tol = 0.0
+    try:
+        yield
+    finally:
+        _local.tol = prev
+
+
+def current_tol():
+    """Bu thread'de geçerli kiriş toleransı (fixed_segments içinde 0)."""
+    tol = getattr(_local, 'tol', None)
+    return ARC_TOL if tol is None else tol
+
+
+def arc_segments(rx, ry, span, sw, n, tol=None):
+    """
+    Yay parça sayısı. tol ≤ 0 → n (motorun sabit değeri). Aksi halde dış
+    offset eğrisinin en büyük yarıçapı R için kiriş sapması
+    R·(1 − cos(dθ/2)) ≤ tol olacak dθ seçilir.
+    """
+    tol = current_tol() if tol is None else tol
+    if tol <= 0:
+        return n
+    R = max(abs(rx), abs(ry)) + sw / 2
+    if R <= tol:
+        return ARC_MIN_SEG
+    step = 2 * math.acos(1 - tol / R)
+    return max(ARC_MIN_SEG, min(ARC_MAX_SEG, math.ceil(abs(span) / step)))
+
+
+# ── SPEC'LER ─────────────────────────────────────────────────────
+# spec = (tür, n, nd, K, *parametreler) — düz tuple, JSON'a gidip gelebilir
+# (glyph memo); PenPath içinde çözülene kadar bekler.
+
+def capsule_spec(x1, y1, x2, y2, sw, K=0.5523, sharp=False, nd=1):
+    """sw zaten kırpılmış, uzunluk ≥ 1 varsayılır (çağıran kontrol eder)."""
+    return ('bar' if sharp else 'capsule', 0, nd, K, x1, y1, x2, y2, sw / 2)
+
+
+def arc_spec(cx, cy, rx, ry, a1, a2, sw, n=20, capped=False, K=0.5523, nd=1):
+    """a1/a2 radyan, a2 > a1 normalize edilmiş. capped → floral uç kapakları."""
+    return ('capped_arc' if capped else 'arc', n, nd, K, cx, cy, rx, ry, a1, a2, sw / 2)
+
+
+# ── ÇÖZÜM ───────────────────────────────────────────────────────
+
+def resolve(specs):
+    """spec listesi → aynı sırada pen komut listeleri. Aynı tür + n olanlar tek numpy çağrısında."""
+    out = [None] * len(specs)
+    groups = {}
+    for i, s in enumerate(specs):
+        groups.setdefault((s[0], s[1], s[2]), []).append(i)
+    for (kind, n, nd), idx in groups.items():
+        P = np.array([specs[i][3:] for i in idx], dtype=float)
+        if kind == 'capsule' or kind == 'bar':
+            sharp = kind == 'bar'
+            pts, tmpl = _capsules(P, sharp), [_SHARP if sharp else _ROUND] * len(idx)
+        elif kind == 'capped_arc':
+            pts, end_ok, st_ok = _arcs(P, n, True)
+            tmpl = [_capped(n, e, s) for e, s in zip(end_ok, st_ok)]
+        else:
+            pts, tmpl = _arcs(P, n, False), [_poly(2 * (n + 1))] * len(idx)
+        for i, p, t in zip(idx, round_coords(pts, nd).tolist(), tmpl):
+            out[i] = _assemble(p, t)
+    return out
+
+
+def round_coords(a, nd):
+    """Python round(v, nd) ile aynı sonuç, vektörel. Yarıya çok yakın değerler (ikili gösterim
+    belirsizliği) tek tek round()'a bırakılır."""
+    m = 10.0 ** nd
+    s = a * m
+    r = np.rint(s) / m
+    bad = np.abs(s - np.floor(s) - 0.5) < 1e-6
+    if bad.any():
+        r[bad] = [round(v, nd) for v in a[bad].tolist()]
+    return r
+
+
+# Şablonlar: (komut, nokta sayısı); noktalar sırayla tüketilir, 'X' atlar.
+_ROUND = (('M', 1), ('L', 1), ('C', 3), ('C', 3), ('L', 1), ('C', 3), ('C', 3))
+_SHARP = (('M', 1), ('L', 1), ('L', 1), ('L', 1))
+_TEMPLATES = {}
+
+
+def _poly(m):
+    t = _TEMPLATES.get(m)
+    if t is None:
+        t = _TEMPLATES[m] = (('M', 1),) + (('L', 1),) * (m - 1)
+    return t
+
+
+def _capped(n, end_ok, st_ok):
+    """Floral: dış(n+1) · uç kapağı(3) · ters iç(n) · baş kapağı(3); yön ~0 ise kapak yerine L / hiç."""
+    key = (n, end_ok, st_ok)
+    t = _TEMPLATES.get(key)
+    if t is None:
+        t = _TEMPLATES[key] = ((('M', 1),) + (('L', 1),) * n
+                               + ((('C', 3),) if end_ok else (('X', 2), ('L', 1)))
+                               + (('L', 1),) * n
+                               + ((('C', 3),) if st_ok else (('X', 3),)))
+    return t
+
+
+def _assemble(pts, template):
+    """Yuvarlanmış noktalar + şablon → pen komutları; SVG Z kuralı (son nokta başlangıç değilse lineTo)."""
+    rp = list(map(tuple, pts))
+    ops, k, last = [], 0, None
+    for cmd, c in template:
+        if cmd == 'L':
+            last = rp[k]
+            ops.append(('lineTo', (last,)))
+        elif cmd == 'C':
+            last = rp[k + 2]
+            ops.append(('curveTo', (rp[k], rp[k + 1], last)))
+        elif cmd == 'M':
+            last = rp[k]
+            ops.append(('moveTo', (last,)))
+        k += c
+    if last != rp[0]:
+        ops.append(('lineTo', (rp[0],)))
+    ops.append(('closePath', ()))
+    return ops
+
+
+def _capsules(P, sharp):
+    """P: (m, 6) [K, x1, y1, x2, y2, h] → (m, 15|4, 2). İfade sırası eski stroke()'larla aynı."""
+    K, x1, y1, x2, y2, h = P.T
+    dx, dy = x2 - x1, y2 - y1
+    ln = np.hypot(dx, dy)
+    nx, ny = -dy / ln * h, dx / ln * h
+    if sharp:
+        xs = [x1 + nx, x2 + nx, x2 - nx, x1 - nx]
+        ys = [y1 + ny, y2 + ny, y2 - ny, y1 - ny]
+    else:
+        ux, uy = dx / ln * h, dy / ln * h
+        xs = [x1 + nx, x2 + nx,
+              x2 + nx + ux * K, x2 + ux + nx * K, x2 + ux,
+              x2 + ux - nx * K, x2 - nx + ux * K, x2 - nx,
+              x1 - nx,
+              x1 - nx - ux * K, x1 - ux - nx * K, x1 - ux,
+              x1 - ux + nx * K, x1 + nx - ux * K, x1 + nx]
+        ys = [y1 + ny, y2 + ny,
+              y2 + ny + uy * K, y2 + uy + ny * K, y2 + uy,
+              y2 + uy - ny * K, y2 - ny + uy * K, y2 - ny,
+              y1 - ny,
+              y1 - ny - uy * K, y1 - uy - ny * K, y1 - uy,
+              y1 - uy + ny * K, y1 + ny - uy * K, y1 + ny]
+    return np.stack([np.stack(xs, 1), np.stack(ys, 1)], 2)
+
+
+def _arcs(P, n, capped):
+    """
+    P: (m, 8) [K, cx, cy, rx, ry, a1, a2, h] → kontür noktaları.
+    capped=False: dış kenar + ters iç kenar (arc_thick / _arc).
+    capped=True : floral arc_stroke — dış, uç kapağı, ters iç, baş kapağı (+ kapak bayrakları).
+    """
+    K, cx, cy, rx, ry, a1, a2, h = (c[:, None] for c in P.T)
+    i = np.arange(n + 1, dtype=float)
+    t = a1 + (a2 - a1) * (i / n) if capped else a1 + (a2 - a1) * i / n
+    px, py = cx + rx * np.cos(t), cy + ry * np.sin(t)
+    # merkez farkı; uçlarda ileri / geri fark
+    ddx, ddy = np.empty_like(px), np.empty_like(py)
+    ddx[:, 1:-1], ddy[:, 1:-1] = px[:, 2:] - px[:, :-2], py[:, 2:] - py[:, :-2]
+    ddx[:, 0], ddy[:, 0] = px[:, 1] - px[:, 0], py[:, 1] - py[:, 0]
+    ddx[:, -1], ddy[:, -1] = px[:, -1] - px[:, -2], py[:, -1] - py[:, -2]
+    ln = np.hypot(ddx, ddy)
+    ln = np.where(ln < 0.001, 0.001, ln) if capped else np.where(ln == 0, 0.001, ln)
+    nx2, ny2 = -ddy / ln * h, ddx / ln * h
+    ox, oy, ix, iy = px + nx2, py + ny2, px - nx2, py - ny2
+    if not capped:
+        return np.stack([np.concatenate([ox, ix[:, ::-1]], 1),
+                         np.concatenate([oy, iy[:, ::-1]], 1)], 2)
+    ux2, uy2, end_ok = _cap_dir(px[:, -1:] - px[:, -2:-1], py[:, -1:] - py[:, -2:-1], h)
+    ux3, uy3, st_ok = _cap_dir(px[:, 1:2] - px[:, :1], py[:, 1:2] - py[:, :1], h)
+    xs = np.concatenate([ox, ox[:, -1:] + ux2 * K, px[:, -1:] + ux2 + uy2 * K * 0, ix[:, -1:] + ux2 * K,
+                         ix[:, -2::-1], ix[:, :1] - ux3 * K, px[:, :1] - ux3, ox[:, :1] - ux3 * K], 1)
+    ys = np.concatenate([oy, oy[:, -1:] + uy2 * K, py[:, -1:] + uy2, iy[:, -1:] + uy2 * K,
+                         iy[:, -2::-1], iy[:, :1] - uy3 * K, py[:, :1] - uy3, oy[:, :1] - uy3 * K], 1)
+    return np.stack([xs, ys], 2), end_ok[:, 0].tolist(), st_ok[:, 0].tolist()
+
+
+def _cap_dir(dx, dy, h):
+    """Kapak yön vektörü (uzunluk h); yön ~0 → (0, 0) ve bayrak False (kapak çizilmez)."""
+    ln = np.hypot(dx, dy)
+    ok = ln > 0.001
+    ln = np.where(ok, ln, 1.0)
+    return np.where(ok, dx / ln * h, 0.0), np.where(ok, dy / ln * h, 0.0), ok
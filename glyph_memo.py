@@ -0,0 +1,181 @@
+"""
+glyph_memo.py — v3 glyph outline önbelleği (LRU + isteğe bağlı disk)
+====================================================================
+vectrod_v3.GB.build(c, idx) çıktısı yalnızca DNA'nın küçük bir alt kümesine
+bağlı: sw, decoration, deco boyutu, yoğunluk eşikleri (top/base/side) ve
+idx'e göre döndürülmüş shapes sırası. Aynı alt küme → aynı outline:
+
+  from glyph_memo import memo
+  hit = memo.get(key)                 # → JSON'lanabilir değer | None
+  memo.put(key, (path, adv, placed))
+  memo.put(key + ('glyf', tol), glyph_to_data(g))   # derlenmiş quadratic TTGlyph
+  memo.flush()                        # bekleyen disk yazımları
+  memo.stats()                        # {'size', 'hits', 'misses', 'disk_hits', 'path'}
+
+Asıl maliyet SVG parse + sadeleştirme + cu2qu olduğundan derlenmiş glyph'ler
+de (koordinat/flag/kontür sonu) saklanır; sıcak build'de yalnız tablolar kurulur.
+
+Ortam değişkenleri:
+  VECTROD_GLYPH_CACHE_MAX  — bellekteki glyph sayısı (varsayılan 8192, 0 → kapalı)
+  VECTROD_GLYPH_CACHE      — sqlite dosyası; verilirse sıcak yeniden başlatmada
+                             glyph'ler diskten gelir
+
+Anahtarlar motor kaynağının (vectrod_v3.py + shape_library.py + pen_path.py +
+geom_kernel.py + outline_union.py + shape_packs.py + outline_simplify.py) ve
+fontTools / skia-pathops sürümlerinin (cu2qu, union) özetiyle damgalanır —
+geometri kodu ya da kütüphane değişince eski kayıtlar kendiliğinden geçersiz.
+Paket şekilleri anahtara SVG içeriğinin özetiyle girer (shape_library.shape_key).
+"""
+
+import os, json, hashlib, sqlite3, threading
+from collections import OrderedDict
+
+GLYPH_CACHE_MAX = int(os.environ.get('VECTROD_GLYPH_CACHE_MAX', 8192))
+GLYPH_CACHE_PATH = os.environ.get('VECTROD_GLYPH_CACHE', '')
+FLUSH_EVERY = 256
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _lib_versions():
+    import fontTools
+    try:
+        import pathops
+        pv = getattr(pathops, '__version__', '?')
+    except ImportError:
+        pv = '-'
+    return f"fontTools={fontTools.version};pathops={pv}"
+
+
+def _source_stamp(files=('vectrod_v3.py', 'shape_library.py', 'pen_path.py', 'geom_kernel.py',
+                         'outline_union.py', 'shape_packs.py', 'outline_simplify.py')):
+    h = hashlib.sha1()
+    for fn in files:
+        try:
+            with open(os.path.join(_HERE, fn), 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(fn.encode())
+    h.update(_lib_versions().encode())
+    return h.hexdigest()[:12]
+
+
+class GlyphMemo:
+    """(anahtar tuple) → JSON'lanabilir değer. Thread-safe LRU, sqlite ile kalıcı; diskten gelen tuple'lar list olur."""
+
+    def __init__(self, maxsize=GLYPH_CACHE_MAX, path=GLYPH_CACHE_PATH):
+        self.maxsize = maxsize
+        self.path = path or None
+        self.stamp = _source_stamp()
+        self._lru = OrderedDict()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = self.misses = self.disk_hits = 0
+        if self.path and maxsize > 0:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._db = sqlite3.connect(self.path, check_same_thread=False)
+                self._db.execute("CREATE TABLE IF NOT EXISTS glyphs (k TEXT PRIMARY KEY, v TEXT)")
+                self._db.commit()
+            except Exception as e:
+                print(f"  [glyph-memo] disk kapalı: {e}")
+                self._db = None
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    def _k(self, key):
+        return f"{self.stamp}|{key!r}"
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        k = self._k(key)
+        with self._lock:
+            val = self._lru.get(k)
+            if val is not None:
+                self._lru.move_to_end(k)
+                self.hits += 1
+                return val
+            if self._db is not None:
+                row = self._db.execute("SELECT v FROM glyphs WHERE k=?", (k,)).fetchone()
+                if row:
+                    val = json.loads(row[0])
+                    self._insert(k, val)
+                    self.hits += 1; self.disk_hits += 1
+                    return val
+            self.misses += 1
+            return None
+
+    def put(self, key, val):
+        if not self.enabled:
+            return
+        k = self._k(key)
+        with self._lock:
+            self._insert(k, val)
+            if self._db is not None:
+                self._pending.append((k, json.dumps(val, separators=(',', ':'))))
+                if len(self._pending) >= FLUSH_EVERY:
+                    self._flush()
+
+    def _insert(self, k, val):
+        self._lru[k] = val
+        self._lru.move_to_end(k)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        try:
+            self._db.executemany("INSERT OR REPLACE INTO glyphs (k, v) VALUES (?, ?)", self._pending)
+            self._db.commit()
+        except Exception as e:
+            print(f"  [glyph-memo] yazılamadı: {e}")
+        self._pending = []
+
+    def flush(self):
+        with self._lock:
+            if self._db is not None:
+                self._flush()
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._lru.clear()
+            self._pending = []
+            self.hits = self.misses = self.disk_hits = 0
+            if disk and self._db is not None:
+                self._db.execute("DELETE FROM glyphs")
+                self._db.commit()
+
+    def stats(self):
+        return {'size': len(self._lru), 'hits': self.hits, 'misses': self.misses,
+                'disk_hits': self.disk_hits, 'path': self.path}
+
+
+def glyph_to_data(g):
+    """Basit (composite olmayan) TTGlyph → JSON'lanabilir [coords, endPts, flags]."""
+    if g.numberOfContours <= 0:
+        return [[], [], []]
+    return [[int(v) for xy in g.coordinates for v in xy], list(g.endPtsOfContours), list(g.flags)]
+
+
+def glyph_from_data(data):
+    """glyph_to_data'nın tersi — her çağrıda yeni TTGlyph (fontlar arasında paylaşılmaz)."""
+    from array import array
+    from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates
+    from fontTools.ttLib.tables import ttProgram
+    coords, ends, flags = data
+    g = Glyph()
+    g.coordinates = GlyphCoordinates(list(zip(coords[::2], coords[1::2])))
+    g.endPtsOfContours = list(ends)
+    g.flags = array('B', flags)
+    g.numberOfContours = len(ends)
+    g.program = ttProgram.Program()
+    g.program.fromBytecode(b"")
+    return g
+
+
+memo = GlyphMemo()
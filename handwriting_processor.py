@@ -9,7 +9,7 @@ Key improvements over v3:
 - Contour area filtering to remove noise fragments
 - cv2/Pillow dual pipeline
 """
-import os, base64, traceback, io
+import os, traceback, io
 
 try:
     import cv2
@@ -430,7 +430,7 @@ def build_preview(glyph_dict):
 
     buf = io.BytesIO()
     Image.fromarray(canvas).save(buf, format='PNG')
-    return base64.b64encode(buf.getvalue()).decode()
+    return buf.getvalue()          # ham PNG — app.py URL olarak servis eder
 
 
 # ─────────────────────────────────────────────────────────────
@@ -0,0 +1,85 @@
+"""
+http_compress.py — Dinamik yanıtlar için gzip / brotli
+======================================================
+Handler.json_resp gövdeyi buradan geçirir:
+
+  enc  = negotiate(self.headers.get('Accept-Encoding'))   # 'br' | 'gzip' | None
+  body = compress(body, enc)
+
+  • COMPRESS_MIN altındaki gövdeler sıkıştırılmaz (header maliyeti > kazanç)
+  • Seviye ortam değişkenleriyle ayarlanır: VECTROD_GZIP_LEVEL, VECTROD_BROTLI_QUALITY
+  • metrics() → encoding başına adet, giriş/çıkış bayt, oran, süre
+"""
+
+import os, time, gzip, threading
+
+COMPRESS_MIN   = int(os.environ.get('VECTROD_COMPRESS_MIN', 1024))        # bayt
+GZIP_LEVEL     = int(os.environ.get('VECTROD_GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.environ.get('VECTROD_BROTLI_QUALITY', 5))
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_lock = threading.Lock()
+_stats = {}                      # enc → {count, bytes_in, bytes_out, seconds}
+
+
+def negotiate(accept_encoding):
+    """Accept-Encoding başlığından en iyi kodlamayı seç (q=0 olanlar hariç)."""
+    if not accept_encoding:
+        return None
+    prefs = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        prefs[name.strip().lower()] = q
+    star = prefs.get('*', 0.0)
+    for enc in (('br',) if brotli else ()) + ('gzip',):
+        if prefs.get(enc, star) > 0:
+            return enc
+    return None
+
+
+def _encode(body, enc):
+    if enc == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress(body, enc):
+    """body → (sıkıştırılmış gövde, kullanılan kodlama). Eşik altıysa (body, None)."""
+    if not enc or len(body) < COMPRESS_MIN:
+        return body, None
+    t0 = time.perf_counter()
+    out = _encode(body, enc)
+    dt = time.perf_counter() - t0
+    with _lock:
+        s = _stats.setdefault(enc, {'count': 0, 'bytes_in': 0, 'bytes_out': 0, 'seconds': 0.0})
+        s['count'] += 1
+        s['bytes_in'] += len(body)
+        s['bytes_out'] += len(out)
+        s['seconds'] += dt
+    return out, enc
+
+
+def metrics():
+    """Encoding başına sıkıştırma istatistikleri."""
+    with _lock:
+        out = {}
+        for enc, s in _stats.items():
+            out[enc] = {**s,
+                        'ratio': round(s['bytes_out'] / s['bytes_in'], 4) if s['bytes_in'] else None,
+                        'avg_ms': round(s['seconds'] * 1000 / s['count'], 3) if s['count'] else None,
+                        'seconds': round(s['seconds'], 4)}
+        out['config'] = {'min_bytes': COMPRESS_MIN,
+                         'gzip_level': GZIP_LEVEL, 'brotli_quality': BROTLI_QUALITY,
+                         'brotli': brotli is not None}
+        return out
@@ -0,0 +1,410 @@
+"""
+outline_simplify.py — Glyph outline sadeleştirme (cu2qu'dan önce)
+=================================================================
+El yazısı kontürleri ve motorların polyline yayları (arc_thick: yay başına
+20 segment) gereğinden çok nokta taşır. Bu aşama path IR'ı üzerinde çalışır:
+
+  • ardışık lineTo dizileri köşelerden bölünür
+  • düz kısımlar Ramer–Douglas–Peucker ile inceltilir
+  • yumuşak kısımlar en küçük kareler cubic fit (Schneider) ile eğriye çevrilir
+  • ardışık curveTo dizileri örneklenip daha az segmentle yeniden fit edilir
+    (segment sayısı düşmüyorsa orijinaller kalır); qCurveTo'ya dokunulmaz
+
+Tolerans font birimindedir (UPM 1000'de 1.0 ≈ görünmez). 0 → kapalı.
+
+  simp = Simplifier(1.0)
+  SVGPathLib(...).draw(simp.pen(Cu2QuPen(TTGlyphPen(None), 0.5)))
+  cmds = simp.commands(recording.value)
+  simp.report()   → 'noktalar 41210 → 12877 (−68.8%)'
+"""
+
+import os, math
+import numpy as np
+
+TOLERANCE  = float(os.environ.get('VECTROD_SIMPLIFY_TOL', 1.0))   # font birimi
+CORNER_DEG = 35.0        # bu açıdan keskin dönüş köşe sayılır, fit bölünür
+MIN_FIT    = 4           # cubic fit için en az nokta
+BULGE      = 2.0         # noktalar arası izin verilen sapma (× tol) — polyline
+                         # kirişleri gerçek eğrinin biraz içinde kalır
+
+
+# ── RDP ─────────────────────────────────────────────────────────────
+def rdp(pts, tol):
+    """Ramer–Douglas–Peucker → korunan noktaların indeksleri (uçlar dahil)."""
+    n = len(pts)
+    if n < 3:
+        return list(range(n))
+    keep = np.zeros(n, bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        seg = pts[b] - pts[a]
+        rel = pts[a + 1:b] - pts[a]
+        L = math.hypot(seg[0], seg[1])
+        if L < 1e-9:
+            d = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            d = np.abs(rel[:, 0] * seg[1] - rel[:, 1] * seg[0]) / L
+        i = int(np.argmax(d))
+        if d[i] > tol:
+            keep[a + 1 + i] = True
+            stack += [(a, a + 1 + i), (a + 1 + i, b)]
+    return list(np.nonzero(keep)[0])
+
+
+# ── CUBIC FIT (Schneider, Graphics Gems 1990) ───────────────────────
+def _unit(v):
+    n = math.hypot(v[0], v[1])
+    return v / n if n > 1e-9 else v
+
+
+def _basis(t):
+    """Bernstein tabanı → n×4 matris; eğri noktaları = _basis(t) @ ctrl."""
+    mt = 1 - t
+    return np.stack([mt ** 3, 3 * mt * mt * t, 3 * mt * t * t, t ** 3], axis=1)
+
+
+def _bez(ctrl, t):
+    return _basis(t) @ ctrl
+
+
+def _chord_params(pts):
+    d = np.concatenate([[0.0], np.cumsum(np.hypot(*np.diff(pts, axis=0).T))])
+    return d / d[-1] if d[-1] > 0 else np.linspace(0, 1, len(pts))
+
+
+def _generate(pts, B, t1, t2):
+    """Uç teğetleri sabit, kol uzunlukları en küçük karelerle (2×2 sistem). B = _basis(u)"""
+    p0, p3 = pts[0], pts[-1]
+    b1, b2 = B[:, 1], B[:, 2]
+    c00, c11 = b1 @ b1, b2 @ b2
+    c01 = (b1 @ b2) * (t1 @ t2)
+    tmp = pts - np.outer(B[:, 0] + b1, p0) - np.outer(b2 + B[:, 3], p3)
+    x0, x1 = b1 @ (tmp @ t1), b2 @ (tmp @ t2)
+    det = c00 * c11 - c01 * c01
+    seg = math.hypot(*(p3 - p0))
+    a1 = a2 = 0.0
+    if abs(det) > 1e-12:
+        a1 = (x0 * c11 - x1 * c01) / det
+        a2 = (c00 * x1 - c01 * x0) / det
+    if a1 < 1e-6 * seg or a2 < 1e-6 * seg:
+        a1 = a2 = seg / 3                       # Wu/Barsky sezgisi
+    return np.array([p0, p0 + t1 * a1, p3 + t2 * a2, p3])
+
+
+def _reparam(ctrl, pts, u, q):
+    """Newton-Raphson: her noktanın eğri üzerindeki en yakın t'si. q = eğri(u) − pts"""
+    d1 = 3 * np.diff(ctrl, axis=0)
+    d2 = 2 * np.diff(d1, axis=0)
+    uu = u[:, None]
+    q1 = (1 - uu) ** 2 * d1[0] + 2 * (1 - uu) * uu * d1[1] + uu ** 2 * d1[2]
+    q2 = (1 - uu) * d2[0] + uu * d2[1]
+    num = (q * q1).sum(1)
+    den = (q1 * q1).sum(1) + (q * q2).sum(1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nu = np.where(np.abs(den) > 1e-12, u - num / den, u)
+    return np.clip(nu, 0, 1)
+
+
+_DENSE = _basis(np.linspace(0, 1, 33))
+
+
+def _poly_dist(samples, pts):
+    """Eğri örneklerinin polyline'a en büyük uzaklığı (noktalar arası şişmeyi yakalar)."""
+    a, ab = pts[:-1], np.diff(pts, axis=0)
+    L2 = np.maximum((ab * ab).sum(1), 1e-12)
+    rel = samples[:, None, :] - a[None]
+    t = np.clip((rel * ab[None]).sum(2) / L2, 0, 1)
+    d = rel - t[..., None] * ab[None]
+    return float(np.sqrt((d * d).sum(2).min(1).max()))
+
+
+def _end_tangent(pts):
+    """Uç teğeti: 3+ noktada parabol türevi (polyline kirişinden daha isabetli)."""
+    if len(pts) < 3:
+        return _unit(pts[1] - pts[0])
+    t = _unit(-3 * pts[0] + 4 * pts[1] - pts[2])
+    return t if t @ (pts[1] - pts[0]) > 0 else _unit(pts[1] - pts[0])
+
+
+def fit_cubic(pts, tol, t1=None, t2=None, depth=0, limit=None):
+    """
+    Noktalar → [4×2 kontrol noktası dizisi, ...], max sapma ≤ tol.
+    limit: en fazla bu kadar cubic — aşılacaksa None (boşuna bölmeye devam etmez).
+    """
+    if t1 is None:
+        t1 = _end_tangent(pts)
+    if t2 is None:
+        t2 = _end_tangent(pts[::-1])
+    if len(pts) == 2:
+        d = math.hypot(*(pts[1] - pts[0])) / 3
+        ctrl = np.array([pts[0], pts[0] + t1 * d, pts[1] + t2 * d, pts[1]])
+        if _poly_dist(_DENSE @ ctrl, pts) <= BULGE * tol:
+            return [ctrl]
+        return [np.array([pts[0], pts[0] + (pts[1] - pts[0]) / 3,
+                          pts[0] + 2 * (pts[1] - pts[0]) / 3, pts[1]])]
+    u = _chord_params(pts)
+    B = _basis(u)
+    ctrl = _generate(pts, B, t1, t2)
+    for it in range(5):
+        q = B @ ctrl - pts
+        err = np.hypot(q[:, 0], q[:, 1])
+        split = int(np.argmax(err))
+        if err[split] <= tol and _poly_dist(_DENSE @ ctrl, pts) <= BULGE * tol:
+            return [ctrl]
+        if err[split] > tol * 4 or it == 4:
+            break
+        u = _reparam(ctrl, pts, u, q)
+        B = _basis(u)
+        ctrl = _generate(pts, B, t1, t2)
+    split = min(max(split, 1), len(pts) - 2)
+    if limit is not None and limit < 2:
+        return None
+    if depth > 12:
+        return [np.array([a, a + (b - a) / 3, a + 2 * (b - a) / 3, b])
+                for a, b in zip(pts[:-1], pts[1:])]
+    tc = _unit(pts[split - 1] - pts[split + 1])
+    left = fit_cubic(pts[:split + 1], tol, t1, tc, depth + 1, None if limit is None else limit - 1)
+    if left is None:
+        return None
+    right = fit_cubic(pts[split:], tol, -tc, t2, depth + 1,
+                      None if limit is None else limit - len(left))
+    return None if right is None else left + right
+
+
+# ── KONTUR ──────────────────────────────────────────────────────────
+def _turns(pts):
+    """Her noktadaki dönüş açısı (derece, kapalı kabul edilerek)."""
+    prev = pts - np.roll(pts, 1, axis=0)
+    nxt = np.roll(pts, -1, axis=0) - pts
+    cross = prev[:, 0] * nxt[:, 1] - prev[:, 1] * nxt[:, 0]
+    dot = (prev * nxt).sum(1)
+    return np.degrees(np.abs(np.arctan2(cross, dot)))
+
+
+def _corners(pts, closed, ang=None):
+    """Dönüş açısı CORNER_DEG'i aşan nokta indeksleri."""
+    n = len(pts)
+    if n < 3:
+        return []
+    if ang is None:
+        ang = _turns(pts)
+    idx = np.nonzero(ang > CORNER_DEG)[0]
+    if not closed:
+        idx = idx[(idx > 0) & (idx < n - 1)]
+    return list(idx)
+
+
+def _pt(p):
+    return float(p[0]), float(p[1])
+
+
+def _simplify_run(pts, tol):
+    """Köşesiz polyline → [('lineTo', (p,)) | ('curveTo', (c1, c2, p))]."""
+    keep = rdp(pts, tol)
+    if len(keep) < 5 or len(pts) < MIN_FIT:         # 3×cubic < çizgi sayısı olamaz
+        return [('lineTo', (_pt(pts[i]),)) for i in keep[1:]]
+    curves = fit_cubic(pts, tol, limit=(len(keep) - 2) // 3)
+    if curves:
+        return [('curveTo', (_pt(c[1]), _pt(c[2]), _pt(c[3]))) for c in curves]
+    return [('lineTo', (_pt(pts[i]),)) for i in keep[1:]]
+
+
+def _polyline(pts, closed, tol):
+    """lineTo dizisini sadeleştir; kapalıysa ilk noktayı bir köşeye kaydır."""
+    if closed:
+        cs = _corners(pts, True)
+        start = cs[0] if cs else 0
+        pts = np.roll(pts, -start, axis=0)
+        cs = [(c - start) % len(pts) for c in cs] if cs else [len(pts) // 2]
+        pts = np.vstack([pts, pts[:1]])
+        cuts = sorted(set([0] + cs + [len(pts) - 1]))
+    else:
+        cuts = [0] + _corners(pts, False) + [len(pts) - 1]
+    out = []
+    for a, b in zip(cuts[:-1], cuts[1:]):
+        if b > a:
+            out += _simplify_run(pts[a:b + 1], tol)
+    return pts[0], out
+
+
+def _dedupe(pts):
+    keep = np.ones(len(pts), bool)
+    keep[1:] = np.hypot(*np.diff(pts, axis=0).T) > 1e-6
+    return pts[keep]
+
+
+def simplify_contour(contour, tol):
+    """
+    Tek kontur: [(op, args), ...] moveTo ile başlar, closePath/endPath ile biter.
+    lineTo dizileri RDP/fit ile, curveTo dizileri yeniden fit ile sadeleşir.
+    """
+    start = contour[0][1][0]
+    closed = contour[-1][0] == 'closePath'
+    segs = contour[1:-1]
+    if closed and segs and all(op == 'lineTo' for op, _ in segs):
+        pts = _dedupe(np.array([start] + [a[0] for _, a in segs], float))
+        if len(pts) > 1 and math.hypot(*(pts[-1] - pts[0])) < 1e-6:
+            pts = pts[:-1]
+        if len(pts) < 3:
+            return contour
+        p0, body = _polyline(pts, True, tol)
+        if body and body[-1][0] == 'lineTo':
+            body = body[:-1]                   # closePath son çizgiyi kendisi çizer
+        return [('moveTo', (_pt(p0),))] + body + [contour[-1]]
+
+    out, cur = [contour[0]], start
+    i = 0
+    while i < len(segs):
+        op = segs[i][0]
+        j = i
+        while j < len(segs) and segs[j][0] == op:
+            j += 1
+        run = segs[i:j]
+        if op == 'lineTo' and len(run) > 1:
+            out += _line_run(cur, run, tol)
+        elif op == 'curveTo' and len(run) > 1:
+            out += _curve_run(cur, run, tol)
+        else:
+            out += run
+        if run[-1][1] and run[-1][1][-1] is not None:
+            cur = run[-1][1][-1]
+        i = j
+    out.append(contour[-1])
+    return out
+
+
+def _line_run(p0, run, tol):
+    pts = _dedupe(np.array([p0] + [a[0] for _, a in run], float))
+    if len(pts) < 2:
+        return []
+    if len(pts) == 2:
+        return [('lineTo', (_pt(pts[1]),))]
+    return _polyline(pts, False, tol)[1]
+
+
+CURVE_SAMPLES = 8        # cubic segment başına örnek (yeniden fit için)
+MIN_CURVES    = 2
+_SAMPLE       = _basis(np.linspace(0, 1, CURVE_SAMPLES + 1)[1:])
+ARC_MARGIN    = 1.0      # tahmini yay hatası tol'un bu katını aşarsa yeniden fit denenmez
+
+
+def _curve_run(p0, run, tol):
+    """
+    Ardışık curveTo'lar: örnekle, köşelerden böl, daha az cubic'le yeniden fit et.
+    Segment sayısı azalmıyorsa orijinal eğriler korunur.
+    """
+    if len(run) < MIN_CURVES:
+        return run
+    end = run[-1][1][-1]
+    if len(run) <= 4 and math.hypot(end[0] - p0[0], end[1] - p0[1]) < tol:
+        return run                             # ≤4 cubic'lik kapalı döngü (daire) zaten minimal
+    pts, prev = [np.array([p0], float)], p0
+    for _, (c1, c2, p3) in run:
+        pts.append(_SAMPLE @ np.array([prev, c1, c2, p3], float))
+        prev = p3
+    pts = _dedupe(np.vstack(pts))
+    if len(pts) < 3:
+        return run
+    ang = _turns(pts)
+    inner = ang[1:-1]
+    turn = inner[inner <= CORNER_DEG].sum()
+    if turn > 1:
+        # birleşik cubic'lerin her biri span = turn/(n−1) derecelik yay: daire yayı
+        # yaklaşık hatası r·2.7e-4·(span/90)^6 tol'u aşacaksa fit denenmez
+        span = turn / (len(run) - 1)
+        r = np.hypot(*np.diff(pts, axis=0).T).sum() / math.radians(turn)
+        if span > 180 or r * 2.7e-4 * (span / 90) ** 6 > tol * ARC_MARGIN:
+            return run
+    cuts = [0] + _corners(pts, False, ang) + [len(pts) - 1]
+    curves = []
+    for a, b in zip(cuts[:-1], cuts[1:]):
+        if b > a:
+            fit = fit_cubic(pts[a:b + 1], tol, limit=len(run) - 1 - len(curves))
+            if fit is None:
+                return run
+            curves += fit
+    if not curves or len(curves) >= len(run):
+        return run
+    return [('curveTo', (_pt(c[1]), _pt(c[2]), _pt(c[3]))) for c in curves]
+
+
+def count_points(commands):
+    return sum(len(args) for op, args in commands if op not in ('closePath', 'endPath'))
+
+
+class Simplifier:
+    """Tolerans + font başına nokta sayacı (öncesi / sonrası)."""
+
+    def __init__(self, tolerance=TOLERANCE):
+        self.tolerance = tolerance
+        self.before = self.after = 0
+
+    def commands(self, commands):
+        """RecordingPen komutları → sadeleştirilmiş komutlar."""
+        n0 = count_points(commands)
+        if self.tolerance <= 0:
+            self.before += n0
+            self.after += n0
+            return commands
+        out, cur = [], []
+        for op, args in commands:
+            cur.append((op, args))
+            if op in ('closePath', 'endPath'):
+                try:
+                    out += simplify_contour(cur, self.tolerance) if cur[0][0] == 'moveTo' else cur
+                except Exception:
+                    out += cur
+                cur = []
+        out += cur
+        self.before += n0
+        self.after += count_points(out)
+        return out
+
+    def pen(self, out_pen):
+        """Çizimi kaydedip sadeleştirilmiş halini out_pen'e aktaran filtre pen."""
+        return _SimplifyPen(self, out_pen)
+
+    def merge(self, counts):
+        self.before += counts[0]
+        self.after += counts[1]
+
+    @property
+    def counts(self):
+        return self.before, self.after
+
+    @property
+    def stats(self):
+        red = 1 - self.after / self.before if self.before else 0.0
+        return {'tolerance': self.tolerance, 'points_before': self.before,
+                'points_after': self.after, 'reduction': round(red, 4)}
+
+    def report(self):
+        s = self.stats
+        return (f"noktalar {s['points_before']} → {s['points_after']} "
+                f"(−{s['reduction'] * 100:.1f}%, tol={self.tolerance:g})")
+
+
+class _SimplifyPen:
+    def __init__(self, simp, out_pen):
+        from fontTools.pens.recordingPen import RecordingPen
+        self.simp, self.out, self.rec = simp, out_pen, RecordingPen()
+
+    def __getattr__(self, name):
+        return getattr(self.rec, name)
+
+    def _flush(self):
+        from fontTools.pens.recordingPen import replayRecording
+        replayRecording(self.simp.commands(self.rec.value), self.out)
+        self.rec.value = []
+
+    def closePath(self):
+        self.rec.closePath()
+        self._flush()
+
+    def endPath(self):
+        self.rec.endPath()
+        self._flush()
@@ -0,0 +1,276 @@
+"""
+pen_path.py — Pen-native çizim IR'ı (SVG string'siz)
+====================================================
+Motor primitifleri (stroke, arc, oval, ...) f-string ile SVG path yazıp
+_to_glyph'te <svg> belgesine sarıp yeniden parse ettirmek yerine doğrudan
+bir PenPath'e çizer. PenPath, RecordingPen biçiminde bir kayıttır; fontTools
+pen'lerine olduğu gibi oynatılır — format + XML + parse sıcak döngüden çıkar.
+SVG yalnızca önizleme için serileştirilir:
+
+  p = PenPath().M(10, 0).L(90, 0).C(95, 0, 100, 5, 100, 10).Z()
+  q = join(p, stroke(...), '')       # boş parçalar atlanır; str parçalar parse edilir
+  q.draw(Cu2QuPen(TTGlyphPen(None), 0.5, reverse_direction=True))
+  str(q)                             # → 'M10,0 L90,0 C95,0 100,5 100,10 L10,0 Z'
+  PenPath.load(q.dump())             # JSON'lanabilir kayıt (glyph memo)
+  PenPath().band(capsule_spec(...))  # stroke/yay: geom_kernel'de toplu çözülür
+
+band() ile eklenen kontürler (stroke kapsülleri, kalın yaylar) ilk okumada
+(draw / svg) tek numpy geçişinde hesaplanır; join() bekleyen band'leri
+birleştirir, resolve_paths() bir fontun tüm glyph'lerini tek çağrıda çözer.
+
+Koordinatlar eski format hassasiyetinde yuvarlanır (nd=1 ↔ '{:.1f}') ve
+M/L/C/Q/Z SVG parser'ının pen çağrılarını birebir üretir (Z başlangıca
+dönmüyorsa lineTo ekler, açık alt yol endPath ile biter) → string yoluyla
+derlenen fontla bayt-bayt aynı çıktı.
+"""
+
+from fontTools.svgLib.path.parser import parse_path
+
+from geom_kernel import resolve
+
+
+class PenPath:
+    """Kayıtlı pen komutları. M/L/C/Q/Z: SVG anlamlı kurucular; moveTo/...: ham pen protokolü."""
+
+    __slots__ = ('_ops', '_bands', 'nd', '_start', '_cur', '_open')
+
+    def __init__(self, nd=1):
+        self._ops = []
+        self._bands = None
+        self.nd = nd
+        self._start = self._cur = None
+        self._open = False
+
+    @property
+    def value(self):
+        """RecordingPen.value biçiminde komutlar (bekleyen band'ler burada çözülür)."""
+        if self._bands:
+            self._splice(resolve(self._bands))
+        return self._ops
+
+    @value.setter
+    def value(self, ops):
+        self._ops, self._bands = ops, None
+
+    def _splice(self, res):
+        ops = []
+        for op in self._ops:
+            if op[0] == 'band':
+                ops.extend(res[op[1]])
+            else:
+                ops.append(op)
+        self._ops, self._bands = ops, None
+
+    def _pt(self, x, y):
+        nd = self.nd
+        return (float(round(x, nd)), float(round(y, nd)))
+
+    def _reopen(self):
+        # SVG: Z'den sonra M'siz komut → alt yol aynı başlangıçtan devam eder
+        if not self._open and self._start is not None:
+            self._ops.append(('moveTo', (self._start,)))
+            self._open = True
+
+    # ── SVG kurucuları (zincirlenebilir) ────────────────────────────
+    def M(self, x, y):
+        if self._open:
+            self._ops.append(('endPath', ()))
+        p = self._pt(x, y)
+        self._ops.append(('moveTo', (p,)))
+        self._start = self._cur = p
+        self._open = True
+        return self
+
+    def L(self, x, y):
+        self._reopen()
+        p = self._pt(x, y)
+        self._ops.append(('lineTo', (p,)))
+        self._cur = p
+        return self
+
+    def C(self, x1, y1, x2, y2, x, y):
+        self._reopen()
+        p = self._pt(x, y)
+        self._ops.append(('curveTo', (self._pt(x1, y1), self._pt(x2, y2), p)))
+        self._cur = p
+        return self
+
+    def Q(self, x1, y1, x, y):
+        self._reopen()
+        p = self._pt(x, y)
+        self._ops.append(('qCurveTo', (self._pt(x1, y1), p)))
+        self._cur = p
+        return self
+
+    def Z(self):
+        if self._open:
+            if self._cur != self._start:
+                self._ops.append(('lineTo', (self._start,)))
+            self._ops.append(('closePath', ()))
+            self._cur = self._start
+            self._open = False
+        return self
+
+    def poly(self, pts, close=True):
+        """Çokgen: ilk nokta M, kalanlar L."""
+        it = iter(pts)
+        self.M(*next(it))
+        for x, y in it:
+            self.L(x, y)
+        return self.Z() if close else self
+
+    def band(self, spec):
+        """geom_kernel spec'i (capsule_spec / arc_spec) → kapalı kontür, çözümü ertelenir."""
+        if self._open:
+            self._ops.append(('endPath', ()))
+        if self._bands is None:
+            self._bands = []
+        self._ops.append(('band', len(self._bands)))
+        self._bands.append(spec)
+        self._start = self._cur = None
+        self._open = False
+        return self
+
+    # ── pen protokolü (parse_path / başka çizimler buraya kaydeder) ──
+    def moveTo(self, pt):
+        if self._open:
+            self._ops.append(('endPath', ()))
+        self._ops.append(('moveTo', (pt,)))
+        self._start = self._cur = pt
+        self._open = True
+
+    def lineTo(self, pt):
+        self._ops.append(('lineTo', (pt,)))
+        self._cur = pt
+
+    def curveTo(self, *pts):
+        self._ops.append(('curveTo', pts))
+        self._cur = pts[-1]
+
+    def qCurveTo(self, *pts):
+        self._ops.append(('qCurveTo', pts))
+        self._cur = pts[-1]
+
+    def closePath(self):
+        self._ops.append(('closePath', ()))
+        self._cur = self._start
+        self._open = False
+
+    def endPath(self):
+        self._ops.append(('endPath', ()))
+        self._open = False
+
+    # ── birleştirme ─────────────────────────────────────────────────
+    def extend(self, other):
+        """PenPath ya da SVG d string'i sona ekle (string yalnız burada parse edilir)."""
+        if isinstance(other, PenPath):
+            if not other._ops:
+                return self
+            if self._open:
+                self.endPath()
+            if other._bands:
+                if self._bands is None:
+                    self._bands = []
+                base = len(self._bands)
+                self._ops.extend(('band', op[1] + base) if op[0] == 'band' else op for op in other._ops)
+                self._bands.extend(other._bands)
+            else:
+                self._ops.extend(other._ops)
+            self._start, self._cur, self._open = other._start, other._cur, other._open
+        elif other and other.strip():
+            if self._open:
+                self.endPath()
+            parse_path(other, self)
+        return self
+
+    def __bool__(self):
+        return bool(self._ops)
+
+    def __add__(self, other):
+        return PenPath(self.nd).extend(self).extend(other)
+
+    def __radd__(self, other):
+        return PenPath(self.nd).extend(other).extend(self)
+
+    def strip(self):
+        """str uyumluluğu: `p.strip()` çağıran eski kod için."""
+        return self
+
+    # ── çıktı ───────────────────────────────────────────────────────
+    def draw(self, pen):
+        for op, args in self.value:
+            getattr(pen, op)(*args)
+        if self._open:
+            pen.endPath()
+
+    def dump(self):
+        """JSON'lanabilir kayıt; bekleyen band'ler spec olarak kalır (çözülmeden)."""
+        bands = self._bands
+        return ([['band', list(bands[args])] if op == 'band' else [op, [list(a) for a in args]]
+                 for op, args in self._ops] + ([['endPath', []]] if self._open else []))
+
+    @classmethod
+    def load(cls, data, nd=1):
+        p = cls(nd)
+        for op, args in data:
+            if op == 'band':
+                p.band(tuple(args))
+            else:
+                p._ops.append((op, tuple(tuple(a) for a in args)))
+        return p
+
+    def svg(self):
+        """SVG path d (önizleme serileştirici) — yuvarlanmış koordinatlar kayıpsız yazılır."""
+        out = []
+        for op, args in self.value:
+            if op == 'closePath':
+                out.append('Z')
+            elif op != 'endPath':
+                out.append(_CMD[op] + ' '.join(f"{_num(x)},{_num(y)}" for x, y in args))
+        return ' '.join(out)
+
+    __str__ = svg
+
+    def __repr__(self):
+        return f"PenPath({len(self._ops)} ops)"
+
+
+_CMD = {'moveTo': 'M', 'lineTo': 'L', 'curveTo': 'C', 'qCurveTo': 'Q'}
+
+
+def _num(v):
+    s = f"{v:.3f}".rstrip('0').rstrip('.')
+    return '0' if s in ('', '-0') else s
+
+
+def join(*parts):
+    """Eski `_j` karşılığı: boş / boşluk parçaları atlar, PenPath ve str karışık olabilir."""
+    out = PenPath()
+    for p in parts:
+        if p:
+            out.extend(p)
+    return out
+
+
+def resolve_paths(paths):
+    """Birden çok PenPath'in bekleyen band'lerini tek geom_kernel çağrısında çöz (font başına bir kez)."""
+    pending = [p for p in paths if isinstance(p, PenPath) and p._bands]
+    res = resolve([s for p in pending for s in p._bands]) if pending else ()
+    k = 0
+    for p in pending:
+        n = len(p._bands)
+        p._splice(res[k:k + n])
+        k += n
+
+
+def as_path(path):
+    """PenPath | SVG d string → PenPath."""
+    return path if isinstance(path, PenPath) else PenPath().extend(path)
+
+
+def draw_path(path, pen):
+    """PenPath ya da SVG d string'ini pen'e çiz (string: XML sarmadan doğrudan parse_path)."""
+    if isinstance(path, PenPath):
+        path.draw(pen)
+    elif path:
+        parse_path(path, pen)
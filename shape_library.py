@@ -12,8 +12,21 @@ Shape catalog:
   ORNAMENT:  scroll, flourish, swash, serif_bracket, ink_drop, teardrop,
              spiral_arm, crown_spike, fleur_de_lis_tip, wave_crest
   RETRO:     lightning, gear_tooth, banner_end, rivet, starburst_ray
+
+Placement: shapes compile once to numpy point arrays; place() / place_path()
+/ place_many() rotate+scale all points in one vectorized step (see
+COMPILED SHAPES).
+
+Custom packs: SVG folders compiled to the same arrays and registered as
+'<pack>/<name>' (see shape_packs, SHAPE PACKS).
 """
-import math
+import math, re, threading
+from collections import OrderedDict
+
+import numpy as np
+
+from geom_kernel import round_coords
+from pen_path import PenPath
 
 
 # ── HELPERS ─────────────────────────────────────────────
@@ -54,43 +67,150 @@ def _scale_path(d, sx, sy, tx, ty):
             i += 1
     return ' '.join(result)
 
-def place(shape_path, cx, cy, size, angle_deg=0):
-    """
-    Place a unit shape (centered at 0,0, radius ~0.5) at (cx,cy) with given size.
-    angle_deg: rotation in degrees
-    Returns scaled+rotated SVG path string.
-    """
-    # Parse, rotate, scale, translate
-    import re
-    tokens = re.findall(r'[MCLCSZz]|[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', shape_path)
-    angle = math.radians(angle_deg)
+# ── COMPILED SHAPES ─────────────────────────────────────
+# Shape path'leri bir kez (komut, nokta sayısı) dizisi + (N,2) numpy nokta
+# dizisine derlenir; yerleştirme = tüm noktalara tek vektörel döndür+ölçekle
+# (+ ötele). Döndürülmüş/ölçeklenmiş birim şekil (shape, size, angle) ile
+# önbellekte; place_many aynı anda birçok yerleşimi tek broadcast'te çözer.
+#
+#   place(get_shape('leaf'), 100, 200, 80, 30)   → SVG d string (eski biçim, .2f)
+#   place_path('leaf', 100, 200, 80, 30)         → PenPath (join/draw_path'e doğrudan)
+#   place_many('leaf', [(cx, cy, size, angle), ...])  → [PenPath, ...]
 
-    def transform_pt(x, y):
-        rx, ry = _rotate_pt(float(x), float(y), angle)
-        return rx * size + cx, ry * size + cy
+PLACE_CACHE_MAX = 2048
+_TOKENS = re.compile(r'[MCLCSZz]|[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+_compiled = {}                  # shape adı | path string → (cmds, pts)
+_placed = OrderedDict()         # (shape, size, angle) → (xs, ys) — ötelenmemiş
+_lock = threading.Lock()
 
-    result = []
+
+def compile_path(d):
+    """
+    SVG path (M/L/C/Z) → (cmds, pts). cmds: ((komut, nokta sayısı), ...),
+    pts: (N, 2) float dizisi. Tokenizer place()'in eski döngüsüyle aynı kuralda.
+    """
+    tokens = _TOKENS.findall(d)
+    cmds, pts = [], []
     i = 0
     while i < len(tokens):
         t = tokens[i]
         if t in 'ML':
-            result.append(t); i += 1
+            i += 1; n = 0
             while i < len(tokens) and tokens[i] not in 'MCLCSZzmls':
-                px, py = transform_pt(tokens[i], tokens[i+1])
-                result.append(f"{px:.2f},{py:.2f}")
+                pts.append((float(tokens[i]), float(tokens[i+1]))); n += 1
                 i += 2
+            cmds.append((t, n))
         elif t == 'C':
-            result.append('C'); i += 1
+            i += 1; n = 0
             for _ in range(3):
                 if i+1 < len(tokens):
-                    px, py = transform_pt(tokens[i], tokens[i+1])
-                    result.append(f"{px:.2f},{py:.2f}")
+                    pts.append((float(tokens[i]), float(tokens[i+1]))); n += 1
                     i += 2
+            cmds.append(('C', n))
         elif t in 'Zz':
-            result.append('Z'); i += 1
+            cmds.append(('Z', 0)); i += 1
         else:
-            result.append(t); i += 1
-    return ' '.join(result)
+            i += 1
+    return tuple(cmds), np.array(pts, dtype=float).reshape(-1, 2)
+
+
+def compiled(shape):
+    """Shape adı ya da path string → derlenmiş (cmds, pts); her şekil bir kez üretilir."""
+    hit = _compiled.get(shape)
+    if hit is None:
+        _ensure_packs()
+        if shape in PACK_SHAPES:
+            return _compiled[shape]
+        hit = _compiled[shape] = compile_path(shape if shape.lstrip().startswith('M') else get_shape(shape))
+    return hit
+
+
+def _transform(shape, items):
+    """items: [(size, angle_deg)] → her biri için (xs, ys); eksikler tek broadcast'te."""
+    out = [None] * len(items)
+    miss = []
+    with _lock:
+        for j, (size, ang) in enumerate(items):
+            hit = _placed.get((shape, size, ang))
+            if hit is None:
+                miss.append(j)
+            else:
+                _placed.move_to_end((shape, size, ang))
+                out[j] = hit
+    if miss:
+        _, pts = compiled(shape)
+        size = np.array([items[j][0] for j in miss], dtype=float)[:, None]
+        rad = [math.radians(items[j][1]) for j in miss]      # libm cos/sin — eski place() ile bit-aynı
+        c = np.array([math.cos(a) for a in rad])[:, None]
+        s = np.array([math.sin(a) for a in rad])[:, None]
+        x, y = pts[:, 0], pts[:, 1]
+        xs, ys = (x*c - y*s) * size, (x*s + y*c) * size
+        with _lock:
+            for k, j in enumerate(miss):
+                out[j] = _placed[(shape,) + tuple(items[j])] = (xs[k], ys[k])
+            while len(_placed) > PLACE_CACHE_MAX:
+                _placed.popitem(last=False)
+    return out
+
+
+def _pen_path(cmds, pts):
+    """Derlenmiş komutlar + yuvarlanmış noktalar → PenPath (parse_path'in M/L/C/Z anlamıyla)."""
+    p = PenPath(2)
+    k = 0
+    for cmd, n in cmds:
+        if cmd == 'Z':
+            p.Z(); continue
+        seg = pts[k:k+n]; k += n
+        if cmd == 'C':
+            if n == 3: p.curveTo(*seg)
+        elif cmd == 'M' and seg:
+            p.moveTo(seg[0])
+            for q in seg[1:]: p.lineTo(q)
+        else:
+            for q in seg: p.lineTo(q)
+    return p
+
+
+def place_many(shape, placements, as_str=False):
+    """
+    Bir şeklin birçok yerleşimi tek çağrıda: placements = [(cx, cy, size, angle_deg), ...].
+    shape: SHAPES adı ya da path string. → PenPath listesi (as_str → eski biçim d string'leri).
+    """
+    placements = list(placements)
+    if not placements:
+        return []
+    cmds, _ = compiled(shape)
+    units = _transform(shape, [(size, ang) for _, _, size, ang in placements])
+    xs = np.stack([u[0] for u in units]) + np.array([p[0] for p in placements], dtype=float)[:, None]
+    ys = np.stack([u[1] for u in units]) + np.array([p[1] for p in placements], dtype=float)[:, None]
+    if as_str:
+        return [_svg(cmds, x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+    r = np.stack([round_coords(xs, 2), round_coords(ys, 2)], 2).tolist()
+    return [_pen_path(cmds, list(map(tuple, q))) for q in r]
+
+
+def _svg(cmds, xs, ys, fmt='.2f'):
+    out, k = [], 0
+    for cmd, n in cmds:
+        out.append(cmd)
+        for x, y in zip(xs[k:k+n], ys[k:k+n]):
+            out.append(f"{x:{fmt}},{y:{fmt}}")
+        k += n
+    return ' '.join(out)
+
+
+def place_path(shape, cx, cy, size, angle_deg=0):
+    """place() karşılığı, PenPath döner (string format + parse yok)."""
+    return place_many(shape, [(cx, cy, size, angle_deg)])[0]
+
+
+def place(shape_path, cx, cy, size, angle_deg=0):
+    """
+    Place a unit shape (centered at 0,0, radius ~0.5) at (cx,cy) with given size.
+    angle_deg: rotation in degrees
+    Returns scaled+rotated SVG path string.
+    """
+    return place_many(shape_path, [(cx, cy, size, angle_deg)], as_str=True)[0]
 
 
 # ════════════════════════════════════════════════════════
@@ -401,22 +521,17 @@ def gear_tooth() -> str:
 
 def build_flower_cluster(n=3, radius=0.5, petals=5, size=0.4) -> str:
     """Multiple small flowers arranged in a circle."""
-    parts = []
+    spots = []
     for i in range(n):
         a = 2 * math.pi * i / n
-        cx = radius * math.cos(a) * 0.6
-        cy = radius * math.sin(a) * 0.6
-        parts.append(place(flower(petals), cx, cy, size))
-    return ' '.join(parts)
+        spots.append((radius * math.cos(a) * 0.6, radius * math.sin(a) * 0.6, size, 0))
+    return ' '.join(place_many(flower(petals), spots, as_str=True))
 
 
 def build_starburst(rays=8, inner_r=0.15, outer_r=0.5) -> str:
     """Full starburst from rotated rays."""
-    parts = []
-    for i in range(rays):
-        a = 360 * i / rays
-        parts.append(place(starburst_ray(), 0, 0, outer_r, a))
-    return ' '.join(parts)
+    return ' '.join(place_many(starburst_ray(), [(0, 0, outer_r, 360 * i / rays) for i in range(rays)],
+                               as_str=True))
 
 
 def build_snowflake_full() -> str:
@@ -466,19 +581,70 @@ SHAPES = {
 }
 
 
+_shape_strs = {}                # ad → üretilmiş path (generator'lar bir kez koşar)
+
+
+# ── SHAPE PACKS ─────────────────────────────────────────
+# SVG klasörlerinden gelen şekiller (bkz. shape_packs) '<paket>/<ad>' adıyla
+# doğrudan derlenmiş biçimde kaydedilir; DNA 'shapes' listesi bu adları
+# dahili şekillerle karışık kullanabilir. VECTROD_SHAPE_PACKS ilk aramada yüklenir.
+
+PACK_SHAPES = {}                # paket şekli adı → içerik özeti (glyph memo anahtarına girer)
+_packs_ready = False
+_packs_lock = threading.Lock()
+
+
+def _ensure_packs():
+    global _packs_ready
+    if _packs_ready:
+        return
+    with _packs_lock:
+        if not _packs_ready:
+            try:
+                from shape_packs import load_env_packs
+                load_env_packs()
+            finally:
+                _packs_ready = True
+
+
+def register_shape(name, cmds, pts, token=''):
+    """Derlenmiş (cmds, pts) şeklini ada bağla; aynı ad yeniden kaydedilirse eski yerleşimler düşer."""
+    pts = np.asarray(pts, dtype=float).reshape(-1, 2)
+    with _lock:
+        _compiled[name] = (tuple(cmds), pts)
+        _shape_strs[name] = _svg(cmds, *pts.T.tolist(), fmt='.4f')
+        PACK_SHAPES[name] = token
+        for k in [k for k in _placed if k[0] == name]:
+            del _placed[k]
+
+
+def shape_key(name):
+    """Önbellek anahtarları için: dahili şekil → ad, paket şekli → 'ad@özet' (SVG değişince anahtar da değişir)."""
+    _ensure_packs()
+    token = PACK_SHAPES.get(name)
+    return name if token is None else f"{name}@{token}"
+
+
 def get_shape(name: str) -> str:
     """Get a shape path by name. Returns unit-scale CW path."""
+    d = _shape_strs.get(name)
+    if d is not None:
+        return d
     entry = SHAPES.get(name)
     if not entry:
+        _ensure_packs()
+        if name in _shape_strs:
+            return _shape_strs[name]
         # Safe fallback — never use stars
         safe = {'floral':'flower','cyber':'diamond','gothic':'crown_spike',
                 'kawaii':'heart','retro':'diamond','minimal':'petal'}
         fallback = 'flower'
         print(f"[Shape] Unknown: '{name}', using {fallback}")
-        entry = SHAPES[fallback]
-    fn = entry[0]
-    return fn()
+        return get_shape(fallback)
+    d = _shape_strs[name] = entry[0]()
+    return d
 
 
 def list_shapes() -> list:
-    return list(SHAPES.keys())
+    _ensure_packs()
+    return list(SHAPES.keys()) + list(PACK_SHAPES)
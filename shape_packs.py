@@ -0,0 +1,231 @@
+"""
+shape_packs.py — SVG'den özel dekorasyon şekil paketleri (disk önbellekli)
+==========================================================================
+shape_library.SHAPES Python fonksiyonlarından oluşan sabit bir kayıt. Paket =
+SVG dosyalarından oluşan bir klasör; her dosya bir şekil olur, birim kutuya
+normalize edilip dahili şekillerle aynı (cmds, pts) dizi biçimine derlenir:
+
+  from shape_packs import load_pack
+  load_pack('packs/botanik')          # → ['botanik/fern', 'botanik/acorn', ...]
+  dna['shapes'] = ['botanik/fern', 'leaf']     # DNA paket şekline doğrudan başvurur
+
+  VECTROD_SHAPE_PACKS=packs/botanik:packs/deco python app.py
+                                      # ilk get_shape / place'te otomatik yüklenir
+
+Dönüşüm: <path> + rect/circle/ellipse/polygon/polyline (ata transform'larıyla,
+defs/clipPath/mask hariç) → skia-pathops union (fill-rule korunur, örtüşmeler
+tek kontür; pathops yoksa atlanır) → merkez (0,0), uzun kenar 1 (±0.5).
+Koordinatlar dahili şekiller gibi SVG yönünde (y aşağı) kalır.
+
+Derlenmiş diziler paket başına tek npz'de, dosya içeriğinin sha1'iyle
+anahtarlı: açılışta yalnız değişen SVG'ler yeniden derlenir, gerisi
+milisaniyeler içinde npz'den gelir.
+
+Ortam değişkenleri:
+  VECTROD_SHAPE_PACKS  — os.pathsep ile ayrılmış paket klasörleri
+  VECTROD_SHAPE_CACHE  — npz klasörü (varsayılan: paketin kendi klasörü,
+                         dosya adı .vectrod_shapes.npz)
+"""
+
+import os, time, hashlib, threading
+
+import numpy as np
+from fontTools.misc.transform import Identity
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.transformPen import TransformPen
+from fontTools.svgLib.path.parser import parse_path
+from fontTools.svgLib.path.shapes import PathBuilder
+
+from svg_cluster import _SKIP, _tag, parse_transform
+
+PACK_DIRS = [p for p in os.environ.get('VECTROD_SHAPE_PACKS', '').split(os.pathsep) if p.strip()]
+CACHE_DIR = os.environ.get('VECTROD_SHAPE_CACHE', '')
+CACHE_NAME = '.vectrod_shapes.npz'
+FORMAT = 1                      # npz düzeni / derleme kuralı değişirse artır
+ND = 4                          # dahili şekillerin '{:.4f}' hassasiyeti
+
+_CODES = 'MLCZ'
+_COUNTS = {'M': 1, 'L': 1, 'C': 3, 'Z': 0}
+_lock = threading.Lock()
+_loaded = {}                    # paket klasörü → şekil adları
+
+
+# ── SVG → KOMUTLAR ───────────────────────────────────────────────
+
+def _parse(data):
+    from lxml import etree
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+    return etree.fromstring(data, parser)
+
+
+def _fill_rule(elem):
+    style = dict(kv.split(':', 1) for kv in (elem.get('style') or '').replace(' ', '').split(';') if ':' in kv)
+    return style.get('fill-rule') or elem.get('fill-rule')
+
+
+def svg_ops(data):
+    """SVG baytları → (RecordingPen komutları mutlak koordinatta, fill kuralı)."""
+    root = _parse(data)
+    rec, rules = RecordingPen(), set()
+
+    def walk(elem, ctm, rule):
+        if not isinstance(elem.tag, str) or _tag(elem) in _SKIP:
+            return
+        if elem.get('transform'):
+            ctm = ctm.transform(parse_transform(elem.get('transform')))
+        rule = _fill_rule(elem) or rule
+        pb = PathBuilder()
+        if pb.add_path_from_element(elem):
+            pen = TransformPen(rec, ctm) if ctm != Identity else rec
+            for d in pb.paths:
+                try:
+                    parse_path(d, pen)
+                except Exception:
+                    continue
+                rules.add(rule)
+        for child in elem:
+            walk(child, ctm, rule)
+
+    walk(root, Identity, 'nonzero')
+    return rec.value, 'evenodd' if rules == {'evenodd'} else 'nonzero'
+
+
+class _Compiler(BasePen):
+    """Pen → (komut, nokta sayısı) + nokta listesi. Quadratic'ler cubic'e çevrilir, açık yollar kapanır."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.cmds, self.pts = [], []
+
+    def _moveTo(self, pt):
+        self.cmds.append('M'); self.pts.append(pt)
+
+    def _lineTo(self, pt):
+        self.cmds.append('L'); self.pts.append(pt)
+
+    def _curveToOne(self, p1, p2, p3):
+        self.cmds.append('C'); self.pts.extend((p1, p2, p3))
+
+    def _closePath(self):
+        self.cmds.append('Z')
+
+    _endPath = _closePath
+
+
+def compile_svg(data):
+    """SVG baytları → (codes int8, pts (N, 2)) — birim kutuya normalize. Boş SVG → ValueError."""
+    ops, fill = svg_ops(data)
+    from outline_union import available, union_ops
+    if available():
+        ops = union_ops(ops, fill)
+    bp = BoundsPen(None)
+    for op, args in ops:
+        getattr(bp, op)(*args)
+    if bp.bounds is None:
+        raise ValueError("çizilebilir path yok")
+    x0, y0, x1, y1 = bp.bounds
+    s = 1.0 / (max(x1 - x0, y1 - y0) or 1.0)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    comp = _Compiler()
+    pen = TransformPen(comp, (s, 0, 0, s, -cx * s, -cy * s))
+    for op, args in ops:
+        getattr(pen, op)(*args)
+    codes = np.array([_CODES.index(c) for c in comp.cmds], dtype=np.int8)
+    return codes, np.round(np.array(comp.pts, dtype=float).reshape(-1, 2), ND)
+
+
+def decode(codes, pts):
+    """npz biçimi → shape_library (cmds, pts)."""
+    return tuple((_CODES[c], _COUNTS[_CODES[c]]) for c in codes.tolist()), pts
+
+
+# ── PAKET YÜKLEME ────────────────────────────────────────────────
+
+def _cache_file(path):
+    if CACHE_DIR:
+        tag = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:10]
+        return os.path.join(CACHE_DIR, f"{os.path.basename(os.path.normpath(path))}-{tag}{CACHE_NAME}")
+    return os.path.join(path, CACHE_NAME)
+
+
+def _read_cache(fn):
+    try:
+        with np.load(fn, allow_pickle=False) as z:
+            if int(z['format']) != FORMAT:
+                return {}
+            return {k: z[k] for k in z.files if k != 'format'}
+    except Exception:
+        return {}
+
+
+def _write_cache(fn, arrays):
+    tmp = fn + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(fn)), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            np.savez(f, format=np.int32(FORMAT), **arrays)
+        os.replace(tmp, fn)
+    except OSError as e:
+        print(f"  [shapes] önbellek yazılamadı ({fn}): {e}")
+
+
+def load_pack(path, name=None):
+    """
+    Klasördeki *.svg → shape_library'ye '<paket>/<dosya>' adlarıyla kaydedilir.
+    Değişmeyen dosyalar npz önbelleğinden gelir. → kaydedilen şekil adları.
+    """
+    from shape_library import register_shape
+    name = name or os.path.basename(os.path.normpath(path))
+    t0 = time.time()
+    fn = _cache_file(path)
+    old = _read_cache(fn)
+    keep, names, built = {}, [], 0
+    for entry in sorted(os.listdir(path)):
+        stem, ext = os.path.splitext(entry)
+        if ext.lower() != '.svg':
+            continue
+        try:
+            with open(os.path.join(path, entry), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"  [shapes] {entry}: {e}")
+            continue
+        h = hashlib.sha1(data).hexdigest()[:16]
+        if h + '_c' in old:
+            codes, pts = old[h + '_c'], old[h + '_p']
+        else:
+            try:
+                codes, pts = compile_svg(data)
+            except Exception as e:
+                print(f"  [shapes] {entry}: {e}")
+                continue
+            built += 1
+        keep[h + '_c'], keep[h + '_p'] = codes, pts
+        cmds, pts = decode(codes, pts)
+        register_shape(f"{name}/{stem}", cmds, pts, token=h)
+        names.append(f"{name}/{stem}")
+    if built or set(keep) != set(old):
+        _write_cache(fn, keep)
+    with _lock:
+        _loaded[os.path.abspath(path)] = names
+    print(f"  [shapes] {name}: {len(names)} şekil ({built} derlendi, "
+          f"{len(names) - built} önbellekten) {1000 * (time.time() - t0):.1f} ms")
+    return names
+
+
+def load_env_packs(paths=None):
+    """VECTROD_SHAPE_PACKS (ya da verilen) klasörleri yükle; eksik klasör atlanır."""
+    out = []
+    for p in PACK_DIRS if paths is None else paths:
+        if os.path.isdir(p):
+            out += load_pack(p)
+        else:
+            print(f"  [shapes] paket klasörü yok: {p}")
+    return out
+
+
+def loaded():
+    with _lock:
+        return {p: list(n) for p, n in _loaded.items()}
@@ -0,0 +1,411 @@
+"""
+svg_cluster.py — Gruplanmamış SVG path'lerinden glyph çıkarma
+=============================================================
+Düzleştirilmiş (flatten) export'larda karakter başına translate'li bir <g>
+yoktur: yüzlerce/binlerce path kök altında ya da tek bir <g> içinde durur.
+Bu modül path'leri geometriye bakarak glyph'lere ayırır:
+
+  groups = cluster_groups(root)     # okuma sırasında, engine.collect_groups formatında
+  rows   = detect_lines(boxes)      # [[glyph indeksleri soldan sağa], ...] yukarıdan aşağıya
+
+  1. Her path ata transform'larıyla birlikte mutlak koordinata çizilir → bbox
+  2. Dokunan / kesişen parçalar birleşir: bbox'ı dokunan adaylar (sweep-line,
+     O(n log n)) kontur örnek noktalarıyla doğrulanır — eğik kenarlı harflerin
+     (A V W Y) bbox'ları kerning olmadan da değer, konturları değmez.
+     Bbox'ı diğerinin içinde kalan parça (ayrı path çizilmiş sayaç) birleşir;
+     birleşim bir glyph'ten (GLYPH_MAX × H) genişse birleşmez (taban
+     çizgisinde neredeyse değen W|A köşeleri)
+  3. Aynı <g> içindeki parçalar, birleşim glyph boyunu aşmıyorsa birleşir
+  4. Satırlar sabit bir ızgara yerine bbox'ların dikey izdüşümündeki
+     boşluklardan bulunur — sanat eseri boyutundan bağımsız
+  5. Satır içinde aynı sütundaki parçalar (i/j noktası, ğ/ü işaretleri,
+     '=' çubukları) birleşir; yatay ayrık parçalar ('a'nın kasesi) satır
+     boşluklarının dağılımından bulunan eşikle birleşir
+
+Eşikler tipik glyph yüksekliğine (H, alan ağırlıklı medyan) göre ölçeklenir.
+"""
+
+import re, heapq, bisect, math
+from statistics import median
+
+import numpy as np
+from fontTools.misc.transform import Identity
+from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.transformPen import TransformPen
+from fontTools.svgLib.path.parser import parse_path
+
+TOUCH     = 0.02    # × medyan path boyu: bu kadar yakın bbox'lar dokunuyor sayılır
+GLYPH_MAX = 1.6     # × H: dokunma / aynı <g> ipucuyla birleşen parçaların en büyük boyu
+COLUMN    = 0.5     # satır içinde x örtüşmesi (dar olanın eni ×) → aynı glyph
+SPLIT_RATIO = 3.0   # glyph-içi / harf arası boşluk sıçraması
+SPLIT_MAX   = 0.25  # × H: glyph-içi boşluk en fazla bu kadar olabilir
+SPLIT_FLOOR = 0.05  # × H: oran hesabında boşluk alt sınırı
+CORE      = 0.25    # satır tespitinde glyph yüksekliğinin üst/alt kırpılan payı
+
+_SKIP = {'defs', 'clipPath', 'mask', 'symbol', 'pattern', 'marker', 'metadata', 'title'}
+
+
+def _tag(elem):
+    return elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+
+
+# ── TRANSFORM ─────────────────────────────────────────────────────────
+
+def parse_transform(value):
+    """SVG transform listesi → fontTools Transform (matrix/translate/scale/rotate/skew)."""
+    t = Identity
+    for name, args in re.findall(r'(\w+)\s*\(([^)]*)\)', value or ''):
+        a = [float(v) for v in re.split(r'[\s,]+', args.strip()) if v]
+        if name == 'matrix' and len(a) == 6:
+            t = t.transform(a)
+        elif name == 'translate' and a:
+            t = t.translate(a[0], a[1] if len(a) > 1 else 0)
+        elif name == 'scale' and a:
+            t = t.scale(a[0], a[1] if len(a) > 1 else a[0])
+        elif name == 'rotate' and a:
+            cx, cy = (a[1], a[2]) if len(a) == 3 else (0, 0)
+            t = t.translate(cx, cy).rotate(a[0] * 3.141592653589793 / 180).translate(-cx, -cy)
+        elif name == 'skewX' and a:
+            t = t.skew(a[0] * 3.141592653589793 / 180, 0)
+        elif name == 'skewY' and a:
+            t = t.skew(0, a[0] * 3.141592653589793 / 180)
+    return t
+
+
+# ── PATH TOPLAMA ──────────────────────────────────────────────────────
+
+def _rec_bbox(rec):
+    xs, ys = [], []
+    for _op, pts in rec.value:
+        for x, y in pts:
+            xs.append(x)
+            ys.append(y)
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def loose_paths(root):
+    """
+    Tüm <path>'leri mutlak koordinatta topla (defs/clipPath/mask hariç).
+    → [{'rec': RecordingPen, 'bbox': (x0, y0, x1, y1), 'parent': en yakın <g> | None}]
+    """
+    items = []
+
+    def walk(elem, ctm, parent):
+        if not isinstance(elem.tag, str):
+            return
+        tag = _tag(elem)
+        if tag in _SKIP:
+            return
+        if elem.get('transform'):
+            ctm = ctm.transform(parse_transform(elem.get('transform')))
+        if tag == 'path':
+            d = elem.get('d', '').strip()
+            if not d:
+                return
+            rec = RecordingPen()
+            try:
+                parse_path(d, TransformPen(rec, ctm) if ctm != Identity else rec)
+            except Exception:
+                return
+            bb = _rec_bbox(rec)
+            if bb is not None:
+                items.append({'rec': rec, 'bbox': bb, 'parent': parent})
+            return
+        if tag == 'g' and elem is not root:
+            parent = elem
+        for child in elem:
+            walk(child, ctm, parent)
+
+    walk(root, Identity, None)
+    return items
+
+
+def outline_points(rec, step):
+    """Kayıt → kontur boyunca ~step aralıklı noktalar, (N, 2) dizi (eğriler örneklenir)."""
+    out, cur, start = [], None, None
+    for op, pts in rec.value:
+        if op == 'moveTo':
+            cur = start = pts[0]
+            out.append(cur)
+            continue
+        if op == 'closePath' or op == 'endPath':
+            seg = (start,) if op == 'closePath' and cur is not None and start is not None else ()
+        else:
+            seg = tuple(pts)
+        if not seg or cur is None:
+            continue
+        ctrl = (cur,) + seg
+        n = max(1, math.ceil(sum(math.dist(ctrl[k], ctrl[k + 1]) for k in range(len(ctrl) - 1)) / step))
+        t = np.linspace(0.0, 1.0, n + 1)[1:, None]
+        c = np.array(ctrl, dtype=float)
+        if len(c) == 2:                     # doğru
+            out.extend(c[0] + (c[1] - c[0]) * t)
+        elif len(c) == 3:                   # quadratic
+            out.extend((1 - t) ** 2 * c[0] + 2 * (1 - t) * t * c[1] + t ** 2 * c[2])
+        else:                               # cubic
+            out.extend((1 - t) ** 3 * c[0] + 3 * (1 - t) ** 2 * t * c[1]
+                       + 3 * (1 - t) * t ** 2 * c[2] + t ** 3 * c[3])
+        cur = seg[-1]
+    return np.array(out, dtype=float).reshape(-1, 2)
+
+
+def _inside(a, b):
+    return a[0] >= b[0] and a[1] >= b[1] and a[2] <= b[2] and a[3] <= b[3]
+
+
+def outlines_touch(pa, pb, ba, bb, tol):
+    """İki parçanın konturları tol'dan yakın mı (ya da bbox'ı diğerinin içinde mi)."""
+    if _inside(ba, bb) or _inside(bb, ba):
+        return True
+    a = pa[(pa[:, 0] >= bb[0] - tol) & (pa[:, 0] <= bb[2] + tol) & (pa[:, 1] >= bb[1] - tol) & (pa[:, 1] <= bb[3] + tol)]
+    b = pb[(pb[:, 0] >= ba[0] - tol) & (pb[:, 0] <= ba[2] + tol) & (pb[:, 1] >= ba[1] - tol) & (pb[:, 1] <= ba[3] + tol)]
+    for k in range(0, len(a), 512):         # büyük konturlarda bellek sınırlı
+        d = a[k:k + 512, None, :] - b[None, :, :]
+        if len(b) and (d[..., 0] ** 2 + d[..., 1] ** 2).min() <= tol * tol:
+            return True
+    return False
+
+
+# ── KÜMELEME ──────────────────────────────────────────────────────────
+
+def typical_height(boxes):
+    """
+    Alan ağırlıklı medyan yükseklik (H). Düz medyan nokta/çizgi gibi
+    küçük parçaların çok olduğu metinlerde aşağı kayar.
+    """
+    hs = sorted((b[3] - b[1], (b[2] - b[0]) * (b[3] - b[1])) for b in boxes)
+    total = sum(a for _h, a in hs)
+    if total <= 0:
+        return median(h for h, _a in hs) if hs else 1.0
+    acc = 0.0
+    for h, a in hs:
+        acc += a
+        if acc >= total / 2:
+            return h or 1.0
+    return hs[-1][0] or 1.0
+
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        p = self.parent
+        while p[i] != i:
+            p[i] = p[p[i]]
+            i = p[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+    def sets(self):
+        out = {}
+        for i in range(len(self.parent)):
+            out.setdefault(self.find(i), []).append(i)
+        return list(out.values())
+
+
+def sweep_pairs(boxes, xpad=0.0, ypad=0.0):
+    """
+    (xpad, ypad) kadar genişletilmiş bbox'ları kesişen indeks çiftleri.
+    x'e göre sweep-line: aktif küme x1'e göre heap'te tutulur, geride kalanlar düşer.
+    """
+    active = []
+    for i in sorted(range(len(boxes)), key=lambda k: boxes[k][0]):
+        x0, y0, x1, y1 = boxes[i]
+        while active and active[0][0] < x0 - xpad:
+            heapq.heappop(active)
+        for _end, j in active:
+            b = boxes[j]
+            if b[1] - ypad <= y1 and y0 <= b[3] + ypad:
+                yield j, i
+        heapq.heappush(active, (x1 + xpad, i))
+
+
+def _union_box(boxes, idx):
+    return (min(boxes[i][0] for i in idx), min(boxes[i][1] for i in idx),
+            max(boxes[i][2] for i in idx), max(boxes[i][3] for i in idx))
+
+
+def _split_gap(gaps, H):
+    """
+    Satır içi yatay boşluklardan glyph-içi eşik: küçük boşluklar (ayrık çizgiler,
+    'a'nın gövdesi ile kasesi) ile harf araları arasında SPLIT_RATIO katlık bir
+    sıçrama varsa sıçramanın altı. Harf araları çoğunluktur — üst sınıf en az
+    yarı olmalı (kelime boşlukları ayrıca bir sınıf oluşturup eşiği çekemez).
+    """
+    g = sorted(v for v in gaps if v > 0)
+    best, floor = None, SPLIT_FLOOR * H
+    for k in range(len(g) // 2):
+        if g[k] > SPLIT_MAX * H:
+            break
+        r = g[k + 1] / max(g[k], floor)
+        if r >= SPLIT_RATIO and (best is None or r > best[0]):
+            best = (r, g[k])
+    return best[1] if best else 0.0
+
+
+def cluster_boxes(boxes, parents=None, outlines=None):
+    """
+    Path bbox'ları → glyph kümeleri [[path indeksleri], ...].
+    parents: path başına <g> ipucu (aynı <g> içindekiler glyph boyunu aşmıyorsa birleşir).
+    outlines: path başına RecordingPen — bbox'ı dokunan adaylar kontur mesafesiyle
+    doğrulanır (None → yalnız bbox).
+    """
+    n = len(boxes)
+    if n == 0:
+        return []
+    uf = _UnionFind(n)
+
+    # 1) dokunan / kesişen parçalar
+    size = median(max(b[2] - b[0], b[3] - b[1]) for b in boxes)
+    tol = TOUCH * size
+    wmax = GLYPH_MAX * typical_height(boxes)
+    cb = list(boxes)                        # kök → küme bbox
+    pts = {}
+
+    def sampled(i):
+        if i not in pts:
+            pts[i] = outline_points(outlines[i], tol / 2 or 1.0)
+        return pts[i]
+
+    for a, b in sweep_pairs(boxes, tol, tol):
+        ra, rb = uf.find(a), uf.find(b)
+        if ra == rb:
+            continue
+        u = _union_box(cb, (ra, rb))
+        if u[2] - u[0] > wmax:
+            continue
+        if outlines is None or outlines_touch(sampled(a), sampled(b), boxes[a], boxes[b], tol):
+            uf.union(a, b)
+            cb[uf.find(a)] = u
+
+    def current():
+        sets = uf.sets()
+        return sets, [_union_box(boxes, s) for s in sets]
+
+    sets, cboxes = current()
+    H = typical_height(cboxes)
+
+    # 2) aynı <g> ipucu
+    if parents is not None:
+        by_parent = {}
+        for i, p in enumerate(parents):
+            if p is not None:
+                by_parent.setdefault(id(p), []).append(i)
+        for idx in by_parent.values():
+            if len({uf.find(i) for i in idx}) < 2:
+                continue
+            bb = _union_box(boxes, idx)
+            if bb[2] - bb[0] <= GLYPH_MAX * H and bb[3] - bb[1] <= GLYPH_MAX * H:
+                for i in idx[1:]:
+                    uf.union(idx[0], i)
+        sets, cboxes = current()
+
+    # 3) satır içinde aynı sütun: nokta, aksan, '=' / ':' parçaları.
+    #    Bir metin satırında iki glyph üst üste durmaz.
+    rows = detect_lines(cboxes)
+    for row in rows:
+        rb = [cboxes[i] for i in row]
+        for a, b in sweep_pairs(rb, 0.0, float('inf')):
+            A, B = rb[a], rb[b]
+            if min(A[2], B[2]) - max(A[0], B[0]) >= COLUMN * min(A[2] - A[0], B[2] - B[0]):
+                uf.union(sets[row[a]][0], sets[row[b]][0])
+    sets, cboxes = current()
+
+    # 4) satır içinde yatay ayrık parçalar: uyarlamalı boşluk eşiği
+    pairs = []
+    for row in detect_lines(cboxes):
+        right = None
+        for i in row:
+            if right is not None:
+                pairs.append((cboxes[i][0] - cboxes[right][2], right, i))
+            if right is None or cboxes[i][2] > cboxes[right][2]:
+                right = i
+    t = _split_gap([p[0] for p in pairs], H)
+    for gap, a, b in pairs:
+        if 0 < gap <= t:
+            uf.union(sets[a][0], sets[b][0])
+
+    return uf.sets()
+
+
+# ── SATIR TESPİTİ ─────────────────────────────────────────────────────
+
+def detect_lines(boxes):
+    """
+    Glyph bbox'ları → satırlar [[indeksler soldan sağa], ...] yukarıdan aşağıya.
+    Normal boydaki glyph'lerin orta bantları (CORE kırpılmış) dikeyde birleştirilir;
+    bantlar arasındaki boşluklar satır aralığıdır. Küçük glyph'ler ('.', '-', ',')
+    merkezlerine en yakın banda atanır.
+    """
+    if not boxes:
+        return []
+    H = typical_height(boxes)
+    cores = sorted((b[1] + CORE * (b[3] - b[1]), b[3] - CORE * (b[3] - b[1]))
+                   for b in boxes if b[3] - b[1] >= 0.5 * H)
+    bands = []
+    for c0, c1 in cores:
+        if bands and c0 <= bands[-1][1]:
+            bands[-1][1] = max(bands[-1][1], c1)
+        else:
+            bands.append([c0, c1])
+    if not bands:                           # hepsi küçük: tek satır
+        bands = [[min(b[1] for b in boxes), max(b[3] for b in boxes)]]
+    starts = [b[0] for b in bands]
+    rows = [[] for _ in bands]
+    for i, b in enumerate(boxes):
+        cy = (b[1] + b[3]) / 2
+        k = max(bisect.bisect_right(starts, cy) - 1, 0)
+        if k + 1 < len(bands) and bands[k + 1][0] - cy < cy - bands[k][1]:
+            k += 1
+        rows[k].append(i)
+    return [sorted(r, key=lambda i: boxes[i][0]) for r in rows if r]
+
+
+# ── GRUPLAR ───────────────────────────────────────────────────────────
+
+def _path_d(rec, dy):
+    """Kayıt → mutlak M/L/C/Q/Z path (H/V yok: engine.get_group_bbox sayıları x,y çifti okur)."""
+    out = []
+    for op, pts in rec.value:
+        xy = ' '.join(f'{x:.3f} {y + dy:.3f}' for x, y in pts)
+        if op == 'moveTo':
+            out.append('M' + xy)
+        elif op == 'lineTo':
+            out.append('L' + xy)
+        elif op == 'curveTo':
+            out.append('C' + xy)
+        elif op == 'qCurveTo':              # parse_path: her zaman (kontrol, bitiş)
+            out.append('Q' + xy)
+        elif op == 'closePath':
+            out.append('Z')
+    return ''.join(out)
+
+
+def cluster_groups(root):
+    """
+    Kök altındaki tüm path'leri glyph'lere ayır → okuma sırasında gruplar:
+      {'paths': [{'d'}], 'elem': None, 'tx': 0, 'ty': satır tabanı, 'bbox': mutlak bbox}
+    Path'ler y'de satır tabanına göre yereldir: her satır aynı baseline'a oturur.
+    """
+    items = loose_paths(root)
+    if not items:
+        return []
+    boxes = [it['bbox'] for it in items]
+    clusters = cluster_boxes(boxes, [it['parent'] for it in items], [it['rec'] for it in items])
+    gboxes = [_union_box(boxes, c) for c in clusters]
+    H = typical_height(gboxes)
+    groups = []
+    for row in detect_lines(gboxes):
+        bottoms = [gboxes[i][3] for i in row if gboxes[i][3] - gboxes[i][1] >= 0.5 * H]
+        base = median(bottoms) if bottoms else max(gboxes[i][3] for i in row)
+        for i in row:
+            paths = [{'d': _path_d(items[k]['rec'], -base)} for k in sorted(clusters[i])]
+            groups.append({'paths': paths, 'elem': None, 'tx': 0, 'ty': base, 'bbox': gboxes[i]})
+    return groups
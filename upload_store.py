@@ -0,0 +1,99 @@
+"""
+upload_store.py — Upload handle'ları: SVG bir kez yüklenir, defalarca derlenir
+==============================================================================
+/convert'te kullanıcı char_order'ı, bold/italic'i, adı değiştirip tekrar
+dener. Her denemede SVG'yi yeniden yükleyip tüm outline'ları yeniden
+çizmek yerine:
+
+  POST /api/upload                 → {'upload_id': ...}   (parse + çizim bir kez)
+  POST /api/upload/{id}/build      → /convert ile aynı yanıt
+
+Önbellekte (LRU + TTL) handle başına:
+  • shapes  — sıralı, normalize edilmiş cubic outline'lar (char_order'dan bağımsız)
+  • glyphs  — (şekil sırası, offset, slant) → quadratic TTGlyph
+Remap / rename / bold-italic bitleri → sadece cmap + name vb. tablolar kurulur.
+Geometri değişimi (aile modunda türetilen bold/italic) → yalnız yeni
+varyantların outline'ları üretilir, sonra onlar da önbelleğe girer.
+"""
+
+import os, time, uuid, threading
+from collections import OrderedDict
+
+UPLOAD_TTL = int(os.environ.get('VECTROD_UPLOAD_TTL', 1800))   # saniye
+UPLOAD_MAX = int(os.environ.get('VECTROD_UPLOAD_MAX', 32))     # handle sayısı
+
+_store = OrderedDict()          # upload_id → UploadEntry
+_lock = threading.Lock()
+
+
+class UploadEntry:
+    def __init__(self, uid, filename, size, shapes):
+        self.id = uid
+        self.filename = filename
+        self.size = size
+        self.shapes = shapes        # engine.load_svg_shapes çıktısı
+        self.glyphs = {}            # engine.compile_font glyph_cache
+        self.lock = threading.Lock()
+        self.created = self.last = time.time()
+        self.builds = 0
+
+
+def _expire(now):
+    for uid in [u for u, e in _store.items() if now - e.last > UPLOAD_TTL]:
+        del _store[uid]
+
+
+def put(svg, filename=''):
+    """SVG (bayt/ağaç) → UploadEntry. Path bulunamazsa ValueError."""
+    from engine import load_svg_shapes
+    shapes = load_svg_shapes(svg)
+    if shapes is None:
+        raise ValueError("SVG'de path bulunamadı")
+    entry = UploadEntry(uuid.uuid4().hex, filename,
+                        len(svg) if isinstance(svg, (bytes, bytearray)) else 0, shapes)
+    with _lock:
+        _expire(time.time())
+        _store[entry.id] = entry
+        while len(_store) > UPLOAD_MAX:
+            _store.popitem(last=False)
+    return entry
+
+
+def get(uid):
+    """Handle → UploadEntry (süresi dolmuşsa / yoksa None)."""
+    with _lock:
+        now = time.time()
+        _expire(now)
+        entry = _store.get(uid)
+        if entry is not None:
+            entry.last = now
+            _store.move_to_end(uid)
+        return entry
+
+
+def build(entry, font_name, output_dir, char_order=None, bold=False, italic=False,
+          family=False):
+    """
+    Handle'dan font derle → (ttf_path, tüm çıktı yolları, önizleme, istatistik).
+    Aynı handle'a eşzamanlı build'ler sıraya girer (glyph önbelleği paylaşılır).
+    """
+    from engine import assign_chars, compile_font, compile_family, ir_previews
+    t0 = time.time()
+    with entry.lock:
+        ir = assign_chars(entry.shapes, char_order)
+        before = len(entry.glyphs)
+        if family:
+            variants = compile_family(ir, font_name, output_dir, glyph_cache=entry.glyphs)
+            ttf_path, _ = variants.get('regular', (None, None))
+            out_paths = [fp for pair in variants.values() for fp in pair]
+        else:
+            ttf_path, otf_path = compile_font(ir, font_name, output_dir, bold, italic,
+                                              glyph_cache=entry.glyphs)
+            out_paths = [ttf_path, otf_path]
+        drawn = len(entry.glyphs) - before
+        entry.builds += 1
+    stats = {'outlines_rebuilt': drawn,
+             'rebuild': 'outlines' if drawn else 'tables',
+             'build_sec': round(time.time() - t0, 3),
+             'builds': entry.builds}
+    return ttf_path, out_paths, ir_previews(ir), stats
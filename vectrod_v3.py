@@ -2,7 +2,7 @@
 vectrod_v3.py  —  Vectrod DNA Matrix Engine v3.0
 =================================================
 TEMEL FİZİK:
-  shape_library.place(path, cx, cy, SIZE, angle)
+  shape_library.place_path(shape, cx, cy, SIZE, angle)
     → SIZE = pixel çapı. Şekil ±0.5 birim, SIZE=96 → 96px çap.
   Dekorasyon terminal noktasından DIŞA büyür, advance'e sığar.
   UPM=1000, CAP=800, SW minimum 44.
@@ -12,72 +12,55 @@ DNA:
   decoration    : floral | cyber | gothic | kawaii | retro | minimal
   density       : float 0-1
   deco_size_mul : float 1.5-3.0   (SIZE = SW × deco_size_mul)
-  shapes        : list of shape_library names
+  shapes        : list of shape_library names (paket şekilleri: '<paket>/<ad>', bkz. shape_packs)
 """
 
-import math, io, os
+import math, os
 from fontTools.fontBuilder import FontBuilder
 from fontTools.pens.ttGlyphPen import TTGlyphPen
 from fontTools.pens.cu2quPen   import Cu2QuPen
-from fontTools.svgLib.path     import SVGPath as SVGPathLib
+from webfonts import WEB_FORMATS
+from outline_simplify import Simplifier, TOLERANCE as SIMPLIFY_TOL
+from auto_kern import kern_font, ENABLED as AUTOKERN
+from outline_union import Union, ENABLED as REMOVE_OVERLAP
+from glyph_memo import memo as glyph_memo
+from pen_path import PenPath, join, draw_path, resolve_paths
+from geom_kernel import capsule_spec, arc_spec, arc_segments, current_tol, fixed_segments
+from shape_library import shape_key
 
 UPM=1000; CAP=800; XH=560; BASE=0; DESC=-160; K=0.5523
 
 # ── YARDIMCI ─────────────────────────────────────────────────────
-def _j(*p): return " ".join(x for x in p if x and x.strip())
+# Primitifler PenPath'e çizer (pen_path.py): SVG string yalnız önizleme için.
+_j=join
 
 # ── STROKE PRİMİTİFLERİ ──────────────────────────────────────────
 
 def stroke(x1,y1,x2,y2,sw):
-    sw=max(6,sw); dx,dy=x2-x1,y2-y1; ln=math.hypot(dx,dy)
-    if ln<1: return ""
-    nx,ny=-dy/ln*(sw/2), dx/ln*(sw/2); ux,uy=dx/ln*(sw/2), dy/ln*(sw/2)
-    return (f"M{x1+nx:.1f},{y1+ny:.1f} L{x2+nx:.1f},{y2+ny:.1f} "
-            f"C{x2+nx+ux*K:.1f},{y2+ny+uy*K:.1f} {x2+ux+nx*K:.1f},{y2+uy+ny*K:.1f} {x2+ux:.1f},{y2+uy:.1f} "
-            f"C{x2+ux-nx*K:.1f},{y2+uy-ny*K:.1f} {x2-nx+ux*K:.1f},{y2-ny+uy*K:.1f} {x2-nx:.1f},{y2-ny:.1f} "
-            f"L{x1-nx:.1f},{y1-ny:.1f} "
-            f"C{x1-nx-ux*K:.1f},{y1-ny-uy*K:.1f} {x1-ux-nx*K:.1f},{y1-uy-ny*K:.1f} {x1-ux:.1f},{y1-uy:.1f} "
-            f"C{x1-ux+nx*K:.1f},{y1-uy+ny*K:.1f} {x1+nx-ux*K:.1f},{y1+ny-uy*K:.1f} {x1+nx:.1f},{y1+ny:.1f} Z")
+    sw=max(6,sw)
+    if math.hypot(x2-x1,y2-y1)<1: return PenPath()
+    return PenPath().band(capsule_spec(x1,y1,x2,y2,sw,K))
 
 def arc_thick(cx,cy,rx,ry,a1d,a2d,sw):
-    sw=max(6,sw); N=20; a1=math.radians(a1d); a2=math.radians(a2d)
+    sw=max(6,sw); a1=math.radians(a1d); a2=math.radians(a2d)
     while a2<=a1: a2+=2*math.pi
-    pts=[(cx+rx*math.cos(a1+(a2-a1)*i/N), cy+ry*math.sin(a1+(a2-a1)*i/N)) for i in range(N+1)]
-    h=sw/2; op=[]; ip=[]
-    for i,(px,py) in enumerate(pts):
-        if i==0: ddx,ddy=pts[1][0]-px,pts[1][1]-py
-        elif i==len(pts)-1: ddx,ddy=px-pts[-2][0],py-pts[-2][1]
-        else: ddx,ddy=pts[i+1][0]-pts[i-1][0],pts[i+1][1]-pts[i-1][1]
-        ln=math.hypot(ddx,ddy) or 0.001; nx2,ny2=-ddy/ln*h, ddx/ln*h
-        op.append((px+nx2,py+ny2)); ip.append((px-nx2,py-ny2))
-    r=["M{:.1f},{:.1f}".format(*op[0])]
-    for pt in op[1:]: r.append("L{:.1f},{:.1f}".format(*pt))
-    r.append("L{:.1f},{:.1f}".format(*ip[-1]))
-    for pt in reversed(ip[:-1]): r.append("L{:.1f},{:.1f}".format(*pt))
-    r.append("Z"); return " ".join(r)
+    return PenPath().band(arc_spec(cx,cy,rx,ry,a1,a2,sw,arc_segments(rx,ry,a2-a1,sw,20)))
+
+def _ellipse(p,cx,cy,ex,ey,ccw=False):
+    """Tek elips kontürü (4 cubic), üstten başlar; ccw → ters yön."""
+    kx,ky=ex*K,ey*K; sx=-1 if ccw else 1
+    return (p.M(cx,cy-ey).C(cx+sx*kx,cy-ey, cx+sx*ex,cy-ky, cx+sx*ex,cy)
+             .C(cx+sx*ex,cy+ky, cx+sx*kx,cy+ey, cx,cy+ey)
+             .C(cx-sx*kx,cy+ey, cx-sx*ex,cy+ky, cx-sx*ex,cy)
+             .C(cx-sx*ex,cy-ky, cx-sx*kx,cy-ey, cx,cy-ey).Z())
 
 def oval_donut(cx,cy,rx,ry,sw):
-    sw=max(6,sw)
-    def el(ex,ey,ccw=False):
-        kx,ky=ex*K,ey*K
-        if not ccw:
-            return (f"M{cx:.1f},{cy-ey:.1f} C{cx+kx:.1f},{cy-ey:.1f} {cx+ex:.1f},{cy-ky:.1f} {cx+ex:.1f},{cy:.1f} "
-                    f"C{cx+ex:.1f},{cy+ky:.1f} {cx+kx:.1f},{cy+ey:.1f} {cx:.1f},{cy+ey:.1f} "
-                    f"C{cx-kx:.1f},{cy+ey:.1f} {cx-ex:.1f},{cy+ky:.1f} {cx-ex:.1f},{cy:.1f} "
-                    f"C{cx-ex:.1f},{cy-ky:.1f} {cx-kx:.1f},{cy-ey:.1f} {cx:.1f},{cy-ey:.1f} Z")
-        else:
-            return (f"M{cx:.1f},{cy-ey:.1f} C{cx-kx:.1f},{cy-ey:.1f} {cx-ex:.1f},{cy-ky:.1f} {cx-ex:.1f},{cy:.1f} "
-                    f"C{cx-ex:.1f},{cy+ky:.1f} {cx-kx:.1f},{cy+ey:.1f} {cx:.1f},{cy+ey:.1f} "
-                    f"C{cx+kx:.1f},{cy+ey:.1f} {cx+ex:.1f},{cy+ky:.1f} {cx+ex:.1f},{cy:.1f} "
-                    f"C{cx+ex:.1f},{cy-ky:.1f} {cx+kx:.1f},{cy-ey:.1f} {cx:.1f},{cy-ey:.1f} Z")
-    return el(rx+sw/2,ry+sw/2)+" "+el(max(6,rx-sw/2),max(6,ry-sw/2),ccw=True)
+    sw=max(6,sw); p=PenPath()
+    _ellipse(p,cx,cy,rx+sw/2,ry+sw/2)
+    return _ellipse(p,cx,cy,max(6,rx-sw/2),max(6,ry-sw/2),ccw=True)
 
 def dot_circle(cx,cy,r):
-    kx,ky=r*K,r*K
-    return (f"M{cx:.0f},{cy-r:.0f} C{cx+kx:.0f},{cy-r:.0f} {cx+r:.0f},{cy-ky:.0f} {cx+r:.0f},{cy:.0f} "
-            f"C{cx+r:.0f},{cy+ky:.0f} {cx+kx:.0f},{cy+r:.0f} {cx:.0f},{cy+r:.0f} "
-            f"C{cx-kx:.0f},{cy+r:.0f} {cx-r:.0f},{cy+ky:.0f} {cx-r:.0f},{cy:.0f} "
-            f"C{cx-r:.0f},{cy-ky:.0f} {cx-kx:.0f},{cy-r:.0f} {cx:.0f},{cy-r:.0f} Z")
+    return _ellipse(PenPath(0),cx,cy,r,r)
 
 # ── DEKORASYON ───────────────────────────────────────────────────
 
@@ -86,10 +69,9 @@ class Deco:
     shape_library üzerinden terminal dekorasyonu.
     SIZE = SW × deco_size_mul → place() doğrudan pixel çapı alır.
     """
-    def __init__(self, dna):
-        from shape_library import get_shape, place as sl_place
-        self._get   = get_shape
-        self._place = sl_place
+    def __init__(self, dna, components=False):
+        from shape_library import place_path
+        self._place = place_path
         sw          = max(44, int(dna.get('stroke_weight', 44)))
         mul         = float(dna.get('deco_size_mul', 2.2))
         self.size   = int(sw * mul)
@@ -99,6 +81,10 @@ class Deco:
         self.do_side = dens >= 0.75
         raw_shapes   = dna.get('shapes', _def_shapes(dna.get('decoration','floral')))
         self.shapes  = [s for s in raw_shapes if s] or ['leaf']
+        # components=True: put() çizmek yerine yerleşimi kaydeder → build_font
+        # her (shape,size,angle) için tek gizli glyph üretip referans verir
+        self.components = components
+        self.placed      = []
 
     def _shape(self, idx): return self.shapes[idx % len(self.shapes)]
 
@@ -106,9 +92,16 @@ class Deco:
         """Doğrudan koordinata yerleştir. Minimum 70px — görünür olmak zorunda."""
         try:
             sz = max(70, int(self.size * mul))
-            return self._place(self._get(self._shape(idx)), cx, cy, sz, angle_deg)
+            if self.components:
+                self.placed.append(((self._shape(idx), sz, int(angle_deg)), cx, cy))
+                return ""
+            return self._place(self._shape(idx), cx, cy, sz, angle_deg)
         except: return ""
 
+    def path_at_origin(self, shape, sz, angle_deg):
+        """Component glyph'i için orijin merkezli dekorasyon path'i."""
+        return self._place(shape, 0, 0, sz, angle_deg)
+
     def top(self, cx, y_top, idx=0, mul=1.0):
         """Üst terminal: şekil merkezi y_top + size*0.55 yukarıda."""
         if not self.do_top: return ""
@@ -186,6 +179,25 @@ class GB:
         """Cyber/italic için x koordinatını y'ye göre kaydır."""
         return x + int(y * self.slant)
 
+    def memo_key(self, c, idx=0):
+        """build(c,idx)'in bağlı olduğu kanonik DNA alt kümesi. Dekorasyon kapalıysa boyut/şekil anahtara girmez."""
+        d=self.d; deco=None
+        if d.do_top or d.do_base or d.do_side:
+            r=idx%len(d.shapes)
+            deco=(d.size,d.do_top,d.do_base,d.do_side,tuple(map(shape_key,d.shapes[r:]+d.shapes[:r])))
+        return (c,self.sw,self.deco,bool(d.components),deco,current_tol())
+
+    def build_cached(self, c, idx=0, memo=glyph_memo):
+        """build() + glyph memo → (path, adv); components modunda d.placed da geri yüklenir."""
+        key=self.memo_key(c,idx); hit=memo.get(key)
+        if hit is not None:
+            path,adv,placed=hit; self.d.placed=list(placed)
+            return (PenPath.load(path) if isinstance(path,list) else path),adv
+        self.d.placed=[]
+        path,adv=self.build(c,idx)
+        memo.put(key,(path.dump() if isinstance(path,PenPath) else path,adv,self.d.placed))
+        return path,adv
+
     def build(self, c, idx=0):
         sw=self.sw; d=self.d; XH=self._XH
         s=lambda x1,y1,x2,y2,w=None: stroke(
@@ -567,58 +579,247 @@ class GB:
 
 CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?:;-_/()[]+@#&=*% '
 
-def _to_glyph(path_d):
-    svg=f'<svg xmlns="http://www.w3.org/2000/svg"><path d="{path_d}" fill-rule="evenodd"/></svg>'
-    pen=TTGlyphPen(None)
-    SVGPathLib(io.BytesIO(svg.encode())).draw(Cu2QuPen(pen,max_err=0.5,reverse_direction=True))
+def _to_glyph(path_d, simp=None):
+    """PenPath | SVG d → quadratic TTGlyph. simp: outline_simplify.Simplifier — verilirse kontürler cu2qu'dan önce sadeleşir."""
+    pen=TTGlyphPen(None); out=Cu2QuPen(pen,max_err=0.5,reverse_direction=True)
+    draw_path(path_d, simp.pen(out) if simp else out)
     return pen.glyph()
 
+def _memo_hit(key, simp=None):
+    """Derlenmiş glyph memo'da varsa yeni TTGlyph, yoksa None. Anahtar simplify toleransıyla birlikte;
+    sadeleştirme sayaçları da saklanır (_memo_compile)."""
+    from glyph_memo import glyph_from_data
+    hit=glyph_memo.get(key+('glyf',simp.tolerance if simp else 0))
+    if hit is None: return None
+    data,b,a=hit
+    if simp: simp.before+=b; simp.after+=a
+    return glyph_from_data(data)
+
+def _memo_compile(key, path_d, simp=None):
+    """_to_glyph + sonucu memo'ya yaz."""
+    from glyph_memo import glyph_to_data
+    key=key+('glyf',simp.tolerance if simp else 0)
+    b0,a0=(simp.before,simp.after) if simp else (0,0)
+    g=_to_glyph(path_d,simp)
+    glyph_memo.put(key,[glyph_to_data(g),(simp.before-b0) if simp else 0,(simp.after-a0) if simp else 0])
+    return g
+
 def _empty():
     pen=TTGlyphPen(None); pen.moveTo((0,0)); pen.lineTo((10,0)); pen.lineTo((10,10)); pen.lineTo((0,10))
     pen.closePath(); return pen.glyph()
 
-def build_font(dna:dict, output_path:str, font_name:str="VectrodFont") -> str:
-    gb=GB(dna); sw=gb.sw; chars=list(CHARS)
+def _setup_tables(fb, gb, font_name, mets, bodies=None):
+    """hhea/name/OS2/post/head — statik font ve VF master'ları ortak kullanır.
+    bodies: aksan anchor'ları için dekorasyonsuz gövde sınırları (VF: dekorasyon outline'a gömülü)."""
+    sw=gb.sw; deco_room=gb.d.size+40; ASC=CAP+deco_room; DSC=DESC-20
+    fb.setupHorizontalMetrics(mets)
+    fb.setupHorizontalHeader(ascent=ASC,descent=DSC)
+    fb.setupNameTable({"familyName":font_name,"styleName":"Regular",
+                       "uniqueFontIdentifier":f"{font_name}-Regular",
+                       "fullName":f"{font_name} Regular","version":"Version 3.0",
+                       "psName":f"{font_name}-Regular"})
+    fb.setupOS2(sTypoAscender=ASC,sTypoDescender=DSC,sTypoLineGap=0,
+                usWinAscent=ASC+30,usWinDescent=abs(DSC),
+                sxHeight=XH,sCapHeight=CAP,usWeightClass=max(100,min(900,int(sw*7))),
+                fsType=0,fsSelection=0x40,achVendID="VCTD",
+                ulUnicodeRange1=0b10000000000000000000000011111111)
+    fb.setupPost(isFixedPitch=0,underlinePosition=-80,underlineThickness=sw)
+    fb.setupHead(unitsPerEm=UPM,lowestRecPPEM=8,indexToLocFormat=0)
+    from accents import synthesize_accents
+    synthesize_accents(fb.font, stroke=sw, bodies=bodies)
+
+def compile_artifact(dna:dict, font_name:str="VectrodFont", simplify=SIMPLIFY_TOL, kern=AUTOKERN, verbose=True,
+                     overlap=REMOVE_OVERLAP):
+    """DNA → bellekte derlenmiş FontArtifact (diske yazmaz). simplify: tolerans (0 → kapalı), kern: GPOS auto-kern,
+    overlap: skia-pathops union (örtüşen kontürler tek kontür)."""
+    from deco_components import DecoComponents
+    from font_artifact import FontArtifact
+    gb=GB(dna); sw=gb.sw; chars=list(CHARS); simp=Simplifier(simplify)
+    un=Union() if overlap else None; utag=('union',) if overlap else ()
+    gb.d.components=True
+    def deco_glyph(shape,sz,ang):
+        key=('deco',shape_key(shape),sz,ang)+utag; g=_memo_hit(key,simp)
+        if g is not None: return g
+        p=gb.d.path_at_origin(shape,sz,ang)
+        return _memo_compile(key,un.run([p])[0] if un else p,simp)
+    dc=DecoComponents(deco_glyph)
     gnames=['.notdef','space']+[f'uni{ord(c):04X}' for c in chars if c!=' ']
-    fb=FontBuilder(UPM,isTTF=True); fb.setupGlyphOrder(gnames)
     cmap_d={32:'space'}; cmap_d.update({ord(c):f'uni{ord(c):04X}' for c in chars if c!=' '})
-    fb.setupCharacterMap(cmap_d)
     gmap={'.notdef':_empty(),'space':_empty()}
     mets={'.notdef':(500,0),'space':(int(CAP*0.32),0)}
-    ok=fail=0
+    ok=fail=0; m0=(glyph_memo.hits,glyph_memo.misses); built={}
     for idx,c in enumerate(chars):
         if c==' ': continue
+        try:
+            path,adv=gb.build_cached(c,idx); key=gb.memo_key(c,idx)+utag
+            built[c]=(key,path,adv,gb.d.placed,_memo_hit(key,simp) if path else None)
+        except Exception as e: built[c]=e
+    # memo'da olmayan glyph'lerin stroke/yayları tek numpy geçişinde; union da toplu
+    miss=[c for c,b in built.items() if isinstance(b,tuple) and b[4] is None]
+    resolve_paths([built[c][1] for c in miss])
+    if un:
+        for c,p in zip(miss,un.run([built[c][1] for c in miss])): built[c]=built[c][:1]+(p,)+built[c][2:]
+    for c,b in built.items():
         gn=f'uni{ord(c):04X}'
         try:
-            path,adv=gb.build(c,idx)
+            if isinstance(b,Exception): raise b
+            key,path,adv,placed,g=b
             if not path: raise ValueError("empty")
-            gmap[gn]=_to_glyph(path); mets[gn]=(adv,0); ok+=1
+            if g is None: g=_memo_compile(key,path,simp)
+            gmap[gn]=dc.compose(gn,g,placed,gmap); mets[gn]=(adv,0); ok+=1
         except Exception as e:
             print(f"  ✗ '{c}': {e}"); gmap[gn]=_empty(); mets[gn]=(600,0); fail+=1
+    for gn in gmap:
+        if gn not in mets: mets[gn]=(0,0)          # .base / deco_* gizli glyph'ler
+    gnames+=[gn for gn in gmap if gn not in gnames]
+    fb=FontBuilder(UPM,isTTF=True); fb.setupGlyphOrder(gnames)
+    fb.setupCharacterMap(cmap_d)
     conv={}
     for gn,g in gmap.items():
-        if not hasattr(g,'draw'): conv[gn]=g; continue
+        if not hasattr(g,'draw') or g.isComposite(): conv[gn]=g; continue
         try:
             p2=TTGlyphPen(None); g.draw(Cu2QuPen(p2,max_err=0.5,reverse_direction=False)); conv[gn]=p2.glyph()
         except: conv[gn]=g
-    deco_room=gb.d.size+40; ASC=CAP+deco_room; DSC=DESC-20
-    fb.setupGlyf(conv); fb.setupHorizontalMetrics(mets)
-    fb.setupHorizontalHeader(ascent=ASC,descent=DSC)
-    fb.setupNameTable({"familyName":font_name,"styleName":"Regular",
-                       "uniqueFontIdentifier":f"{font_name}-Regular",
-                       "fullName":f"{font_name} Regular","version":"Version 3.0",
-                       "psName":f"{font_name}-Regular"})
-    fb.setupOS2(sTypoAscender=ASC,sTypoDescender=DSC,sTypoLineGap=0,
-                usWinAscent=ASC+30,usWinDescent=abs(DSC),
-                sxHeight=XH,sCapHeight=CAP,usWeightClass=max(100,min(900,int(sw*7))),
-                fsType=0,fsSelection=0x40,achVendID="VCTD",
-                ulUnicodeRange1=0b10000000000000000000000011111111)
-    fb.setupPost(isFixedPitch=0,underlinePosition=-80,underlineThickness=sw)
-    fb.setupHead(unitsPerEm=UPM,lowestRecPPEM=8,indexToLocFormat=0)
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)),exist_ok=True)
-    fb.font.save(output_path)
-    sz=os.path.getsize(output_path)//1024
-    print(f"  ✅ v3 TTF: {sz}KB | {ok}✓ {fail}✗ | sw={sw} deco_size={gb.d.size}")
+    fb.setupGlyf(conv)
+    _setup_tables(fb, gb, font_name, mets)
+    kst=kern_font(fb.font) if kern else None
+    glyph_memo.flush(); mst=glyph_memo.stats(); mhit=mst['hits']-m0[0]; mmiss=mst['misses']-m0[1]
+    art=FontArtifact(fb.font, {'ok':ok,'fail':fail,'sw':sw,
+                               'deco_glyphs':sum(1 for g in dc.glyphs.values() if g),'deco_refs':dc.refs,
+                               'simplify':simp.stats,'kern':kst,'memo':{'hits':mhit,'misses':mmiss},
+                               'union':un.stats() if un else None})
+    if verbose: print(f"  ✅ v3 TTF: {len(art.data)//1024}KB | {ok}✓ {fail}✗ | sw={sw} deco_size={gb.d.size} "
+          f"| {art.stats['deco_glyphs']} deco glyph, {dc.refs} ref | {simp.report()} | memo {mhit}/{mhit+mmiss}"
+          +(f" | union {un.report()}" if un else "")
+          +(f" | kern {kst['class_pairs']} sınıf çifti ({kst['ms']} ms)" if kst else ""))
+    return art
+
+def build_font(dna:dict, output_path:str, font_name:str="VectrodFont", variable:bool=False,
+               web=WEB_FORMATS) -> str:
+    art=compile_artifact(dna, font_name)
+    art.write(output_path, otf=False, web=web)
+    if variable:
+        try: build_variable(dna, vf_path_for(output_path), font_name, web=web)
+        except Exception as e: print(f"  [VF] Error: {e}")
+    art.wait()
+    return output_path
+
+
+# ── VARIABLE FONT (wght) ─────────────────────────────────────────
+# Master'lar stroke_weight uçlarında (44, 80) + DNA'nın kendi ağırlığı
+# (default). GB aynı komut dizisini her sw için ürettiğinden outline'lar
+# nokta-uyumlu; cubic→quadratic dönüşümü tüm master'larda birlikte yapılır.
+SW_MIN=44; SW_MAX=80
+
+def vf_path_for(output_path:str) -> str:
+    """Foo_Regular.ttf → Foo_Regular-VF.ttf"""
+    base,_=os.path.splitext(output_path)
+    return base+'-VF.ttf'
+
+def _record(path_d):
+    """PenPath | SVG d → cubic RecordingPen komutları (TrueType yönünde)."""
+    from fontTools.pens.recordingPen import RecordingPen
+    from fontTools.pens.reverseContourPen import ReverseContourPen
+    rec=RecordingPen()
+    draw_path(path_d, ReverseContourPen(rec))
+    return rec.value
+
+def _compatible(recs):
+    ref=recs[0]
+    for r in recs[1:]:
+        if len(r)!=len(ref): return False
+        for (op1,a1),(op2,a2) in zip(ref,r):
+            if op1!=op2 or len(a1)!=len(a2): return False
+    return True
+
+def _compat_glyphs(recs, max_err=0.5):
+    """Uyumlu cubic kayıtları → aynı nokta yapısında quadratic TTGlyph listesi."""
+    from fontTools.cu2qu import curves_to_quadratic
+    pens=[TTGlyphPen(None) for _ in recs]; cur=[None]*len(recs)
+    for ops in zip(*recs):
+        op=ops[0][0]; args=[a for _,a in ops]
+        if op=='curveTo':
+            quads=curves_to_quadratic([[cur[i]]+list(a) for i,a in enumerate(args)],[max_err]*len(recs))
+            for pen,q in zip(pens,quads): pen.qCurveTo(*q[1:])
+        else:
+            for pen,a in zip(pens,args): getattr(pen,op)(*a)
+        if args[0]: cur=[a[-1] for a in args]
+    return [p.glyph() for p in pens]
+
+def compile_variable(dna:dict, font_name:str="VectrodFont", verbose=True):
+    """stroke_weight ekseni (wght = sw×7) olan variable TTF → bellekte FontArtifact (fvar/gvar/HVAR, diske yazmaz)."""
+    from font_artifact import FontArtifact
+    from fontTools.designspaceLib import DesignSpaceDocument, AxisDescriptor, SourceDescriptor
+    from fontTools import varLib
+    sw0=max(SW_MIN,min(SW_MAX,int(dna.get('stroke_weight',44))))
+    sws=sorted({SW_MIN,sw0,SW_MAX})
+    gbs=[GB({**dna,'stroke_weight':w}) for w in sws]
+    chars=[c for c in CHARS if c!=' ']
+    gnames=['.notdef','space']+[f'uni{ord(c):04X}' for c in chars]
+    d0=sws.index(sw0)
+    gmaps=[{'.notdef':_empty(),'space':_empty()} for _ in sws]
+    metss=[{'.notdef':(500,0),'space':(int(CAP*0.32),0)} for _ in sws]
+    static=0
+    with fixed_segments():          # master'lar nokta-uyumlu kalmalı → sabit yay parça sayısı
+        todo={}
+        for idx,c in enumerate(CHARS):
+            if c==' ': continue
+            try: todo[c]=(idx,[gb.build_cached(c,idx) for gb in gbs])
+            except Exception as e: todo[c]=(idx,e)
+        resolve_paths([p for _,b in todo.values() if isinstance(b,list) for p,_ in b])
+        for c,(idx,built) in todo.items():
+            gn=f'uni{ord(c):04X}'
+            try:
+                if isinstance(built,Exception): raise built
+                if not all(p for p,_ in built): raise ValueError("empty")
+                recs=[_record(p) for p,_ in built]
+                if not _compatible(recs): raise ValueError("incompatible")
+                glyphs=_compat_glyphs(recs)
+                if len({len(g.coordinates) for g in glyphs})!=1: raise ValueError("incompatible")
+                for i,g in enumerate(glyphs):
+                    gmaps[i][gn]=g; metss[i][gn]=(built[i][1],0)
+            except Exception:
+                # uyumsuz/bozuk glyph: tüm master'larda default'un outline'ı → sabit kalır
+                static+=1
+                try: p,adv=gbs[d0].build_cached(c,idx); g=_compat_glyphs([_record(p)])[0] if p else _empty()
+                except Exception: g,adv=_empty(),600
+                for i in range(len(sws)): gmaps[i][gn]=g; metss[i][gn]=(adv,0)
+        # dekorasyonlar master outline'larına gömülü → aksan anchor'ları density=0 gövdeden
+        bodies=[None]*len(sws)
+        d=gbs[d0].d
+        if d.do_top or d.do_base or d.do_side:
+            from accents import outline_bounds, BASES
+            bare=[GB({**dna,'stroke_weight':w,'density':0}) for w in sws]
+            bodies=[{} for _ in sws]
+            for c in BASES:
+                if c not in CHARS: continue
+                for i,gb in enumerate(bare):
+                    try: bodies[i][c]=outline_bounds(gb.build_cached(c,CHARS.index(c))[0])
+                    except Exception: pass
+    glyph_memo.flush()
+    doc=DesignSpaceDocument()
+    ax=AxisDescriptor(); ax.name='Weight'; ax.tag='wght'
+    ax.minimum=SW_MIN*7; ax.default=sw0*7; ax.maximum=SW_MAX*7
+    doc.addAxis(ax)
+    for i,w in enumerate(sws):
+        fb=FontBuilder(UPM,isTTF=True); fb.setupGlyphOrder(gnames)
+        cmap_d={32:'space'}; cmap_d.update({ord(c):f'uni{ord(c):04X}' for c in chars})
+        fb.setupCharacterMap(cmap_d)
+        fb.setupGlyf(gmaps[i])
+        _setup_tables(fb, gbs[i], font_name, metss[i], bodies[i])
+        src=SourceDescriptor(); src.font=fb.font; src.name=f'sw{w}'
+        src.location={'Weight':w*7}
+        doc.addSource(src)
+    vf,_,_=varLib.build(doc)
+    art=FontArtifact(vf,{'sw':sw0,'masters':sws,'static':static},preview_chars='')
+    if verbose:
+        print(f"  ✅ v3 VF: {len(art.data)//1024}KB | wght {SW_MIN*7}-{SW_MAX*7} "
+              f"(default {sw0*7}) | {static} sabit glyph")
+    return art
+
+def build_variable(dna:dict, output_path:str, font_name:str="VectrodFont", web=WEB_FORMATS) -> str:
+    """compile_variable + TTF (ve web formatları) diske."""
+    compile_variable(dna,font_name).write(output_path,otf=False,web=web).wait()
     return output_path
 
 
@@ -825,44 +1026,32 @@ def dna_heuristic(prompt:str) -> dict:
         return {"stroke_weight":sw,"decoration":"minimal","density":0.0,"deco_size_mul":1.0,"shapes":[]}
 
 
-def build_from_prompt(prompt:str, font_name:str, output_dir:str, gemini_key:str='') -> tuple:
+def build_from_prompt(prompt:str, font_name:str, output_dir:str, gemini_key:str='',
+                      variable:bool=False, fast:bool=False) -> tuple:
     """
-    Tam pipeline: prompt → DNA → TTF + OTF.
-    Returns (ttf_path, dna, glyph_svgs)   # app.py uyumluluğu için
+    Tam pipeline: prompt → DNA → FontArtifact (TTF + OTF + WOFF2/WOFF, + variable TTF).
+    fast=True: DNA en yakın kafes noktasına oturtulur (artifact_cache.snap) → statik ve variable
+    font ısınmış önbellekten. Returns (artifact, dna) — dosyalar arka planda yazılır, artifact.wait() ile beklenir.
     """
+    from artifact_cache import compiled, compiled_variable, snap
     os.makedirs(output_dir,exist_ok=True)
     dna=None
     if gemini_key: dna=dna_from_gemini(prompt,gemini_key)
     if dna is None:
         dna=dna_heuristic(prompt)
         print(f"[v3] Heuristic: sw={dna['stroke_weight']} deco={dna['decoration']} shapes={dna['shapes']}")
+    if fast:
+        dna=snap(dna)
+        print(f"[v3] Fast: sw={dna['stroke_weight']} deco={dna['decoration']} density={dna['density']}")
     ttf=os.path.join(output_dir,f"{font_name}_Regular.ttf")
-    otf=os.path.join(output_dir,f"{font_name}_Regular.otf")
-    build_font(dna,ttf,font_name)
-    # OTF: TTF kopyası farklı uzantıyla (tüm font viewer'lar okur)
-    try:
-        import shutil; shutil.copy2(ttf, otf)
-        print(f"  ✅ v3 OTF: {os.path.getsize(otf)//1024}KB")
-    except Exception as e:
-        print(f"  [OTF] {e}"); otf=None
-    svgs={}
-    try:
-        from fontTools.ttLib import TTFont
-        from fontTools.pens.svgPathPen import SVGPathPen
-        f=TTFont(ttf); cmap=f.getBestCmap(); gset=f.getGlyphSet()
-        for ch in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789':
-            gn=cmap.get(ord(ch))
-            if not gn: continue
-            try:
-                pen=SVGPathPen(gset); gset[gn].draw(pen)
-                d2=pen.getCommands()
-                if d2: svgs[ch]={'d':d2,'adv':gset[gn].width}
-            except: pass
-        f.close()
-    except Exception as e: print(f"[v3] SVG error: {e}")
-    # Store otf path in dna for app.py to pick up
-    dna['_otf_path'] = otf
-    return ttf, dna, svgs
+    # OTF: TTF baytlarının farklı uzantılı kopyası (tüm font viewer'lar okur)
+    art=compiled(dna,font_name).write(ttf)
+    vf=vf_path_for(ttf)
+    if variable:                   # VF derlenirken statik dosyalar arka planda yazılır
+        try: compiled_variable(dna, font_name).write(vf, otf=False).wait()
+        except Exception as e: print(f"  [VF] Error: {e}")
+    dna['_vf_path'] = vf if variable and os.path.exists(vf) else None
+    return art, dna
 
 
 if __name__=='__main__':
@@ -871,7 +1060,8 @@ if __name__=='__main__':
     name    = sys.argv[2] if len(sys.argv)>2 else 'VectrodV3'
     out_dir = sys.argv[3] if len(sys.argv)>3 else '/tmp/v3_out'
     api_key = os.environ.get('Vectrod AI DNA','') or os.environ.get('GEMINI_API_KEY','')
-    ttf,dna,svgs = build_from_prompt(prompt,name,out_dir,api_key)
+    art,dna = build_from_prompt(prompt,name,out_dir,api_key)
+    paths = art.wait()
     print(f"\nDNA: {json.dumps(dna,indent=2)}")
-    print(f"TTF: {ttf}  ({os.path.getsize(ttf)//1024}KB)")
-    print(f"SVG glyphs: {len(svgs)}")
+    print(f"TTF: {paths['ttf']}  ({len(art.data)//1024}KB)")
+    print(f"SVG glyphs: {len(art.previews)}")
@@ -0,0 +1,136 @@
+"""
+webfonts.py — TTF + WOFF2/WOFF çıktısı (web teslimi ve önizleme için)
+====================================================================
+Tüm motorlar derlenmiş TTFont'u tek noktadan kaydeder:
+
+  save_font(font, 'Foo_Regular.ttf')
+    → {'ttf': 'Foo_Regular.ttf', 'woff2': 'Foo_Regular.woff2', 'woff': 'Foo_Regular.woff'}
+
+TTF bir kez bellekte derlenir; WOFF/WOFF2 aynı baytlardan (tablolar
+yeniden derlenmeden) sarılır. WOFF2 brotli ister — yoksa atlanır.
+"""
+
+import io, os
+
+WEB_FORMATS = ('woff2', 'woff')
+MIME = {'ttf': 'font/ttf', 'otf': 'font/otf', 'woff': 'font/woff', 'woff2': 'font/woff2'}
+CSS_FORMAT = {'ttf': 'truetype', 'otf': 'opentype', 'woff': 'woff', 'woff2': 'woff2'}
+
+
+def woff2_available():
+    try:
+        import brotli  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def web_path(ttf_path, fmt):
+    """Foo_Regular.ttf → Foo_Regular.woff2"""
+    return os.path.splitext(ttf_path)[0] + '.' + fmt
+
+
+def flavor_bytes(ttf_data, fmt):
+    """Derlenmiş TTF baytları → WOFF/WOFF2 baytları."""
+    from fontTools.ttLib import TTFont
+    font = TTFont(io.BytesIO(ttf_data))      # lazy: tablolar ham haliyle kopyalanır
+    font.flavor = fmt
+    buf = io.BytesIO()
+    font.save(buf, reorderTables=False)
+    return buf.getvalue()
+
+
+def save_font(font, ttf_path, web=WEB_FORMATS):
+    """
+    TTFont'u TTF olarak kaydet, istenen web formatlarını yanına yaz.
+    Dönen: {format: path} — üretilemeyen format listede yer almaz.
+    """
+    buf = io.BytesIO()
+    font.save(buf)
+    data = buf.getvalue()
+    os.makedirs(os.path.dirname(os.path.abspath(ttf_path)), exist_ok=True)
+    with open(ttf_path, 'wb') as f:
+        f.write(data)
+    out = {'ttf': ttf_path}
+    for fmt in web or ():
+        if fmt == 'woff2' and not woff2_available():
+            print("      [WOFF2] brotli yok, atlandı")
+            continue
+        try:
+            wp = web_path(ttf_path, fmt)
+            with open(wp, 'wb') as f:
+                f.write(flavor_bytes(data, fmt))
+            out[fmt] = wp
+        except Exception as e:
+            print(f"      [{fmt.upper()}] {e}")
+    return out
+
+
+def preview_font(paths):
+    """Önizleme için en küçük formatı seç → (path, format)."""
+    for fmt in ('woff2', 'woff', 'ttf'):
+        p = paths.get(fmt) if isinstance(paths, dict) else None
+        if p and os.path.exists(p):
+            return p, fmt
+    return None, None
+
+
+def web_paths_for(ttf_path):
+    """Kaydedilmiş bir TTF'in yanındaki mevcut web dosyaları → {format: path}."""
+    out = {'ttf': ttf_path} if ttf_path and os.path.exists(ttf_path) else {}
+    for fmt in WEB_FORMATS:
+        p = web_path(ttf_path or '', fmt)
+        if ttf_path and os.path.exists(p):
+            out[fmt] = p
+    return out
+
+
+# ── GLYPH SVG SPRITE ──────────────────────────────────────────────
+# Önizleme glyph'leri JSON'a gömülmez; tek bir SVG sprite dosyası olarak
+# servis edilir. Her karakter bir <symbol id="uXXXX" data-adv="..">.
+
+def glyph_paths(font, chars):
+    """
+    Fonttan karakter başına {'d': SVG path, 'adv': advance} (font birimleri).
+    font: bellekteki TTFont ya da dosya yolu (composite'ler çözülür).
+    """
+    from fontTools.ttLib import TTFont
+    from fontTools.pens.svgPathPen import SVGPathPen
+    out = {}
+    opened = not isinstance(font, TTFont)
+    if opened:
+        font = TTFont(font, lazy=True)
+    cmap, gset = font.getBestCmap() or {}, font.getGlyphSet()
+    for ch in chars:
+        gn = cmap.get(ord(ch))
+        if not gn:
+            continue
+        try:
+            pen = SVGPathPen(gset)
+            gset[gn].draw(pen)
+            d = pen.getCommands()
+            if d:
+                out[ch] = {'d': d, 'adv': gset[gn].width}
+        except Exception:
+            pass
+    if opened:
+        font.close()
+    return out
+
+
+def glyph_sprite(glyphs, upm=1000):
+    """{ch: {'d','adv'}} → SVG sprite metni."""
+    syms = []
+    for ch, g in glyphs.items():
+        syms.append(f'<symbol id="u{ord(ch):04X}" data-adv="{g["adv"]}" '
+                    f'viewBox="0 0 {g["adv"]} {upm}"><path d="{g["d"]}"/></symbol>')
+    return ('<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+            + ''.join(syms) + '</svg>')
+
+
+def write_sprite(glyphs, ttf_path):
+    """Sprite'ı TTF'in yanına yaz: Foo_Regular.ttf → Foo_Regular-glyphs.svg"""
+    path = os.path.splitext(ttf_path)[0] + '-glyphs.svg'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(glyph_sprite(glyphs))
+    return path